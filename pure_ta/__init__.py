@@ -1,8 +1,28 @@
 """TODO: Add module docstring."""
 from pure_ta._atr_sl import AtrSlResult  # type: ignore # noqa: F401, I001
 from pure_ta._bb import BollingerResult  # type: ignore # noqa: F401
+from pure_ta._bar_aggregator import BarAggregator  # type: ignore # noqa: F401
 from pure_ta._enum_types import AtrSlMaType, StDevOf  # type: ignore # noqa: F401, F403
+from pure_ta._enum_types import TimeFrame  # type: ignore # noqa: F401
+from pure_ta._history_runner import HistoryRunner  # type: ignore # noqa: F401
+from pure_ta._indicator import Indicator  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import AtrColumns  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import BbColumns  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import BollingerColumns  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import EmaColumns  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import MultiSymbolEngine  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import MultiSymbolResult  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import RmaColumns  # type: ignore # noqa: F401
+from pure_ta._multi_symbol import RsiColumns  # type: ignore # noqa: F401
+from pure_ta._multi_time_frame import MultiTimeFrameRunner  # type: ignore # noqa: F401
+from pure_ta._quote_series import QuoteSeries  # type: ignore # noqa: F401
+from pure_ta._quote_series import QuoteView  # type: ignore # noqa: F401
+from pure_ta._sliding_extremum import SlidingMax  # type: ignore # noqa: F401
+from pure_ta._sliding_extremum import SlidingMin  # type: ignore # noqa: F401
+from pure_ta._snapshot import restore  # type: ignore # noqa: F401
+from pure_ta._snapshot import snapshot  # type: ignore # noqa: F401
 from pure_ta._tsi import TsiResult  # type: ignore # noqa: F401
+from pure_ta._types import DecimalQuote  # type: ignore # noqa: F401, F403
 from pure_ta._types import Hlc  # type: ignore # noqa: F401, F403
 from pure_ta._types import PriceData  # type: ignore # noqa: F401, F403
 from pure_ta._types import PriceDataWithVol  # type: ignore # noqa: F401, F403
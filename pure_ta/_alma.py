@@ -1,38 +1,78 @@
 import math
-from collections.abc import Callable
+from array import array
+from functools import lru_cache
 from math import exp
+from operator import mul
 
-from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+
+
+@lru_cache(maxsize=256)
+def _alma_kernel(length: int, offset: float, sigma: float) -> tuple[float, ...]:
+    """Return the normalized gaussian weights for the given parameters.
+
+    The kernel only depends on the parameters, so it is shared by every
+    instance created with the same ones.
+    """
+    m = offset * (length - 1)
+    s = length / sigma
+    weights = [exp(-0.5 * pow((i - m) / s, 2)) for i in range(length)]
+    norm = sum(weights)
+
+    return tuple(w / norm for w in weights)
+
+
+@lru_cache(maxsize=64)
+def _alma_rotations(
+    length: int, offset: float, sigma: float
+) -> tuple[tuple[float, ...], ...]:
+    """Return the kernel rotated for every position of the oldest value.
+
+    Rotation `h` holds the weight of each slot of a ring buffer whose oldest
+    value is in slot `h`, so the window is weighted in place.
+    """
+    kernel = _alma_kernel(length, offset, sigma)
+    return tuple(kernel[-h:] + kernel[:-h] if h else kernel for h in range(length))
 
 
 def get_alma(
     length: int = 20, offset: float = 0.85, sigma: float = 6
-) -> Callable[[float], float]:
-    """Return a function that calculates the Arnaud Legoux Moving Average."""
-    window = CircularBuf(size=length)
-    window_size = length
-    m = offset * (window_size - 1)
-    s = window_size / sigma
+) -> Indicator[float, float]:
+    """Return a function that calculates the Arnaud Legoux Moving Average.
 
-    def alma_function(data: float):
-        nonlocal window, window_size, m, s
+    The window is a ring of doubles weighted by a rotation of the kernel, so
+    an update neither reorders nor copies it.
+    """
+    window = array("d", bytes(8 * length))
+    rotations = _alma_rotations(length, float(offset), float(sigma))
+    # the slot of the next value, which is the oldest once full.
+    head = 0
+    count = 0
 
-        window.put(data)
+    def alma_function(data: float) -> float:
+        nonlocal head, count
+        window[head] = data
+        head = head + 1 if head + 1 < length else 0
 
-        if window.filled_size < length:
-            return math.nan
+        if count < length:
+            count += 1
+            if count < length:
+                return math.nan
 
-        norm = 0.0
-        _sum = 0.0
-        weights = [0.0 for _ in range(window_size)]
-        for i in range(window_size):
-            weights[i] = exp(-0.5 * pow((i - m) / s, 2))
-            norm += weights[i]
+        return sum(map(mul, rotations[head], window))
 
-        buf_values = list(window.ordered_values)
-        for i in range(window_size):
-            _sum += buf_values[i] * weights[i]
+    def alma_preview(data: float) -> float:
+        if count + 1 < length:
+            return math.nan
 
-        return _sum / norm
+        # put the value in the slot it would take, then put the old one back.
+        evicted = window[head]
+        window[head] = data
+        try:
+            return sum(
+                map(mul, rotations[head + 1 if head + 1 < length else 0], window)
+            )
+        finally:
+            window[head] = evicted
 
-    return alma_function
+    return series_indicator(alma_function, warmup=length, preview=alma_preview)
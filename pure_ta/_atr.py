@@ -1,27 +1,39 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from math import isnan, nan
 
+from pure_ta._indicator import Indicator, series_indicator
 from pure_ta._rma import get_rma
 from pure_ta._types import Hlc
 
 
-def get_atr(length: int = 14) -> Callable[[Hlc], float]:
+def get_atr(length: int = 14) -> Indicator[Hlc, float]:
     """Return a function that calculates the ATR (Average True Range)."""
     prev_close = nan
     rma_func = get_rma(length)
 
-    def atr_func(q: Hlc) -> float:
-        nonlocal prev_close
+    def true_range(q: Hlc) -> float:
         high_low = q.high - q.low
         high_close = high_low if isnan(prev_close) else abs(q.high - prev_close)
         low_close = high_low if isnan(prev_close) else abs(q.low - prev_close)
 
-        true_range = max(high_low, high_close, low_close)
+        return max(high_low, high_close, low_close)
+
+    def atr_func(q: Hlc) -> float:
+        nonlocal prev_close
+        value = true_range(q)
         prev_close = q.close
 
-        return rma_func(true_range)
+        return rma_func(value)
+
+    def atr_preview(q: Hlc) -> float:
+        return rma_func.preview(true_range(q))
 
-    return atr_func
+    # the first true range has no previous close.
+    return series_indicator(
+        atr_func,
+        warmup=1 + rma_func.warmup,
+        convergence=rma_func.convergence,
+        preview=atr_preview,
+    )
@@ -1,11 +1,11 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from dataclasses import dataclass
 
 from pure_ta._ema import get_ema
 from pure_ta._enum_types import AtrSlMaType
+from pure_ta._indicator import Indicator, chain_warmup, indicator
 from pure_ta._rma import get_rma
 from pure_ta._sma import get_sma
 from pure_ta._tr import get_tr
@@ -13,7 +13,7 @@ from pure_ta._types import Hlc
 from pure_ta._wma import get_wma
 
 
-def _get_ma_type(length: int, ma_type: AtrSlMaType) -> Callable[[float], float]:  # type: ignore  # noqa: E501
+def _get_ma_type(length: int, ma_type: AtrSlMaType) -> Indicator[float, float]:  # type: ignore  # noqa: E501
     match ma_type:
         case AtrSlMaType.SMA:
             return get_sma(length)
@@ -33,7 +33,7 @@ class AtrSlResult:
 
 def get_atr_sl(
     length: int = 14, ma_type: AtrSlMaType = AtrSlMaType.RMA, multi: float = 1.5
-) -> Callable[[Hlc], AtrSlResult]:
+) -> Indicator[Hlc, AtrSlResult]:
     short_ma = _get_ma_type(length, ma_type)
     long_ma = _get_ma_type(length, ma_type)
     tr = get_tr()  # Assuming `get_tr` is defined elsewhere and returns a callable
@@ -46,4 +46,17 @@ def get_atr_sl(
 
         return AtrSlResult(long_sl, short_sl)
 
-    return atr_sl_func
+    def atr_sl_preview(data: Hlc) -> AtrSlResult:
+        true_range = tr.preview(data)
+
+        long_sl = data.low - long_ma.preview(true_range) * multi
+        short_sl = short_ma.preview(true_range) * multi + data.high
+
+        return AtrSlResult(long_sl, short_sl)
+
+    return indicator(
+        atr_sl_func,
+        warmup=chain_warmup(tr, long_ma),
+        convergence=long_ma.convergence,
+        preview=atr_sl_preview,
+    )
@@ -0,0 +1,150 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Streaming aggregation of quotes into higher time frame bars."""
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from math import nan
+
+from pure_ta._enum_types import TimeFrame
+from pure_ta._types import Quote
+
+_WEEK = timedelta(days=7)
+
+
+def _default_origin(delta: timedelta, time: datetime) -> datetime:
+    # whole weeks start on a monday, everything else at the unix epoch.
+    day = 5 if delta % _WEEK == timedelta(0) else 1
+    return datetime(1970, 1, day, tzinfo=time.tzinfo)
+
+
+class BarAggregator:
+    """Builds higher time frame bars from a stream of quotes in O(1) per quote.
+
+    Every quote is added to the bar of the period its time falls in. A bar is
+    complete once a quote from a later period arrives, `update` then returns
+    it, so completed bars can be fed straight into indicators:
+
+        hourly = BarAggregator(TimeFrame.ONE_HOUR)
+        ema = ta.ema(20)
+        for quote in minute_quotes:
+            bar = hourly.update(quote)
+            if bar is not None:
+                ema(bar.close)
+
+    Bars are `Quote`s timed at the start of their period. Periods are counted
+    from `origin`, which defaults to the unix epoch, or the first monday after
+    it for whole weeks. `TimeFrame.MONTH` uses calendar months.
+
+    Args:
+        time_frame: The time frame of the bars to build.
+        origin: The start of the first period.
+    """
+
+    __slots__ = (
+        "_delta",
+        "_span",
+        "_origin",
+        "_key",
+        "_start",
+        "_open",
+        "_high",
+        "_low",
+        "_close",
+        "_vol",
+        "_count",
+    )
+
+    def __init__(self, time_frame: TimeFrame, origin: datetime | None = None):
+        self._delta = (
+            None if time_frame is TimeFrame.MONTH else time_frame.to_time_delta()
+        )
+        # a lower bound of the period length, so most quotes skip `_period`.
+        self._span = self._delta or timedelta(days=28)
+        self._origin = origin
+        # None while no bar is open, as every int is a valid period key.
+        self._key: int | None = None
+        self._start = datetime.min
+        self._open = nan
+        self._high = nan
+        self._low = nan
+        self._close = nan
+        self._vol = 0.0
+        self._count = 0
+
+    @property
+    def forming(self) -> Quote | None:
+        """The bar of the current period so far, or None before any quote."""
+        if not self._count:
+            return None
+        return Quote(
+            time=self._start,
+            o=self._open,
+            h=self._high,
+            l=self._low,
+            c=self._close,
+            v=self._vol,
+        )
+
+    @property
+    def count(self) -> int:
+        """The number of quotes in the forming bar."""
+        return self._count
+
+    def _period(self, time: datetime) -> tuple[int, datetime]:
+        delta = self._delta
+        if delta is None:
+            key = time.year * 12 + time.month - 1
+            return key, datetime(time.year, time.month, 1, tzinfo=time.tzinfo)
+
+        if self._origin is None:
+            self._origin = _default_origin(delta, time)
+        key = (time - self._origin) // delta
+        return key, self._origin + key * delta
+
+    def update(self, quote: Quote) -> Quote | None:
+        """Add a quote, returning the previous bar if the quote completed it.
+
+        Raises:
+            ValueError: If the quote is older than the forming bar.
+        """
+        time = quote.time
+        if self._count and time < self._start:
+            raise ValueError(f"quote at {time} is older than the forming bar")
+
+        if not self._count or time - self._start >= self._span:
+            key, start = self._period(time)
+            if key != self._key:
+                completed = self.forming
+                self._key = key
+                self._start = start
+                self._open = quote.open
+                self._high = quote.high
+                self._low = quote.low
+                self._close = quote.close
+                self._vol = quote.vol
+                self._count = 1
+                return completed
+
+        high = quote.high
+        low = quote.low
+        if high > self._high:
+            self._high = high
+        if low < self._low:
+            self._low = low
+        self._close = quote.close
+        self._vol += quote.vol
+        self._count += 1
+        return None
+
+    def update_many(self, quotes: Iterable[Quote]) -> list[Quote]:
+        """Add every quote and return the bars they completed."""
+        update = self.update
+        return [bar for bar in map(update, quotes) if bar is not None]
+
+    def flush(self) -> Quote | None:
+        """Complete and return the forming bar, such as at the end of data."""
+        bar = self.forming
+        self._key = None
+        self._count = 0
+        return bar
@@ -1,12 +1,11 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from dataclasses import dataclass
 from math import nan
 
-from pure_ta._sma import get_sma
-from pure_ta._std_dev import get_st_dev
+from pure_ta._indicator import Indicator, indicator
+from pure_ta._rolling_moments import RollingMoments
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,22 +17,24 @@ class BollingerResult:
     lower: float
 
 
-def get_bb(length: int = 20, multi: int = 2) -> Callable[[float], BollingerResult]:
-    counter = 0
-    sma = get_sma(length=length)
-    st_dev = get_st_dev(length=length)
+def get_bb(length: int = 20, multi: int = 2) -> Indicator[float, BollingerResult]:
+    moments = RollingMoments(size=length)
+
+    def bands(avg: float, std: float) -> BollingerResult:
+        return BollingerResult(
+            upper=avg + multi * std, lower=avg - multi * std, middle=avg
+        )
 
     def compute(value: float) -> BollingerResult:
-        nonlocal counter
-        counter += 1
-        avg = sma(value)
-        std = st_dev(value)
+        moments.put(value)
 
-        if counter < length:
+        if not moments.is_full:
             return BollingerResult(upper=nan, lower=nan, middle=nan)
         else:
-            return BollingerResult(
-                upper=avg + multi * std, lower=avg - multi * std, middle=avg
-            )
+            return bands(moments.mean(), moments.st_dev())
+
+    def preview(value: float) -> BollingerResult:
+        # both are NaN until the window is full.
+        return bands(*moments.preview(value))
 
-    return compute
+    return indicator(compute, warmup=length, preview=preview)
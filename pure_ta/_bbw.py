@@ -2,18 +2,22 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from collections.abc import Callable
 from math import nan
 
-from pure_ta._bb import get_bb
+from pure_ta._bb import BollingerResult, get_bb
+from pure_ta._indicator import Indicator, series_indicator
 
 
-def get_bbw(length: int = 5, multi: int = 4) -> Callable[[float], float]:
+def get_bbw(length: int = 5, multi: int = 4) -> Indicator[float, float]:
     get_bb_func = get_bb(length=length, multi=multi)
 
+    def width(bb: BollingerResult) -> float:
+        return (bb.upper - bb.lower) / bb.middle if bb.middle != 0 else nan
+
     def compute(value: float) -> float:
-        bb = get_bb_func(value)
+        return width(get_bb_func(value))
 
-        return (bb.upper - bb.lower) / bb.middle if bb.middle != 0 else nan
+    def preview(value: float) -> float:
+        return width(get_bb_func.preview(value))
 
-    return compute
+    return series_indicator(compute, warmup=get_bb_func.warmup, preview=preview)
@@ -1,14 +1,14 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 
 from pure_ta._bbw import get_bbw
+from pure_ta._indicator import Indicator, chain_warmup, series_indicator
 from pure_ta._percent_rank import get_percent_rank
 
 
-def get_bbwp(length: int = 13) -> Callable[[float], float]:
-    percent_rank = get_percent_rank(length=252)
+def get_bbwp(length: int = 13, rank_length: int = 252) -> Indicator[float, float]:
+    percent_rank = get_percent_rank(length=rank_length)
     bbw = get_bbw(length=length, multi=1)
 
     def compute(data: float) -> float:
@@ -16,4 +16,9 @@ def get_bbwp(length: int = 13) -> Callable[[float], float]:
 
         return percent_rank(bbw_value)
 
-    return compute
+    def preview(data: float) -> float:
+        return percent_rank.preview(bbw.preview(data))
+
+    return series_indicator(
+        compute, warmup=chain_warmup(bbw, percent_rank), preview=preview
+    )
@@ -1,41 +1,52 @@
-"""A circular buffer implementation backed by a deque."""
+"""A circular buffer implementation backed by an array of doubles."""
 import math
-from collections import deque
-from collections.abc import Generator, Iterable
-from typing import Any
+from array import array
+from collections.abc import Iterator
+from itertools import chain
 
 
 class CircularBuf:
-    """A circular buffer."""
+    """A circular buffer.
+
+    Values live in a fixed size `array('d')` with a running head index, so
+    putting a value never allocates and indexed access is O(1).
+    `segments` exposes the contents as zero-copy memoryviews.
+    """
+
+    __slots__ = ("_data", "_view", "_size", "_head", "_count")
 
     def __init__(self, size: int):
-        self._buffer: deque[float] = deque(maxlen=size)
+        self._data = array("d", bytes(8 * size))
+        self._view = memoryview(self._data)
         self._size = size
+        # where the next value is written, which is the oldest once full.
+        self._head = 0
+        self._count = 0
 
     @property
     def filled_size(self) -> int:
         """The number of values in the buffer."""
-        return len(self._buffer)
+        return self._count
 
     @property
-    def values(self) -> Iterable[float]:
-        """The values in the buffer."""
-        return list(self._buffer) if self._buffer else []
+    def values(self) -> list[float]:
+        """A copy of the values in the buffer ordered from oldest to newest."""
+        return list(self.ordered_values)
 
     @property
-    def ordered_values(self) -> Generator[float, Any, None]:
+    def ordered_values(self) -> Iterator[float]:
         """Values in the buffer ordered from oldest to newest."""
-        yield from self._buffer
+        return chain(*self.segments())
 
     @property
     def first(self) -> float:
         """The oldest value in the buffer."""
-        return self._buffer[0] if self.is_full else math.nan
+        return self._data[self._head] if self._count == self._size else math.nan
 
     @property
     def last(self) -> float:
         """The newest value in the buffer."""
-        return self._buffer[-1] if self.is_full else math.nan
+        return self._data[self._head - 1] if self._count == self._size else math.nan
 
     @property
     def length(self) -> int:
@@ -45,8 +56,50 @@ class CircularBuf:
     @property
     def is_full(self) -> bool:
         """Whether the buffer is full."""
-        return len(self._buffer) == self._size
+        return self._count == self._size
+
+    def segments(self) -> tuple[memoryview, memoryview]:
+        """The contents as two zero-copy views, oldest values first.
+
+        The buffer wraps around, so the values are split across at most two
+        contiguous segments. The second one is empty until the buffer is full.
+        """
+        view = self._view
+        if self._count < self._size:
+            return view[: self._count], view[:0]
+        head = self._head
+        return view[head:], view[:head]
+
+    def __getitem__(self, index: int) -> float:
+        """The value at `index`, where 0 is the oldest value in the buffer."""
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("CircularBuf index out of range")
+        if count < self._size:
+            return self._data[index]
+        index += self._head
+        return self._data[index - self._size if index >= self._size else index]
+
+    def __len__(self) -> int:
+        """The number of values in the buffer."""
+        return self._count
+
+    def put(self, value: float) -> float:
+        """Put a value into the buffer.
 
-    def put(self, value: float) -> None:
-        """Put a value into the buffer."""
-        self._buffer.append(value)
+        Returns the value evicted to make room for it, or NaN while the buffer
+        is not yet full.
+        """
+        data = self._data
+        head = self._head
+        if self._count == self._size:
+            evicted = data[head]
+        else:
+            evicted = math.nan
+            self._count += 1
+        data[head] = value
+        head += 1
+        self._head = 0 if head == self._size else head
+        return evicted
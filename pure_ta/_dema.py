@@ -2,21 +2,31 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from collections.abc import Callable
 from math import isnan, nan
 
 from pure_ta._ema import get_ema
+from pure_ta._indicator import Indicator, chain_warmup, series_indicator
 
 
-def get_dema(length: int = 20) -> Callable[[float], float]:
+def get_dema(length: int = 20) -> Indicator[float, float]:
     """Returns a function that calculates the double exponential moving average."""
     ema1 = get_ema(length)
     ema2 = get_ema(length)
 
+    def combine(ema1_val: float, ema2_val: float) -> float:
+        return nan if isnan(ema1_val) or isnan(ema2_val) else 2 * ema1_val - ema2_val
+
     def dema_function(data: float) -> float:
         ema1_val = ema1(data)
-        ema2_val = ema2(ema1_val)
+        return combine(ema1_val, ema2(ema1_val))
 
-        return nan if isnan(ema1_val) or isnan(ema2_val) else 2 * ema1_val - ema2_val
+    def dema_preview(data: float) -> float:
+        ema1_val = ema1.preview(data)
+        return combine(ema1_val, ema2.preview(ema1_val))
 
-    return dema_function
+    return series_indicator(
+        dema_function,
+        warmup=chain_warmup(ema1, ema2),
+        convergence=ema1.convergence + ema2.convergence,
+        preview=dema_preview,
+    )
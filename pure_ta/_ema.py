@@ -1,9 +1,22 @@
-from collections.abc import Callable
+from array import array
+from collections.abc import Iterable
 from math import isnan
 
+from pure_ta._indicator import (
+    Indicator,
+    as_sequence,
+    decay_bars,
+    new_series,
+    series_indicator,
+)
 
-def get_ema(length: int = 20) -> Callable[[float], float]:
-    """Returns a function that calculates the exponential moving average."""
+
+def get_ema(length: int = 20) -> Indicator[float, float]:
+    """Returns a function that calculates the exponential moving average.
+
+    The EMA is seeded with the SMA of the first `length` non NaN values, after
+    which every update is just the recurrence.
+    """
     ema = float("nan")
     alpha = 2 / (length + 1)
     counter = 0
@@ -11,24 +24,60 @@ def get_ema(length: int = 20) -> Callable[[float], float]:
     _sum: float = 0
     sma_calculated = False
 
-    def ema_function(data: float):
+    def ema_function(data: float) -> float:
         nonlocal ema, counter, _sum, sma_calculated
 
-        if not sma_calculated and not isnan(data):
-            counter += 1
-            _sum += data
-
         if isnan(data):
             return data
 
-        if not sma_calculated and counter == length:
-            sma = _sum / length
-            if not isnan(sma):
-                ema = sma
-                sma_calculated = True
-        elif sma_calculated and not isnan(data):
+        if sma_calculated:
             ema = (data - ema) * alpha + ema
+            return ema
+
+        counter += 1
+        _sum += data
+
+        if counter == length:
+            ema = _sum / length
+            sma_calculated = True
 
         return ema
 
-    return ema_function
+    def ema_preview(data: float) -> float:
+        if isnan(data):
+            return data
+        if sma_calculated:
+            return (data - ema) * alpha + ema
+        return (_sum + data) / length if counter + 1 == length else ema
+
+    def ema_many(values: Iterable[float]) -> "array[float]":
+        nonlocal ema
+        values = as_sequence(values)
+        size = len(values)
+        out = new_series(size)
+        i = 0
+
+        while i < size and not sma_calculated:
+            out[i] = ema_function(values[i])
+            i += 1
+
+        # seeded, run the recurrence on locals.
+        value = ema
+        for i in range(i, size):
+            data = values[i]
+            if not isnan(data):
+                value = (data - value) * alpha + value
+                out[i] = value
+            else:
+                out[i] = data
+        ema = value
+
+        return out
+
+    return series_indicator(
+        ema_function,
+        ema_many,
+        warmup=length,
+        convergence=decay_bars(alpha),
+        preview=ema_preview,
+    )
@@ -2,31 +2,51 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from collections.abc import Callable
-from math import nan
+from math import isnan, nan
 
 from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._rolling_sum import RollingSum
 
 
-def get_er(length: int = 10) -> Callable[[float], float]:
-    """Returns a function that calculates the efficiency ratio."""
+def get_er(length: int = 10) -> Indicator[float, float]:
+    """Returns a function that calculates the efficiency ratio.
+
+    The total absolute change is a rolling sum of one step changes, so each
+    update adds the newest change and evicts the oldest in O(1).
+    """
     buf = CircularBuf(size=length + 1)
+    abs_changes = RollingSum(size=length)
+    prev_price = nan
 
     def er(price: float) -> float:
+        nonlocal prev_price
+
+        if buf.filled_size:
+            abs_changes.put(abs(price - prev_price))
         buf.put(price)
+        prev_price = price
 
         if not buf.is_full:
             return nan
+        if abs_changes.has_nan:
+            return nan
+
+        total_abs_change = abs_changes.total
+        net_change = price - buf.first
 
-        total_abs_change = 0.0
-        prev_price = buf.first
+        return (net_change / total_abs_change) * 100 if total_abs_change > 0 else 0.0
 
-        for current_price in list(buf.ordered_values)[1:]:
-            total_abs_change += abs(current_price - prev_price)
-            prev_price = current_price
+    def er_preview(price: float) -> float:
+        if buf.filled_size + 1 < buf.length:
+            return nan
+        total_abs_change = abs_changes.preview_total(abs(price - prev_price))
+        if isnan(total_abs_change):
+            return nan
 
-        net_change = price - buf.first
+        # the oldest price once `price` is put.
+        net_change = price - (buf[1] if buf.is_full else buf[0])
 
-        return (net_change / total_abs_change) * 100 if total_abs_change != 0 else 0.0
+        return (net_change / total_abs_change) * 100 if total_abs_change > 0 else 0.0
 
-    return er
+    return series_indicator(er, warmup=length + 1, preview=er_preview)
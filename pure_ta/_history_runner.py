@@ -0,0 +1,152 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Indicators over an editable bar history, with periodic state checkpoints."""
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
+
+from pure_ta._snapshot import restore, snapshot
+
+
+class HistoryRunner:
+    """Streams an indicator over a history of bars that can be corrected.
+
+    A snapshot of the indicator state is kept every `every` bars, so a
+    correction of a past bar only replays the bars from the checkpoint before
+    it, and the state at any bar is rebuilt from at most `every` bars:
+
+        runner = HistoryRunner(ta.ema, every=256, length=20)
+        runner.extend(closes)
+        runner.correct(1000, 1.2345)  # replays from bar 768
+        ema = runner.state_at(5000)  # an ema that has seen bars 0 to 5000
+
+    Args:
+        factory: A function creating the indicator, such as `ta.ema`.
+        every: The number of bars between checkpoints.
+        **params: The parameters passed to `factory`.
+    """
+
+    __slots__ = ("_create", "_every", "_bars", "_results", "_checkpoints", "_live")
+
+    def __init__(self, factory: Callable[..., Any], every: int = 256, **params: Any):
+        """Create a runner with an empty history."""
+        if every < 1:
+            raise ValueError("every must be at least 1")
+
+        self._create = partial(factory, **params)
+        self._every = every
+        self._bars: list[Any] = []
+        self._results: list[Any] = []
+        self._live = self._create()
+        # the state after the first `i * every` bars.
+        self._checkpoints = [snapshot(self._live)]
+
+    def __len__(self) -> int:
+        """The number of bars in the history."""
+        return len(self._bars)
+
+    @property
+    def bars(self) -> list[Any]:
+        """A copy of the bars in the history."""
+        return list(self._bars)
+
+    @property
+    def results(self) -> list[Any]:
+        """A copy of the result of every bar in the history."""
+        return list(self._results)
+
+    @property
+    def checkpoints(self) -> int:
+        """The number of stored checkpoints."""
+        return len(self._checkpoints)
+
+    def append(self, bar: Any) -> Any:
+        """Add a bar to the end of the history and return its result."""
+        return self.extend((bar,))[0]
+
+    def extend(self, bars: Iterable[Any]) -> list[Any]:
+        """Add bars to the end of the history and return their results.
+
+        If the indicator raises on one of them, none of them are added.
+        """
+        start = len(self._bars)
+        self._run(start, list(bars), self._live)
+        return self._results[start:]
+
+    def correct(self, index: int, bar: Any) -> list[Any]:
+        """Replace the bar at `index` and recompute the results after it.
+
+        The bars since the last checkpoint before `index` are replayed from
+        it, and later checkpoints are taken again. If the indicator raises on
+        one of them, the history is left as it was.
+
+        Returns:
+            The new results from `index` to the end of the history.
+
+        Raises:
+            IndexError: If there is no bar at `index`.
+        """
+        index = self._index(index)
+        kept = index // self._every
+        start = kept * self._every
+        bars = self._bars[start:]
+        bars[index - start] = bar
+
+        self._run(start, bars, restore(self._create(), self._checkpoints[kept]))
+        return self._results[index:]
+
+    def state_at(self, index: int) -> Any:
+        """A new indicator with the state after the bar at `index`.
+
+        It can be streamed or previewed without touching the history.
+
+        Raises:
+            IndexError: If there is no bar at `index`.
+        """
+        return self._state(self._index(index) + 1)
+
+    def _state(self, end: int) -> Any:
+        """A new indicator with the state after the first `end` bars."""
+        checkpoint = end // self._every
+        indicator = restore(self._create(), self._checkpoints[checkpoint])
+        indicator.update_many(self._bars[checkpoint * self._every : end])
+        return indicator
+
+    def _index(self, index: int) -> int:
+        size = len(self._bars)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("HistoryRunner index out of range")
+        return index
+
+    def _run(self, start: int, bars: list[Any], live: Any) -> None:
+        """Stream `bars` into `live` as the history from `start`.
+
+        The bars, their results and the checkpoints they reach replace those
+        from `start` only once every bar is streamed. On an error they are
+        left as they were, and the live indicator is rebuilt if it was used.
+        """
+        every = self._every
+        results: list[Any] = []
+        checkpoints = []
+        stop = start + len(bars)
+        pos = start
+        try:
+            while pos < stop:
+                end = min((pos // every + 1) * every, stop)
+                results.extend(live.update_many(bars[pos - start : end - start]))
+                if end % every == 0:
+                    checkpoints.append(snapshot(live))
+                pos = end
+        except BaseException:
+            if live is self._live:
+                self._live = self._state(start)
+            raise
+
+        self._bars[start:] = bars
+        self._results[start:] = results
+        del self._checkpoints[start // every + 1 :]
+        self._checkpoints += checkpoints
+        self._live = live
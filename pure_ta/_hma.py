@@ -1,13 +1,13 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from math import isnan, nan, sqrt
 
+from pure_ta._indicator import Indicator, chain_warmup, series_indicator
 from pure_ta._wma import get_wma
 
 
-def get_hma(length: int = 16) -> Callable[[float], float]:
+def get_hma(length: int = 16) -> Indicator[float, float]:
     wma_n = get_wma(length=length)
     wma_n_by_2 = get_wma(length=length // 2)
     wma_sqrt_n = get_wma(length=round(sqrt(length)))
@@ -23,4 +23,15 @@ def get_hma(length: int = 16) -> Callable[[float], float]:
 
         return wma_sqrt_n(raw_hma)
 
-    return hma_func
+    def hma_preview(data: float) -> float:
+        wma_n_val = wma_n.preview(data)
+        wma_n_by_2_val = wma_n_by_2.preview(data)
+
+        if isnan(wma_n_val) or isnan(wma_n_by_2_val):
+            return nan
+
+        return wma_sqrt_n.preview(wma_n_by_2_val * 2 - wma_n_val)
+
+    return series_indicator(
+        hma_func, warmup=chain_warmup(wma_n, wma_sqrt_n), preview=hma_preview
+    )
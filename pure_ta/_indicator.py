@@ -0,0 +1,150 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""The callable type returned by the indicator factories."""
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from math import ceil, log, log1p
+from typing import Any, Protocol, TypeVar, cast
+
+from pure_ta._snapshot import checkpoint
+
+T = TypeVar("T")
+R = TypeVar("R")
+In = TypeVar("In", contravariant=True)
+Out = TypeVar("Out", covariant=True)
+
+# recursive indicators converge once the weight of their seed is below this.
+CONVERGENCE_TOLERANCE = 1e-6
+
+
+class Indicator(Protocol[In, Out]):
+    """A streaming indicator.
+
+    Call it with one value per bar to advance its state and get the newest
+    result. `update_many` advances the same state over a whole batch and
+    returns every result, so a history can be batch-warmed and then continued
+    tick by tick. Indicators with float results return an `array('d')`.
+
+    `warmup` is the number of bars until the first result computed only from
+    real inputs, such as `length` for an SMA. Recursive indicators never
+    forget their seed entirely, `convergence` is how many more bars it takes
+    for its weight to fall below `CONVERGENCE_TOLERANCE`, and 0 for the
+    others. `seed` feeds an indicator just the last `warmup + convergence`
+    bars of a history, all it needs to continue from the end of it.
+
+    Calling an indicator commits the bar, `commit` is the same call. `preview`
+    returns the result as if the bar closed with that value, without changing
+    any state, so a forming bar can be previewed on every tick and committed
+    once it closes.
+    """
+
+    warmup: int
+    convergence: int
+
+    def __call__(self, data: In, /) -> Out:
+        ...
+
+    def update_many(self, data: Iterable[In], /) -> Sequence[Out]:
+        ...
+
+    def seed(self, history: Sequence[In], /) -> Sequence[Out]:
+        ...
+
+    def commit(self, data: In, /) -> Out:
+        ...
+
+    def preview(self, data: In, /) -> Out:
+        ...
+
+
+def as_sequence(data: Iterable[T]) -> Sequence[T]:
+    """Return `data` as an indexable sequence, copying only if needed."""
+    return data if isinstance(data, Sequence) else list(data)
+
+
+def new_series(size: int) -> "array[float]":
+    """Return a zeroed `array('d')` with room for `size` results."""
+    return array("d", bytes(8 * size))
+
+
+def decay_bars(alpha: float) -> int:
+    """The bars until a weight shrinking by `1 - alpha` per bar converges."""
+    if alpha >= 1:
+        return 0
+    return ceil(log(CONVERGENCE_TOLERANCE) / log1p(-alpha))
+
+
+def chain_warmup(*parts: Any) -> int:
+    """The warm-up of indicators each fed the results of the one before."""
+    return sum(part.warmup for part in parts) - len(parts) + 1
+
+
+def reverting_preview(update: Callable[[T], R]) -> Callable[[T], R]:
+    """A preview calling `update` and then reverting every change to its state.
+
+    This works for any indicator, but copies its buffers on every call, so
+    it is only the default for indicators without a preview of their own.
+    """
+
+    def preview(data: T) -> R:
+        revert = checkpoint(update)
+        try:
+            return update(data)
+        finally:
+            revert()
+
+    return preview
+
+
+def _attach(
+    fn: Any, update_many: Any, warmup: int, convergence: int, preview: Any
+) -> None:
+    def seed(history: Sequence[Any]) -> Sequence[Any]:
+        size = fn.warmup + fn.convergence
+        return update_many(history[-size:] if size else history[:0])
+
+    fn.update_many = update_many
+    fn.warmup = warmup
+    fn.convergence = convergence
+    fn.seed = seed
+    fn.commit = fn
+    fn.preview = preview or reverting_preview(fn)
+
+
+def series_indicator(
+    update: Callable[[T], float],
+    update_many: Callable[[Iterable[T]], "array[float]"] | None = None,
+    warmup: int = 1,
+    convergence: int = 0,
+    preview: Callable[[T], float] | None = None,
+) -> Indicator[T, float]:
+    """Attach a batch entry point to an indicator with float results.
+
+    Its `warmup` and `convergence` default to those of a stateless function.
+    Without a specialized `update_many`, the batch maps `update` over the data
+    at C level into an `array('d')`. Without a specialized `preview`, previews
+    revert the state after calling `update`.
+    """
+
+    def map_many(data: Iterable[T]) -> "array[float]":
+        return array("d", map(update, data))
+
+    _attach(update, update_many or map_many, warmup, convergence, preview)
+    return cast(Indicator[T, float], update)
+
+
+def indicator(
+    update: Callable[[T], R],
+    update_many: Callable[[Iterable[T]], list[R]] | None = None,
+    warmup: int = 1,
+    convergence: int = 0,
+    preview: Callable[[T], R] | None = None,
+) -> Indicator[T, R]:
+    """Attach a batch entry point to an indicator with structured results."""
+
+    def map_many(data: Iterable[T]) -> list[R]:
+        return list(map(update, data))
+
+    _attach(update, update_many or map_many, warmup, convergence, preview)
+    return cast(Indicator[T, R], update)
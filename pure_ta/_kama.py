@@ -1,13 +1,13 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from math import isnan, nan
 
 from pure_ta._er import get_er
+from pure_ta._indicator import Indicator, decay_bars, series_indicator
 
 
-def get_kama(length: int = 10) -> Callable[[float], float]:
+def get_kama(length: int = 10) -> Indicator[float, float]:
     """Returns a function that calculates the Kaufman's Adaptive Moving Average."""
     er = get_er(length=length)
 
@@ -15,16 +15,29 @@ def get_kama(length: int = 10) -> Callable[[float], float]:
     fast = 2.0 / (2.0 + 1.0)
     slow = 2.0 / (30.0 + 1.0)
 
+    def step(price: float, er_value: float) -> float:
+        er_value = abs(er_value) / 100.0
+        sc = pow(er_value * (fast - slow) + slow, 2)
+
+        return price if kama[0] == 0.0 else kama[0] + sc * (price - kama[0])
+
     def kama_func(price: float) -> float:
         er_value = er(price)
         if isnan(er_value):
             return nan
 
-        er_value = abs(er_value) / 100.0
-        sc = pow(er_value * (fast - slow) + slow, 2)
-
-        kama[0] = price if kama[0] == 0.0 else kama[0] + sc * (price - kama[0])
+        kama[0] = step(price, er_value)
 
         return kama[0]
 
-    return kama_func
+    def kama_preview(price: float) -> float:
+        er_value = er.preview(price)
+        return nan if isnan(er_value) else step(price, er_value)
+
+    # the smoothing constant is at least slow squared.
+    return series_indicator(
+        kama_func,
+        warmup=er.warmup,
+        convergence=decay_bars(slow * slow),
+        preview=kama_preview,
+    )
@@ -1,13 +1,13 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from math import isnan, nan
 
 from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
 
 
-def get_linreg(length: int = 9) -> Callable[[float], float]:
+def get_linreg(length: int = 9) -> Indicator[float, float]:
     buf = CircularBuf(size=length)
     x_sum = 0.0
     y_sum = 0.0
@@ -48,4 +48,29 @@ def get_linreg(length: int = 9) -> Callable[[float], float]:
 
             return slope * x + intercept
 
-    return linreg
+    def linreg_preview(y: float) -> float:
+        if isnan(y) or count < length - 1:
+            return y if isnan(y) else nan
+
+        x = float(count)
+        xs, ys, xxs, xys = x_sum, y_sum, xx_sum, xy_sum
+
+        if buf.is_full:
+            first_y = buf.first
+            first_x = count - length
+            xs -= first_x
+            ys -= first_y
+            xxs -= first_x * first_x
+            xys -= first_x * first_y
+
+        xs += x
+        ys += y
+        xxs += x**2
+        xys += x * y
+
+        slope = (length * xys - xs * ys) / (length * xxs - xs**2)
+        intercept = (ys - slope * xs) / length
+
+        return slope * x + intercept
+
+    return series_indicator(linreg, warmup=length, preview=linreg_preview)
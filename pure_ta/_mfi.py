@@ -2,51 +2,65 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from collections.abc import Callable
 from math import isnan, nan
 
-from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._rolling_sum import RollingSum
 from pure_ta._types import PriceDataWithVol
 
 
-def get_mfi(length: int = 14) -> Callable[[PriceDataWithVol], float]:
-    """Get Money Flow Index (MFI)."""
-    upper_buffer = CircularBuf(size=length)
-    lower_buffer = CircularBuf(size=length)
+def get_mfi(length: int = 14) -> Indicator[PriceDataWithVol, float]:
+    """Get Money Flow Index (MFI).
+
+    The positive and negative money flows are kept as compensated running
+    sums, so each update is O(1).
+    """
+    upper_flow = RollingSum(size=length)
+    lower_flow = RollingSum(size=length)
     prev = nan
 
-    def mfi(data: PriceDataWithVol) -> float:
-        nonlocal prev
+    def flows(data: PriceDataWithVol) -> tuple[float, float]:
         value = data.value
-        vol = data.volume
         change = 0.0 if isnan(prev) else value - prev
-        mf = vol * value  # Raw Money Flow
+        mf = data.volume * value  # Raw Money Flow
 
         if change > 0:
-            upper = mf
-            lower = 0.0
+            return mf, 0.0
         elif change < 0:
-            upper = 0.0
-            lower = mf
+            return 0.0, mf
+        else:
+            return 0.0, 0.0
+
+    def index(upper_sum: float, lower_sum: float) -> float:
+        if lower_sum != 0:
+            mf_ratio = upper_sum / lower_sum
+            return 100 - (100 / (mf_ratio + 1))
         else:
-            upper = 0.0
-            lower = 0.0
+            return 100
 
-        upper_buffer.put(upper)
-        lower_buffer.put(lower)
+    def mfi(data: PriceDataWithVol) -> float:
+        nonlocal prev
+        upper, lower = flows(data)
 
-        prev = value
+        upper_flow.put(upper)
+        lower_flow.put(lower)
 
-        if upper_buffer.is_full and lower_buffer.is_full:
-            upper_sum = sum(upper_buffer.values)
-            lower_sum = sum(lower_buffer.values)
+        prev = data.value
 
-            if lower_sum != 0:
-                mf_ratio = upper_sum / lower_sum
-                return 100 - (100 / (mf_ratio + 1))
-            else:
-                return 100
+        if upper_flow.is_full:
+            if upper_flow.has_nan or lower_flow.has_nan:
+                return nan
+            return index(upper_flow.total, lower_flow.total)
         else:
             return float("nan")
 
-    return mfi
+    def mfi_preview(data: PriceDataWithVol) -> float:
+        upper, lower = flows(data)
+        # both totals are NaN until the windows are full.
+        upper_sum = upper_flow.preview_total(upper)
+        lower_sum = lower_flow.preview_total(lower)
+        if isnan(upper_sum) or isnan(lower_sum):
+            return nan
+        return index(upper_sum, lower_sum)
+
+    return series_indicator(mfi, warmup=length + 1, preview=mfi_preview)
@@ -1,13 +1,13 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 from math import isnan, nan
 
 from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
 
 
-def get_mom(length: int = 20) -> Callable[[float], float]:
+def get_mom(length: int = 20) -> Indicator[float, float]:
     prices = CircularBuf(size=length + 1)
 
     def inner(close: float):
@@ -18,4 +18,12 @@ def get_mom(length: int = 20) -> Callable[[float], float]:
 
         return nan if prices.filled_size < length + 1 else close - prices.first
 
-    return inner
+    def mom_preview(close: float) -> float:
+        if isnan(close):
+            return close
+        if prices.filled_size < length:
+            return nan
+        # the oldest price once `close` is put.
+        return close - (prices[1] if prices.is_full else prices[0])
+
+    return series_indicator(inner, warmup=length + 1, preview=mom_preview)
@@ -0,0 +1,473 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Indicators that advance many instruments at once.
+
+The state of each indicator is kept as columns, one slot per instrument, so
+a single `update` call steps every instrument together. With NumPy installed
+the columns are arrays and every step is a handful of whole-column
+operations. Without it they are `array('d')` columns walked by tight loops.
+
+Every column indicator gives, per instrument, the same results as the
+matching streaming indicator in `pure_ta.ta`.
+"""
+from array import array
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from math import isnan, nan
+from typing import Any
+
+from pure_ta._rolling_moments import RollingMoments
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+Columns = Sequence[float]
+
+
+def _use_numpy(use_numpy: bool | None) -> bool:
+    if use_numpy and np is None:
+        raise ImportError("use_numpy=True requires numpy to be installed")
+    return np is not None if use_numpy is None else use_numpy
+
+
+def _nan_column(size: int, numpy: bool) -> Any:
+    if numpy:
+        return np.full(size, np.nan)
+    return array("d", [nan]) * size
+
+
+def _zero_column(size: int, numpy: bool) -> Any:
+    if numpy:
+        return np.zeros(size)
+    return array("d", bytes(8 * size))
+
+
+def _check_size(values: Columns, size: int) -> None:
+    if len(values) != size:
+        raise ValueError(f"expected {size} values, got {len(values)}")
+
+
+class EmaColumns:
+    """The EMA of many instruments, see `pure_ta.ta.ema`."""
+
+    __slots__ = ("size", "length", "_alpha", "_ema", "_sum", "_count", "_numpy")
+
+    def __init__(self, size: int, length: int = 20, use_numpy: bool | None = None):
+        self._numpy = _use_numpy(use_numpy)
+        self.size = size
+        self.length = length
+        self._alpha = 2 / (length + 1)
+        self._ema = _nan_column(size, self._numpy)
+        self._sum = _zero_column(size, self._numpy)
+        self._count = _zero_column(size, self._numpy)
+
+    def update(self, values: Columns) -> Columns:
+        """Advance every instrument by one value and return the EMAs."""
+        _check_size(values, self.size)
+        if self._numpy:
+            return self._update_numpy(values)
+        return self._update_loop(values)
+
+    def _update_numpy(self, values: Columns) -> Columns:
+        x = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(x)
+        ema = self._ema
+        seeded = ~np.isnan(ema)
+        seeding = valid & ~seeded
+        self._sum += np.where(seeding, x, 0.0)
+        self._count += seeding
+        ema = np.where(valid & seeded, (x - ema) * self._alpha + ema, ema)
+        ema = np.where(
+            seeding & (self._count == self.length), self._sum / self.length, ema
+        )
+        self._ema = ema
+        return np.where(valid, ema, x)
+
+    def _update_loop(self, values: Columns) -> Columns:
+        ema = self._ema
+        sums = self._sum
+        counts = self._count
+        alpha = self._alpha
+        length = self.length
+        out = array("d", values)
+        for i, data in enumerate(values):
+            if isnan(data):
+                continue
+            value = ema[i]
+            if not isnan(value):
+                value = (data - value) * alpha + value
+                ema[i] = value
+            else:
+                sums[i] += data
+                counts[i] += 1
+                if counts[i] == length:
+                    value = sums[i] / length
+                    ema[i] = value
+            out[i] = value
+        return out
+
+
+class RmaColumns:
+    """The RMA of many instruments, see `pure_ta.ta.rma`."""
+
+    __slots__ = (
+        "size",
+        "length",
+        "_alpha",
+        "_rma",
+        "_sum",
+        "_count",
+        "_seeded",
+        "_numpy",
+    )
+
+    def __init__(self, size: int, length: int = 14, use_numpy: bool | None = None):
+        self._numpy = _use_numpy(use_numpy)
+        self.size = size
+        self.length = length
+        self._alpha = 1.0 / length
+        self._rma = _nan_column(size, self._numpy)
+        self._sum = _zero_column(size, self._numpy)
+        self._count = _zero_column(size, self._numpy)
+        self._seeded = np.zeros(size, dtype=bool) if self._numpy else bytearray(size)
+
+    def update(self, values: Columns) -> Columns:
+        """Advance every instrument by one value and return the RMAs."""
+        _check_size(values, self.size)
+        if self._numpy:
+            return self._update_numpy(values)
+        return self._update_loop(values)
+
+    def _update_numpy(self, values: Columns) -> Columns:
+        x = np.asarray(values, dtype=np.float64)
+        alpha = self._alpha
+        rma = self._rma
+        seeded = self._seeded
+        # the seed needs `length` consecutive values
+        reset = np.isnan(x) & ~seeded
+        seeding = ~np.isnan(x) & ~seeded
+        self._sum = np.where(reset, 0.0, self._sum + np.where(seeding, x, 0.0))
+        self._count = np.where(reset, 0.0, self._count + seeding)
+        rma = np.where(seeded, alpha * x + (1 - alpha) * rma, rma)
+        newly = seeding & (self._count == self.length)
+        rma = np.where(newly, self._sum / self.length, rma)
+        self._rma = rma
+        self._seeded = seeded | newly
+        return rma.copy()
+
+    def _update_loop(self, values: Columns) -> Columns:
+        rma = self._rma
+        sums = self._sum
+        counts = self._count
+        seeded = self._seeded
+        alpha = self._alpha
+        length = self.length
+        for i, data in enumerate(values):
+            if seeded[i]:
+                rma[i] = alpha * data + (1 - alpha) * rma[i]
+            elif isnan(data):
+                sums[i] = 0.0
+                counts[i] = 0
+            else:
+                sums[i] += data
+                counts[i] += 1
+                if counts[i] == length:
+                    rma[i] = sums[i] / length
+                    seeded[i] = 1
+        return array("d", rma)
+
+
+class RsiColumns:
+    """The RSI of many instruments, see `pure_ta.ta.rsi`."""
+
+    __slots__ = ("size", "length", "_last", "_gain", "_loss", "_count", "_numpy")
+
+    def __init__(self, size: int, length: int = 14, use_numpy: bool | None = None):
+        self._numpy = _use_numpy(use_numpy)
+        self.size = size
+        self.length = length
+        self._last = _nan_column(size, self._numpy)
+        self._gain = _zero_column(size, self._numpy)
+        self._loss = _zero_column(size, self._numpy)
+        # every instrument advances together, so one count serves them all.
+        self._count = 0
+
+    def update(self, values: Columns) -> Columns:
+        """Advance every instrument by one value and return the RSIs."""
+        _check_size(values, self.size)
+        if self._numpy:
+            return self._update_numpy(values)
+        return self._update_loop(values)
+
+    def _update_numpy(self, values: Columns) -> Columns:
+        x = np.asarray(values, dtype=np.float64)
+        length = self.length
+        count = self._count
+        change = x - self._last
+        gain = np.where(change > 0, change, 0.0)
+        loss = np.where(-change > 0, -change, 0.0)
+
+        if count < length:
+            self._gain = ((self._gain * count) + gain) / (count + 1)
+            self._loss = ((self._loss * count) + loss) / (count + 1)
+        else:
+            self._gain = ((self._gain * (length - 1)) + gain) / length
+            self._loss = ((self._loss * (length - 1)) + loss) / length
+
+        self._count += 1
+        self._last = x.copy()
+
+        if self._count < length:
+            return np.full(self.size, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = np.where(self._loss != 0, self._gain / self._loss, np.nan)
+        return 100 - (100 / (rs + 1))
+
+    def _update_loop(self, values: Columns) -> Columns:
+        length = self.length
+        count = self._count
+        last = self._last
+        gains = self._gain
+        losses = self._loss
+        seeding = count < length
+        out = _nan_column(self.size, False)
+
+        for i, value in enumerate(values):
+            gain = 0.0
+            loss = 0.0
+            prev = last[i]
+            if not isnan(prev):
+                change = value - prev
+                gain = max(0, change)
+                loss = max(0, -change)
+
+            if seeding:
+                avg_gain = ((gains[i] * count) + gain) / (count + 1)
+                avg_loss = ((losses[i] * count) + loss) / (count + 1)
+            else:
+                avg_gain = ((gains[i] * (length - 1)) + gain) / length
+                avg_loss = ((losses[i] * (length - 1)) + loss) / length
+            gains[i] = avg_gain
+            losses[i] = avg_loss
+            last[i] = value
+
+            if count + 1 >= length and avg_loss != 0:
+                out[i] = 100 - (100 / (avg_gain / avg_loss + 1))
+
+        self._count += 1
+        return out
+
+
+class AtrColumns:
+    """The ATR of many instruments, see `pure_ta.ta.atr`."""
+
+    __slots__ = ("size", "length", "_prev_close", "_rma", "_numpy")
+
+    def __init__(self, size: int, length: int = 14, use_numpy: bool | None = None):
+        self._numpy = _use_numpy(use_numpy)
+        self.size = size
+        self.length = length
+        self._prev_close = _nan_column(size, self._numpy)
+        self._rma = RmaColumns(size, length, use_numpy=self._numpy)
+
+    def update(self, highs: Columns, lows: Columns, closes: Columns) -> Columns:
+        """Advance every instrument by one bar and return the ATRs."""
+        _check_size(highs, self.size)
+        _check_size(lows, self.size)
+        _check_size(closes, self.size)
+        if self._numpy:
+            true_range = self._true_range_numpy(highs, lows, closes)
+        else:
+            true_range = self._true_range_loop(highs, lows, closes)
+        return self._rma.update(true_range)
+
+    def _true_range_numpy(self, highs: Columns, lows: Columns, closes: Columns) -> Any:
+        high = np.asarray(highs, dtype=np.float64)
+        low = np.asarray(lows, dtype=np.float64)
+        prev = self._prev_close
+        high_low = high - low
+        first = np.isnan(prev)
+        high_close = np.where(first, high_low, np.abs(high - prev))
+        low_close = np.where(first, high_low, np.abs(low - prev))
+        # same NaN handling as the builtin max.
+        true_range = np.where(high_close > high_low, high_close, high_low)
+        true_range = np.where(low_close > true_range, low_close, true_range)
+        self._prev_close = np.array(closes, dtype=np.float64)
+        return true_range
+
+    def _true_range_loop(
+        self, highs: Columns, lows: Columns, closes: Columns
+    ) -> Columns:
+        prev_close = self._prev_close
+        true_range = _zero_column(self.size, False)
+        for i in range(self.size):
+            high = highs[i]
+            low = lows[i]
+            prev = prev_close[i]
+            high_low = high - low
+            high_close = high_low if isnan(prev) else abs(high - prev)
+            low_close = high_low if isnan(prev) else abs(low - prev)
+            true_range[i] = max(high_low, high_close, low_close)
+            prev_close[i] = closes[i]
+        return true_range
+
+
+@dataclass(frozen=True, slots=True)
+class BollingerColumns:
+    """Bollinger Bands of many instruments."""
+
+    upper: Columns
+    middle: Columns
+    lower: Columns
+
+
+class BbColumns:
+    """The Bollinger Bands of many instruments, see `pure_ta.ta.bb`.
+
+    With NumPy the windows are one (instruments, length) ring and the bands
+    are taken over its rows. Without it each instrument keeps its own
+    `RollingMoments`.
+    """
+
+    __slots__ = ("size", "length", "multi", "_window", "_pos", "_filled", "_moments")
+
+    def __init__(
+        self,
+        size: int,
+        length: int = 20,
+        multi: int = 2,
+        use_numpy: bool | None = None,
+    ):
+        self.size = size
+        self.length = length
+        self.multi = multi
+        self._pos = 0
+        self._filled = 0
+        if _use_numpy(use_numpy):
+            self._window = np.zeros((size, length))
+            self._moments = None
+        else:
+            self._window = None
+            self._moments = [RollingMoments(size=length) for _ in range(size)]
+
+    def update(self, values: Columns) -> BollingerColumns:
+        """Advance every instrument by one value and return the bands."""
+        _check_size(values, self.size)
+        if self._moments is None:
+            return self._update_numpy(values)
+        return self._update_loop(values)
+
+    def _update_numpy(self, values: Columns) -> BollingerColumns:
+        window = self._window
+        window[:, self._pos] = values
+        self._pos = (self._pos + 1) % self.length
+        self._filled = min(self._filled + 1, self.length)
+
+        if self._filled < self.length:
+            empty = np.full(self.size, np.nan)
+            return BollingerColumns(upper=empty, middle=empty, lower=empty)
+        middle = window.mean(axis=1)
+        width = self.multi * window.std(axis=1)
+        return BollingerColumns(
+            upper=middle + width, middle=middle, lower=middle - width
+        )
+
+    def _update_loop(self, values: Columns) -> BollingerColumns:
+        upper = _nan_column(self.size, False)
+        middle = _nan_column(self.size, False)
+        lower = _nan_column(self.size, False)
+        multi = self.multi
+
+        for i, moments in enumerate(self._moments):
+            moments.put(values[i])
+            if moments.is_full:
+                avg = moments.mean()
+                std = moments.st_dev()
+                upper[i] = avg + multi * std
+                middle[i] = avg
+                lower[i] = avg - multi * std
+        return BollingerColumns(upper=upper, middle=middle, lower=lower)
+
+
+@dataclass(frozen=True, slots=True)
+class MultiSymbolResult:
+    """The indicator columns of one `MultiSymbolEngine` update.
+
+    Every column is in the order of `MultiSymbolEngine.symbols`.
+    """
+
+    ema: Columns
+    rsi: Columns
+    atr: Columns
+    bb: BollingerColumns
+
+
+class MultiSymbolEngine:
+    """Stream EMA, RSI, ATR and Bollinger Bands for many instruments.
+
+    Each update takes one bar per instrument and advances every indicator
+    across all of them at once.
+
+    Args:
+        symbols: The instruments, fixing the order of every column.
+        use_numpy: Force the NumPy (True) or the pure Python (False) columns.
+            By default NumPy is used when it is installed.
+    """
+
+    __slots__ = ("symbols", "_index", "_ema", "_rsi", "_atr", "_bb")
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        ema_length: int = 20,
+        rsi_length: int = 14,
+        atr_length: int = 14,
+        bb_length: int = 20,
+        bb_multi: int = 2,
+        use_numpy: bool | None = None,
+    ):
+        numpy = _use_numpy(use_numpy)
+        size = len(symbols)
+        self.symbols = tuple(symbols)
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        if len(self._index) != size:
+            raise ValueError("symbols must be unique")
+        self._ema = EmaColumns(size, ema_length, use_numpy=numpy)
+        self._rsi = RsiColumns(size, rsi_length, use_numpy=numpy)
+        self._atr = AtrColumns(size, atr_length, use_numpy=numpy)
+        self._bb = BbColumns(size, bb_length, bb_multi, use_numpy=numpy)
+
+    def index(self, symbol: str) -> int:
+        """The position of `symbol` in every column."""
+        return self._index[symbol]
+
+    def _column(self, data: Columns | Mapping[str, float]) -> Columns:
+        if isinstance(data, Mapping):
+            return [data.get(symbol, nan) for symbol in self.symbols]
+        return data
+
+    def update(
+        self,
+        closes: Columns | Mapping[str, float],
+        highs: Columns | Mapping[str, float] | None = None,
+        lows: Columns | Mapping[str, float] | None = None,
+    ) -> MultiSymbolResult:
+        """Advance every instrument by one bar.
+
+        Each argument is either a sequence in the order of `symbols`, or a
+        mapping from symbol to value where missing symbols are taken as NaN.
+        Without highs and lows the ATR is computed from the closes alone.
+        """
+        close = self._column(closes)
+        high = close if highs is None else self._column(highs)
+        low = close if lows is None else self._column(lows)
+
+        return MultiSymbolResult(
+            ema=self._ema.update(close),
+            rsi=self._rsi.update(close),
+            atr=self._atr.update(high, low, close),
+            bb=self._bb.update(close),
+        )
@@ -0,0 +1,121 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Indicators on several time frames of one quote stream."""
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any
+
+from pure_ta._bar_aggregator import BarAggregator
+from pure_ta._enum_types import TimeFrame
+from pure_ta._types import Quote
+
+
+class _Subscription:
+    __slots__ = ("name", "indicator", "source")
+
+    def __init__(self, name: str, indicator: Any, source: Callable[[Quote], Any]):
+        self.name = name
+        self.indicator = indicator
+        self.source = source
+
+
+class _Frame:
+    __slots__ = ("aggregator", "subscriptions")
+
+    def __init__(self, aggregator: BarAggregator | None):
+        self.aggregator = aggregator
+        self.subscriptions: list[_Subscription] = []
+
+
+class MultiTimeFrameRunner:
+    """Streams indicators on several time frames from one base quote stream.
+
+    Quotes are aggregated once per time frame, and the indicators of a time
+    frame only advance when one of its bars closes:
+
+        runner = MultiTimeFrameRunner()
+        runner.subscribe("rsi_1m", None, ta.rsi)
+        runner.subscribe("rsi_1h", TimeFrame.ONE_HOUR, ta.rsi)
+        runner.subscribe("atr_1h", TimeFrame.ONE_HOUR, ta.atr, source="hlc")
+        for quote in minute_quotes:
+            closed = runner.update(quote)  # rsi_1m, plus the hourly results
+            intrabar = runner.preview()  # hourly results if the hour ended now
+
+    A time frame subscribed after quotes were streamed starts with a partial
+    bar.
+    """
+
+    __slots__ = ("_frames", "_values")
+
+    def __init__(self) -> None:
+        """Create a runner with no subscriptions."""
+        self._frames: dict[TimeFrame | None, _Frame] = {}
+        self._values: dict[str, Any] = {}
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """The latest result of every subscription that has produced one."""
+        return dict(self._values)
+
+    def subscribe(
+        self,
+        name: str,
+        time_frame: TimeFrame | None,
+        factory: Callable[..., Any],
+        source: str | Callable[[Quote], Any] = "close",
+        **params: Any,
+    ) -> None:
+        """Stream `factory(**params)` on the bars of `time_frame`.
+
+        Args:
+            name: The key of the results in `update` and `preview`.
+            time_frame: The time frame of the bars, or None for the quotes
+                themselves.
+            factory: A function creating the indicator, such as `ta.rsi`.
+            source: The attribute of each bar fed to the indicator, or a
+                function of the bar.
+            **params: The parameters passed to `factory`.
+        """
+        if any(
+            sub.name == name for f in self._frames.values() for sub in f.subscriptions
+        ):
+            raise ValueError(f"{name} is already subscribed")
+
+        frame = self._frames.get(time_frame)
+        if frame is None:
+            aggregator = None if time_frame is None else BarAggregator(time_frame)
+            frame = self._frames[time_frame] = _Frame(aggregator)
+
+        read = attrgetter(source) if isinstance(source, str) else source
+        frame.subscriptions.append(_Subscription(name, factory(**params), read))
+
+    def update(self, quote: Quote) -> dict[str, Any]:
+        """Add a base quote and return the results of every bar it closed."""
+        results = {}
+        for frame in self._frames.values():
+            aggregator = frame.aggregator
+            bar = quote if aggregator is None else aggregator.update(quote)
+            if bar is None:
+                continue
+            for sub in frame.subscriptions:
+                results[sub.name] = sub.indicator(sub.source(bar))
+
+        self._values.update(results)
+        return results
+
+    def preview(self) -> dict[str, Any]:
+        """The results each time frame would give if its forming bar closed now.
+
+        The indicators are not advanced.
+        """
+        results = {}
+        for frame in self._frames.values():
+            if frame.aggregator is None:
+                continue
+            bar = frame.aggregator.forming
+            if bar is None:
+                continue
+            for sub in frame.subscriptions:
+                results[sub.name] = sub.indicator.preview(sub.source(bar))
+        return results
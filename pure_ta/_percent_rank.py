@@ -2,26 +2,27 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 import math
-from collections.abc import Callable
 
-from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._sorted_window import SortedWindow
 
 
-def get_percent_rank(length: int = 20) -> Callable[[float], float]:
-    buf = CircularBuf(size=length)
+def get_percent_rank(length: int = 20) -> Indicator[float, float]:
+    window = SortedWindow(size=length)
 
     def compute(data: float) -> float:
-        count = 0
         percent_rank = math.nan
 
-        if buf.is_full:
-            for value in buf.ordered_values:
-                if value <= data:
-                    count += 1
-            percent_rank = (count * 100.0) / length
+        if window.is_full:
+            percent_rank = (window.count_le(data) * 100.0) / length
 
-        buf.put(data)
+        window.put(data)
 
         return percent_rank
 
-    return compute
+    def preview(data: float) -> float:
+        if not window.is_full:
+            return math.nan
+        return (window.count_le(data) * 100.0) / length
+
+    return series_indicator(compute, warmup=length + 1, preview=preview)
@@ -3,9 +3,9 @@
 # license that can be found in the LICENSE file.
 
 
-from collections.abc import Callable
 from dataclasses import dataclass
 
+from pure_ta._indicator import Indicator, indicator
 from pure_ta._linreg import get_linreg
 from pure_ta._mfi import get_mfi
 from pure_ta._rsi import get_rsi
@@ -25,31 +25,58 @@ class PhoenixResult:
     lsma: float
 
 
-def get_phx() -> Callable[[Quote], PhoenixResult]:
+def get_phx() -> Indicator[Quote, PhoenixResult]:
     get_rsi_ = get_rsi(length=3)
     get_mfi_ = get_mfi(length=3)
-    get_tsi_ = get_tsi(length=9, smooth_len=6)
+    # only the TSI line is used, so its signal EMA is a pass through.
+    get_tsi_ = get_tsi(length=9, smooth_len=6, signal_len=1)
     get_sma_ = get_sma(length=6)
     get_willy_ = get_willy(length=6)
     get_tci_ = get_tci(length=9)
     get_linreg_ = get_linreg(length=32)
 
-    def phx_fn(quote: Quote):
-        hlc3 = quote.hlc3
-        tci = get_tci_(hlc3)
-        mfi = get_mfi_(quote.hlc3_with_vol)
-        willy = get_willy_(hlc3)
-        rsi = get_rsi_(hlc3)
-        tsi = get_tsi_(quote.open).tsi / 100
-
-        csi = (rsi + (tsi * 50 + 50)) / 2
+    def fast_line(
+        tci: float, mfi: float, willy: float, rsi: float, tsi: float
+    ) -> float:
+        csi = (rsi + (tsi / 100 * 50 + 50)) / 2
         phx = (tci + csi + mfi + willy) / 4
         trad = (tci + mfi + rsi) / 3
-        fast = (phx + trad) / 2
+        return (phx + trad) / 2
+
+    def phx_fn(quote: Quote):
+        hlc3 = quote.hlc3
+        fast = fast_line(
+            get_tci_(hlc3),
+            get_mfi_(quote.hlc3_with_vol),
+            get_willy_(hlc3),
+            get_rsi_(hlc3),
+            get_tsi_(quote.open).tsi,
+        )
 
         slow = get_sma_(fast)
         lsma = get_linreg_(fast)
 
         return PhoenixResult(fast=fast, slow=slow, lsma=lsma)
 
-    return phx_fn
+    def phx_preview(quote: Quote) -> PhoenixResult:
+        hlc3 = quote.hlc3
+        fast = fast_line(
+            get_tci_.preview(hlc3),
+            get_mfi_.preview(quote.hlc3_with_vol),
+            get_willy_.preview(hlc3),
+            get_rsi_.preview(hlc3),
+            get_tsi_.preview(quote.open).tsi,
+        )
+
+        return PhoenixResult(
+            fast=fast, slow=get_sma_.preview(fast), lsma=get_linreg_.preview(fast)
+        )
+
+    fast_parts = (get_tci_, get_mfi_, get_willy_, get_rsi_, get_tsi_)
+    fast_warmup = max(part.warmup for part in fast_parts)
+    return indicator(
+        phx_fn,
+        warmup=fast_warmup + max(get_sma_.warmup, get_linreg_.warmup) - 1,
+        convergence=max(part.convergence for part in fast_parts),
+        preview=phx_preview,
+    )
@@ -0,0 +1,287 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""A columnar container for a history of quotes."""
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Self, overload
+
+from pure_ta._enum_types import CandlePart
+from pure_ta._types import Quote, _QuoteParts
+
+_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(time: datetime) -> int:
+    """Microseconds since the epoch, in UTC for aware times."""
+    if time.utcoffset() is None:
+        return (time - _EPOCH) // _MICROSECOND
+    return (time - _UTC_EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int, zone: tzinfo | None) -> datetime:
+    if zone is None:
+        return _EPOCH + micros * _MICROSECOND
+    return (_UTC_EPOCH + micros * _MICROSECOND).astimezone(zone)
+
+
+def _avg2(a: float, b: float) -> float:
+    return (a + b) / 2
+
+
+def _avg3(a: float, b: float, c: float) -> float:
+    return (a + b + c) / 3
+
+
+def _avg4(a: float, b: float, c: float, d: float) -> float:
+    return (a + b + c + d) / 4
+
+
+class QuoteView(_QuoteParts):
+    """A lightweight view of one bar in a `QuoteSeries`.
+
+    Prices are read from the series columns on access, nothing is copied.
+    """
+
+    __slots__ = ("_series", "_index")
+
+    def __init__(self, series: "QuoteSeries", index: int):
+        self._series = series
+        self._index = index
+
+    @property
+    def time(self) -> datetime:
+        """Time of the quote."""
+        series = self._series
+        zone = series._zones[series._zone[self._index]]
+        return _from_micros(series._time[self._index], zone)
+
+    @property
+    def time_stamp(self) -> str:
+        """The time of the quote in ISO 8601 format."""
+        return self.time.isoformat()
+
+    @property
+    def open(self) -> float:
+        """Open price of the quote."""
+        return self._series._open[self._index]
+
+    @property
+    def high(self) -> float:
+        """High price of the quote."""
+        return self._series._high[self._index]
+
+    @property
+    def low(self) -> float:
+        """Low price of the quote."""
+        return self._series._low[self._index]
+
+    @property
+    def close(self) -> float:
+        """Close price of the quote."""
+        return self._series._close[self._index]
+
+    @property
+    def vol(self) -> float:
+        """Volume of the quote."""
+        return self._series._vol[self._index]
+
+    def to_quote(self) -> Quote:
+        """Copy the bar into a standalone `Quote`."""
+        return Quote(
+            time=self.time,
+            o=self.open,
+            h=self.high,
+            l=self.low,
+            c=self.close,
+            v=self.vol,
+        )
+
+    def __repr__(self) -> str:
+        return f"QuoteView(time={self.time!r}, close={self.close!r})"
+
+
+class QuoteSeries:
+    """A history of quotes stored as columns.
+
+    Open, high, low, close and volume are `array('d')` columns and the times
+    are an `array('q')` of epoch microseconds, which is far smaller than one
+    `Quote` object per bar. Aware times are stored in UTC along with the index
+    of their time zone, so every bar reads back the exact time it was given.
+    Slicing returns a series that shares the same columns and indexing returns
+    a `QuoteView`, neither copies any data.
+
+    Column properties return memoryviews into the arrays. While one of them is
+    alive the series can not grow, so release them before calling `append`.
+    """
+
+    __slots__ = (
+        "_time",
+        "_zone",
+        "_zones",
+        "_open",
+        "_high",
+        "_low",
+        "_close",
+        "_vol",
+        "_start",
+        "_stop",
+    )
+
+    def __init__(self) -> None:
+        self._time = array("q")
+        self._zone = array("H")
+        # the distinct time zones of the bars, None for naive times.
+        self._zones: list[tzinfo | None] = []
+        self._open = array("d")
+        self._high = array("d")
+        self._low = array("d")
+        self._close = array("d")
+        self._vol = array("d")
+        self._start = 0
+        self._stop = 0
+
+    @classmethod
+    def from_quotes(cls, quotes: Iterable[Quote | QuoteView]) -> Self:
+        """Create a series from quotes, oldest first."""
+        series = cls()
+        for quote in quotes:
+            series.append(
+                quote.time,
+                quote.open,
+                quote.high,
+                quote.low,
+                quote.close,
+                quote.vol,
+            )
+        return series
+
+    def append(
+        self,
+        time: datetime,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """Append a bar to the end of the series."""
+        if self._start != 0 or self._stop != len(self._time):
+            raise ValueError("Cannot append to a slice of a QuoteSeries")
+        zone = time.tzinfo if time.utcoffset() is not None else None
+        try:
+            index = self._zones.index(zone)
+        except ValueError:
+            index = len(self._zones)
+            self._zones.append(zone)
+        self._time.append(_to_micros(time))
+        self._zone.append(index)
+        self._open.append(open_)
+        self._high.append(high)
+        self._low.append(low)
+        self._close.append(close)
+        self._vol.append(volume)
+        self._stop += 1
+
+    def _column(self, column: array) -> memoryview:  # type: ignore[type-arg]
+        return memoryview(column)[self._start : self._stop]
+
+    @property
+    def time(self) -> memoryview:
+        """The epoch microsecond of every bar, in UTC for aware times."""
+        return self._column(self._time)
+
+    @property
+    def open(self) -> memoryview:
+        """The open price of every bar."""
+        return self._column(self._open)
+
+    @property
+    def high(self) -> memoryview:
+        """The high price of every bar."""
+        return self._column(self._high)
+
+    @property
+    def low(self) -> memoryview:
+        """The low price of every bar."""
+        return self._column(self._low)
+
+    @property
+    def close(self) -> memoryview:
+        """The close price of every bar."""
+        return self._column(self._close)
+
+    @property
+    def vol(self) -> memoryview:
+        """The volume of every bar."""
+        return self._column(self._vol)
+
+    def candle_part(self, candle_part: CandlePart) -> array:  # type: ignore[type-arg]
+        """Compute one candle part for every bar into a new array."""
+        match candle_part:
+            case CandlePart.OPEN:
+                return array("d", self.open)
+            case CandlePart.HIGH:
+                return array("d", self.high)
+            case CandlePart.LOW:
+                return array("d", self.low)
+            case CandlePart.CLOSE:
+                return array("d", self.close)
+            case CandlePart.VOLUME:
+                return array("d", self.vol)
+            case CandlePart.HL2:
+                return array("d", map(_avg2, self.high, self.low))
+            case CandlePart.HLC3:
+                return array("d", map(_avg3, self.high, self.low, self.close))
+            case CandlePart.OC2:
+                return array("d", map(_avg2, self.open, self.close))
+            case CandlePart.OHL3:
+                return array("d", map(_avg3, self.open, self.high, self.low))
+            case CandlePart.OHLC4:
+                return array(
+                    "d", map(_avg4, self.open, self.high, self.low, self.close)
+                )
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> QuoteView:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self:
+        ...
+
+    def __getitem__(self, index: int | slice) -> QuoteView | Self:
+        """A view of one bar, or a series sharing the columns for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("QuoteSeries slices must be contiguous")
+            series = self.__class__.__new__(self.__class__)
+            series._time = self._time
+            series._zone = self._zone
+            series._zones = self._zones
+            series._open = self._open
+            series._high = self._high
+            series._low = self._low
+            series._close = self._close
+            series._vol = self._vol
+            series._start = self._start + start
+            series._stop = self._start + max(start, stop)
+            return series
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("QuoteSeries index out of range")
+        return QuoteView(self, self._start + index)
+
+    def __iter__(self) -> Iterator[QuoteView]:
+        for index in range(self._start, self._stop):
+            yield QuoteView(self, index)
@@ -1,30 +1,82 @@
 import math
-from collections.abc import Callable
+from array import array
+from collections.abc import Iterable
 
-from pure_ta._sma import get_sma
+from pure_ta._indicator import (
+    Indicator,
+    as_sequence,
+    decay_bars,
+    new_series,
+    series_indicator,
+)
 
 
-def get_rma(length: int = 14) -> Callable[[float], float]:
-    """Return a function that calculates the RMA (Relative Moving Average)."""
+def get_rma(length: int = 14) -> Indicator[float, float]:
+    """Return a function that calculates the RMA (Relative Moving Average).
+
+    The RMA is seeded with the SMA of the first `length` values. Seeding only
+    needs a running sum and a count, and once seeded every update is just the
+    recurrence.
+    """
     alpha = 1.0 / length
     sum_ = math.nan
-    sma_func = get_sma(length)
+    seed_sum = 0.0
+    seed_count = 0
     is_initial_sma_calculated = False
 
     def rma_func(data: float) -> float:
-        nonlocal sum_, is_initial_sma_calculated
-        sma = sma_func(data)
-        if not is_initial_sma_calculated:
-            # Try to calculate initial SMA
-            if not math.isnan(sma):
-                # If SMA calculation returned a number,
-                # initial SMA is calculated
-                sum_ = sma
-                is_initial_sma_calculated = True
-        else:
+        nonlocal sum_, seed_sum, seed_count, is_initial_sma_calculated
+        if is_initial_sma_calculated:
             # Apply RMA calculation
             sum_ = alpha * data + (1 - alpha) * sum_
+            return sum_
+
+        if math.isnan(data):
+            # the seed needs `length` consecutive values
+            seed_sum = 0.0
+            seed_count = 0
+            return sum_
+
+        seed_sum += data
+        seed_count += 1
+        if seed_count == length:
+            sum_ = seed_sum / length
+            is_initial_sma_calculated = True
+
+        return sum_
 
+    def rma_preview(data: float) -> float:
+        if is_initial_sma_calculated:
+            return alpha * data + (1 - alpha) * sum_
+        if not math.isnan(data) and seed_count + 1 == length:
+            return (seed_sum + data) / length
         return sum_
 
-    return rma_func
+    def rma_many(values: Iterable[float]) -> "array[float]":
+        nonlocal sum_
+        values = as_sequence(values)
+        size = len(values)
+        out = new_series(size)
+        i = 0
+
+        while i < size and not is_initial_sma_calculated:
+            out[i] = rma_func(values[i])
+            i += 1
+
+        # seeded, run the recurrence on locals.
+        value = sum_
+        beta = 1 - alpha
+        for i in range(i, size):
+            value = alpha * values[i] + beta * value
+            out[i] = value
+        sum_ = value
+
+        return out
+
+    return series_indicator(
+        rma_func,
+        rma_many,
+        warmup=length,
+        convergence=decay_bars(1 / length),
+        preview=rma_preview,
+    )
@@ -0,0 +1,140 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Windowed mean and variance using Welford's algorithm."""
+import math
+from math import isnan, sqrt
+
+from pure_ta._circular_buf import CircularBuf
+from pure_ta._enum_types import StDevOf
+
+
+class RollingMoments:
+    """The mean and variance of the last `size` values.
+
+    One buffer feeds the mean and the sum of squared deviations (M2), which
+    are updated in O(1) with a windowed Welford step. A single instance can
+    serve an SMA, a standard deviation and a z-score of the same series.
+
+    While the window holds a NaN every moment is NaN. Once the NaN leaves the
+    window the moments are rebuilt from the buffer.
+    """
+
+    __slots__ = ("_buf", "_mean", "_m2", "_nan_count", "_stale")
+
+    def __init__(self, size: int):
+        self._buf = CircularBuf(size=size)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._nan_count = 0
+        self._stale = False
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the window is full."""
+        return self._buf.is_full
+
+    @property
+    def length(self) -> int:
+        """The size of the window."""
+        return self._buf.length
+
+    def _rebuild(self) -> None:
+        values = list(self._buf.ordered_values)
+        mean = math.fsum(values) / len(values)
+        self._mean = mean
+        self._m2 = math.fsum((v - mean) * (v - mean) for v in values)
+        self._stale = False
+
+    def put(self, value: float) -> None:
+        """Put a value into the window, evicting the oldest one when full."""
+        buf = self._buf
+        old = buf.first if buf.is_full else math.nan
+
+        if buf.is_full and isnan(old):
+            self._nan_count -= 1
+        if isnan(value):
+            self._nan_count += 1
+
+        buf.put(value)
+
+        if self._nan_count or self._stale:
+            # the running moments can not step over a NaN.
+            self._stale = True
+            if not self._nan_count and buf.is_full:
+                self._rebuild()
+            return
+
+        mean = self._mean
+        if isnan(old):
+            # still filling the window, plain Welford step.
+            delta = value - mean
+            mean += delta / buf.filled_size
+            self._m2 += delta * (value - mean)
+        else:
+            delta = value - old
+            mean += delta / buf.length
+            self._m2 += delta * (value - mean + old - self._mean)
+        self._mean = mean
+
+    def mean(self) -> float:
+        """The mean of the window, NaN until full."""
+        if not self._buf.is_full or self._nan_count:
+            return math.nan
+        return self._mean
+
+    def _divisor(self, bias: StDevOf) -> int:
+        length = self._buf.length
+        if bias == StDevOf.POPULATION:
+            return length
+        if length - 1 > 0:
+            return length - 1
+        raise ValueError("Cannot calculate sample stdev for buffer of length 1")
+
+    def preview(
+        self, value: float, bias: StDevOf = StDevOf.POPULATION
+    ) -> tuple[float, float]:
+        """The mean and standard deviation after `put(value)`, without putting it.
+
+        Both are NaN unless the window would be full and free of NaN values.
+        """
+        divisor = self._divisor(bias)
+        buf = self._buf
+        is_full = buf.is_full
+        old = buf.first if is_full else math.nan
+        nan_count = self._nan_count + isnan(value) - (is_full and isnan(old))
+        if nan_count or not is_full and buf.filled_size + 1 < buf.length:
+            return math.nan, math.nan
+
+        if self._stale:
+            # `put` rebuilds the moments from the window.
+            values = list(buf.ordered_values)[1 if is_full else 0 :]
+            values.append(value)
+            mean = math.fsum(values) / len(values)
+            m2 = math.fsum((v - mean) * (v - mean) for v in values)
+        elif isnan(old):
+            delta = value - self._mean
+            mean = self._mean + delta / (buf.filled_size + 1)
+            m2 = self._m2 + delta * (value - mean)
+        else:
+            delta = value - old
+            mean = self._mean + delta / buf.length
+            m2 = self._m2 + delta * (value - mean + old - self._mean)
+        return mean, sqrt(max(m2, 0.0) / divisor)
+
+    def variance(self, bias: StDevOf = StDevOf.POPULATION) -> float:
+        """The population or sample variance of the window, NaN until full."""
+        divisor = self._divisor(bias)
+
+        if not self._buf.is_full or self._nan_count:
+            return math.nan
+        return max(self._m2, 0.0) / divisor
+
+    def st_dev(self, bias: StDevOf = StDevOf.POPULATION) -> float:
+        """The population or sample standard deviation of the window."""
+        return sqrt(self.variance(bias))
+
+    def z_score(self, value: float, bias: StDevOf = StDevOf.POPULATION) -> float:
+        """How many standard deviations `value` is from the window mean."""
+        std = self.st_dev(bias)
+        return (value - self._mean) / std if std != 0 else math.nan
@@ -0,0 +1,230 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""A windowed running sum using Neumaier compensated summation."""
+import math
+from array import array
+from collections.abc import Iterable
+from math import fsum, isnan
+
+from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import as_sequence, new_series
+
+
+def compensated_add(sum_: float, comp: float, value: float) -> tuple[float, float]:
+    """Return the running sum and compensation term after adding `value`."""
+    total = sum_ + value
+    if abs(sum_) >= abs(value):
+        comp += (sum_ - total) + value
+    else:
+        comp += (value - total) + sum_
+    return total, comp
+
+
+class CompensatedSum:
+    """A running sum using Neumaier compensated summation."""
+
+    __slots__ = ("_sum", "_comp")
+
+    def __init__(self, value: float = 0.0):
+        self._sum = value
+        self._comp = 0.0
+
+    @property
+    def total(self) -> float:
+        """The compensated sum."""
+        return self._sum + self._comp
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        sum_ = self._sum
+        total = sum_ + value
+        if abs(sum_) >= abs(value):
+            self._comp += (sum_ - total) + value
+        else:
+            self._comp += (value - total) + sum_
+        self._sum = total
+
+    @property
+    def parts(self) -> tuple[float, float]:
+        """The running sum and its compensation term."""
+        return self._sum, self._comp
+
+    def reset(self, value: float = 0.0, comp: float = 0.0) -> None:
+        """Reset the sum to `value` with the compensation term `comp`."""
+        self._sum = value
+        self._comp = comp
+
+
+class RollingSum:
+    """The sum of the last `size` values, updated in constant time.
+
+    NaN values occupy a slot in the window but are kept out of the sum,
+    `has_nan` reports whether any are currently inside the window.
+
+    Args:
+        size: the number of values in the window.
+        resync_every: when set, recompute the sum exactly from the window
+            after this many evictions so long-lived streams can not drift.
+    """
+
+    __slots__ = ("_buf", "_sum", "_nan_count", "_resync_every", "_evicted")
+
+    def __init__(self, size: int, resync_every: int | None = None):
+        if resync_every is not None and resync_every < 1:
+            raise ValueError("resync_every must be greater than 0")
+        self._buf = CircularBuf(size=size)
+        self._sum = CompensatedSum()
+        self._nan_count = 0
+        self._resync_every = resync_every
+        self._evicted = 0
+
+    @property
+    def total(self) -> float:
+        """The compensated sum of the non NaN values in the window."""
+        return self._sum.total
+
+    @property
+    def has_nan(self) -> bool:
+        """Whether the window currently holds a NaN value."""
+        return self._nan_count > 0
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the window is full."""
+        return self._buf.is_full
+
+    @property
+    def length(self) -> int:
+        """The size of the window."""
+        return self._buf.length
+
+    def resync(self) -> None:
+        """Recompute the sum exactly from the values in the window."""
+        self._sum.reset(fsum(v for v in self._buf.ordered_values if not isnan(v)))
+        self._evicted = 0
+
+    def put(self, value: float) -> None:
+        """Push a value into the window, evicting the oldest one when full."""
+        buf = self._buf
+        if buf.is_full:
+            old = buf.put(value)
+            if isnan(old):
+                self._nan_count -= 1
+            else:
+                self._sum.add(-old)
+            self._evicted += 1
+        else:
+            buf.put(value)
+
+        if isnan(value):
+            self._nan_count += 1
+        else:
+            self._sum.add(value)
+
+        if self._resync_every is not None and self._evicted >= self._resync_every:
+            self.resync()
+
+    def preview_total(self, value: float) -> float:
+        """The total `put(value)` would give, without putting it.
+
+        NaN unless the window would be full and free of NaN values. Like
+        `put`, a due resync recomputes the sum from the window.
+        """
+        buf = self._buf
+        is_full = buf.is_full
+        if not is_full and buf.filled_size + 1 < buf.length:
+            return math.nan
+
+        nan_count = self._nan_count
+        sum_, comp = self._sum.parts
+        if is_full:
+            old = buf.first
+            if isnan(old):
+                nan_count -= 1
+            else:
+                sum_, comp = compensated_add(sum_, comp, -old)
+        if isnan(value):
+            return math.nan
+        if nan_count:
+            return math.nan
+
+        resync_every = self._resync_every
+        if resync_every is not None and is_full and self._evicted + 1 >= resync_every:
+            values = list(buf.ordered_values)[1:]
+            values.append(value)
+            return fsum(v for v in values if not isnan(v))
+        sum_, comp = compensated_add(sum_, comp, value)
+        return sum_ + comp
+
+    def preview_mean(self, value: float) -> float:
+        """The mean `put(value)` and `mean()` would give, without putting it."""
+        return self.preview_total(value) / self._buf.length
+
+    def mean(self) -> float:
+        """The mean of the window, NaN until full or while it holds a NaN."""
+        if not self._buf.is_full or self._nan_count:
+            return math.nan
+        return self._sum.total / self._buf.length
+
+    def means(self, values: Iterable[float]) -> "array[float]":
+        """Put every value and return the mean after each one.
+
+        Equivalent to calling `put` and `mean` per value, with the compensated
+        summation inlined on locals for bulk input.
+        """
+        values = as_sequence(values)
+        size = len(values)
+        out = new_series(size)
+        buf = self._buf
+        put = buf.put
+        length = buf.length
+        filled = buf.filled_size
+        sum_, comp = self._sum.parts
+        nan_count = self._nan_count
+        evicted = self._evicted
+        resync_every = self._resync_every
+
+        for i in range(size):
+            value = values[i]
+            if filled == length:
+                old = -put(value)
+                if isnan(old):
+                    nan_count -= 1
+                else:
+                    total = sum_ + old
+                    if abs(sum_) >= abs(old):
+                        comp += (sum_ - total) + old
+                    else:
+                        comp += (old - total) + sum_
+                    sum_ = total
+                evicted += 1
+            else:
+                put(value)
+                filled += 1
+
+            if isnan(value):
+                nan_count += 1
+            else:
+                total = sum_ + value
+                if abs(sum_) >= abs(value):
+                    comp += (sum_ - total) + value
+                else:
+                    comp += (value - total) + sum_
+                sum_ = total
+
+            if resync_every is not None and evicted >= resync_every:
+                sum_ = fsum(v for v in buf.ordered_values if not isnan(v))
+                comp = 0.0
+                evicted = 0
+
+            if filled == length and not nan_count:
+                out[i] = (sum_ + comp) / length
+            else:
+                out[i] = math.nan
+
+        self._sum.reset(sum_, comp)
+        self._nan_count = nan_count
+        self._evicted = evicted
+
+        return out
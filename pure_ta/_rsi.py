@@ -2,19 +2,18 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from collections.abc import Callable
 from math import isnan, nan
 
+from pure_ta._indicator import Indicator, decay_bars, series_indicator
 
-def get_rsi(length: int = 14) -> Callable[[float], float]:
+
+def get_rsi(length: int = 14) -> Indicator[float, float]:
     last_value = nan
     avg_gain = 0.0
     avg_loss = 0.0
     count = 0
 
-    def rsi(current_value: float) -> float:
-        nonlocal last_value, avg_gain, avg_loss, count
-
+    def averages(current_value: float) -> tuple[float, float]:
         gain = 0.0
         loss = 0.0
 
@@ -25,20 +24,38 @@ def get_rsi(length: int = 14) -> Callable[[float], float]:
 
         if count < length:
             # Calculating the first average gain and loss
-            avg_gain = ((avg_gain * count) + gain) / (count + 1)
-            avg_loss = ((avg_loss * count) + loss) / (count + 1)
-        else:
-            # Calculating the subsequent average gain and loss
-            avg_gain = ((avg_gain * (length - 1)) + gain) / length
-            avg_loss = ((avg_loss * (length - 1)) + loss) / length
+            return (
+                ((avg_gain * count) + gain) / (count + 1),
+                ((avg_loss * count) + loss) / (count + 1),
+            )
+        # Calculating the subsequent average gain and loss
+        return (
+            ((avg_gain * (length - 1)) + gain) / length,
+            ((avg_loss * (length - 1)) + loss) / length,
+        )
+
+    def result(gain: float, loss: float, seen: int) -> float:
+        if seen < length:
+            return nan
+        rs = gain / loss if loss != 0 else nan
+
+        return nan if isnan(rs) else 100 - (100 / (rs + 1))
 
+    def rsi(current_value: float) -> float:
+        nonlocal last_value, avg_gain, avg_loss, count
+
+        avg_gain, avg_loss = averages(current_value)
         count += 1
         last_value = current_value
 
-        if count < length:
-            return nan
-        rs = avg_gain / avg_loss if avg_loss != 0 else nan
+        return result(avg_gain, avg_loss, count)
 
-        return nan if isnan(rs) else 100 - (100 / (rs + 1))
+    def rsi_preview(current_value: float) -> float:
+        return result(*averages(current_value), count + 1)
 
-    return rsi
+    return series_indicator(
+        rsi,
+        warmup=length + 1,
+        convergence=decay_bars(1 / length),
+        preview=rsi_preview,
+    )
@@ -0,0 +1,146 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Rolling highest and lowest values backed by monotonic deques."""
+import math
+from collections import deque
+from math import isnan
+
+
+class _SlidingExtremum:
+    """Shared state for the sliding maximum and minimum.
+
+    NaN values take a slot in the window but never enter the deque, as they
+    do not compare. Their positions are kept until they leave the window.
+    """
+
+    __slots__ = ("_values", "_indices", "_nan_indices", "_size", "_count")
+
+    def __init__(self, size: int):
+        self._values: deque[float] = deque()
+        self._indices: deque[int] = deque()
+        self._nan_indices: deque[int] = deque()
+        self._size = size
+        self._count = 0
+
+    @property
+    def value(self) -> float:
+        """The extremum of the values in the window other than NaN.
+
+        NaN until the window is full, or when every value in it is NaN.
+        """
+        if self._count < self._size or not self._values:
+            return math.nan
+        return self._values[0]
+
+    @property
+    def has_nan(self) -> bool:
+        """Whether the window holds a NaN value."""
+        return bool(self._nan_indices)
+
+    @property
+    def filled_size(self) -> int:
+        """The number of values the window currently covers."""
+        return min(self._count, self._size)
+
+    @property
+    def length(self) -> int:
+        """The size of the window."""
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the window is full."""
+        return self._count >= self._size
+
+    def _evict(self) -> None:
+        oldest = self._count - self._size
+        if self._indices and self._indices[0] < oldest:
+            self._indices.popleft()
+            self._values.popleft()
+        if self._nan_indices and self._nan_indices[0] < oldest:
+            self._nan_indices.popleft()
+
+    def _front(self) -> float:
+        """The extremum of the values that stay in the window on the next put."""
+        indices = self._indices
+        if not indices:
+            return math.nan
+        if indices[0] <= self._count - self._size:
+            # the front leaves the window, the next value in the deque is
+            # the extremum of the rest.
+            return self._values[1] if len(indices) > 1 else math.nan
+        return self._values[0]
+
+    def _put_nan(self) -> None:
+        self._nan_indices.append(self._count)
+        self._count += 1
+        self._evict()
+
+
+class SlidingMax(_SlidingExtremum):
+    """The highest of the last `size` values in amortized O(1) per update.
+
+    Only values that can still become the maximum are kept, in decreasing
+    order, so the front of the deque is always the highest value.
+    """
+
+    __slots__ = ()
+
+    def put(self, value: float) -> None:
+        """Put a value into the window."""
+        if isnan(value):
+            self._put_nan()
+            return
+        values = self._values
+        indices = self._indices
+        while values and values[-1] <= value:
+            values.pop()
+            indices.pop()
+        values.append(value)
+        indices.append(self._count)
+        self._count += 1
+        self._evict()
+
+    def preview(self, value: float) -> float:
+        """The value the window would have after putting `value`, unchanged."""
+        if self._count + 1 < self._size:
+            return math.nan
+        front = self._front()
+        if isnan(value) or value <= front:
+            return front
+        return value
+
+
+class SlidingMin(_SlidingExtremum):
+    """The lowest of the last `size` values in amortized O(1) per update.
+
+    Only values that can still become the minimum are kept, in increasing
+    order, so the front of the deque is always the lowest value.
+    """
+
+    __slots__ = ()
+
+    def put(self, value: float) -> None:
+        """Put a value into the window."""
+        if isnan(value):
+            self._put_nan()
+            return
+        values = self._values
+        indices = self._indices
+        while values and values[-1] >= value:
+            values.pop()
+            indices.pop()
+        values.append(value)
+        indices.append(self._count)
+        self._count += 1
+        self._evict()
+
+    def preview(self, value: float) -> float:
+        """The value the window would have after putting `value`, unchanged."""
+        if self._count + 1 < self._size:
+            return math.nan
+        front = self._front()
+        if isnan(value) or value >= front:
+            return front
+        return value
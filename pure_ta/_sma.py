@@ -1,17 +1,23 @@
 """contains moving average functions."""
-import math
-from collections.abc import Callable
-from statistics import mean
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._rolling_sum import RollingSum
 
-from pure_ta._circular_buf import CircularBuf
 
+def get_sma(
+    length: int = 20, resync_every: int | None = None
+) -> Indicator[float, float]:
+    """Returns a function that calculates the simple moving average.
 
-def get_sma(length: int = 20) -> Callable[[float], float]:
-    """Returns a function that calculates the simple moving average."""
-    buf = CircularBuf(size=length)
+    The average is kept as a compensated running sum, so each update is O(1)
+    regardless of `length`. Set `resync_every` to periodically recompute the
+    sum exactly from the window on long-lived streams.
+    """
+    window = RollingSum(size=length, resync_every=resync_every)
 
     def sma_func(data: float) -> float:
-        buf.put(data)
-        return mean(buf.values) if buf.is_full else math.nan
+        window.put(data)
+        return window.mean()
 
-    return sma_func
+    return series_indicator(
+        sma_func, window.means, warmup=length, preview=window.preview_mean
+    )
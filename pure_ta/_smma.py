@@ -2,27 +2,54 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from collections.abc import Callable
 from math import isnan, nan
 
-from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, decay_bars, series_indicator
 
 
-def get_smma(length: int = 20) -> Callable[[float], float]:
-    buf = CircularBuf(size=length)
+def get_smma(length: int = 20) -> Indicator[float, float]:
+    """Returns a function that calculates the smoothed moving average.
+
+    The SMMA is seeded with the mean of `length` consecutive values, after which
+    every update is just the recurrence. A NaN restarts the seed.
+    """
     smma = nan
+    seed_sum = 0.0
+    seed_count = 0
 
     def smma_calculator(price: float) -> float:
-        nonlocal smma
-
-        buf.put(price)
+        nonlocal smma, seed_sum, seed_count
 
-        if isnan(smma):
-            if buf.is_full:
-                smma = sum(buf.ordered_values) / length
-        else:
+        if not isnan(smma):
             smma = ((smma * (length - 1)) + price) / length
+            if not isnan(smma):
+                return smma
+            seed_sum = 0.0
+            seed_count = 0
+            return smma
+
+        if isnan(price):
+            seed_sum = 0.0
+            seed_count = 0
+            return smma
+
+        seed_sum += price
+        seed_count += 1
+        if seed_count == length:
+            smma = seed_sum / length
+
+        return smma
 
+    def smma_preview(price: float) -> float:
+        if not isnan(smma):
+            return ((smma * (length - 1)) + price) / length
+        if not isnan(price) and seed_count + 1 == length:
+            return (seed_sum + price) / length
         return smma
 
-    return smma_calculator
+    return series_indicator(
+        smma_calculator,
+        warmup=length,
+        convergence=decay_bars(1 / length),
+        preview=smma_preview,
+    )
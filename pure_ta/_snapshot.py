@@ -0,0 +1,408 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Export and restore the state of streaming indicators.
+
+Indicators keep their state in closures and small helper objects. `snapshot`
+walks that state in a fixed order and packs every value into a versioned
+byte blob, and `restore` writes the values back into a freshly created
+indicator with the same parameters:
+
+    blob = snapshot(ema)
+    ...
+    ema = restore(ta.ema(20), blob)  # continues exactly where it left off
+
+The blob only holds plain values (numbers, strings and arrays of them), so
+restoring one never runs code from it, unlike a pickle.
+
+An object keeping its state out of reach of the walk, such as in the locals
+of a generator, can define `export_state`, returning a key for the layout and
+a list of its values, and `import_state`, taking that list back once its
+values are restored.
+
+The values are stored in the order they are found, and the blob carries a
+checksum of the layout they were found in: the names of the closure
+variables and slots, the kinds of values and containers, and the values of
+the parameters (the variables no code ever writes after the indicator is
+created). An indicator with other parameters, or from a release that keeps
+its state differently, is rejected rather than misread, so snapshots are
+meant to be restored by the same release of `pure_ta`. `SNAPSHOT_VERSION`
+changes with the encoding itself.
+"""
+import dis
+import struct
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterator
+from copy import copy
+from enum import Enum
+from functools import cache, partial
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import Any, TypeVar
+from zlib import crc32
+
+T = TypeVar("T")
+
+SNAPSHOT_VERSION = 2
+
+_MAGIC = b"PTAS"
+_HEADER = struct.Struct("<4sBI")  # magic, version, state layout checksum
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_SIZE = struct.Struct("<I")
+
+_MISSING = object()
+_SCALARS = (type(None), bool, int, float, str, tuple)
+_CONTAINERS = (list, deque, array)
+_STORES = {"STORE_DEREF", "DELETE_DEREF", "STORE_ATTR", "DELETE_ATTR"}
+
+
+@cache
+def _stored_names(code: CodeType) -> frozenset[str]:
+    """The closure variables and attributes written by code or code nested in it."""
+    names = {
+        instruction.argval
+        for instruction in dis.get_instructions(code)
+        if instruction.opname in _STORES
+    }
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _stored_names(const)
+    return frozenset(names)
+
+
+@cache
+def _written_slots(cls: type) -> frozenset[str]:
+    """The attributes written by the methods of a class, after `__init__`."""
+    names: set[str] = set()
+    for klass in cls.__mro__:
+        for name, member in vars(klass).items():
+            if isinstance(member, staticmethod | classmethod):
+                member = member.__func__
+            elif isinstance(member, property):
+                member = member.fset
+            if isinstance(member, FunctionType) and name != "__init__":
+                names |= _stored_names(member.__code__)
+    return frozenset(names)
+
+
+class _State:
+    """The mutable values reachable from an indicator, in a stable order.
+
+    Scalars are collected with a setter writing them back to where they were
+    found. Containers are collected as themselves and restored in place, as
+    other closures may hold them or their bound methods. Objects held by a
+    closure or a slot are preceded by a marker, True while they exist, as
+    some indicators release their seed buffers once seeded.
+
+    When `saved` values are given, the walk takes each value from them
+    instead, skipping the objects that were released when they were saved.
+
+    Scalars that no code writes are parameters, and their own values are
+    part of the layout, which never depends on `saved`.
+    """
+
+    __slots__ = (
+        "values",
+        "targets",
+        "objects",
+        "layout",
+        "_seen",
+        "_saved",
+        "_written",
+        "_params",
+        "_exported",
+    )
+
+    def __init__(self, root: Any, saved: Iterator[Any] | None = None):
+        self.values: list[Any] = []
+        self.targets: list[Any] = []
+        # every object behind a marker, with the setter of where it was held.
+        self.objects: list[tuple[Callable[[Any], None], Any]] = []
+        self.layout: list[str] = []
+        self._seen: set[int] = set()
+        self._saved = saved
+        # the closure cells written by the functions found.
+        self._written: set[int] = set()
+        # the scalar cells found, by their index in the layout.
+        self._params: list[tuple[int, int, Any]] = []
+        # the objects with `import_state`, with the list of their values.
+        self._exported: list[tuple[Any, list[Any]]] = []
+        self._visit(root, None)
+
+    @property
+    def checksum(self) -> int:
+        """A checksum of the state layout, the same for equal indicators."""
+        layout = self.layout.copy()
+        for index, cell, value in self._params:
+            if cell not in self._written:
+                layout[index] = f"param:{value!r}"
+        return crc32("\0".join(layout).encode())
+
+    def _take(self, value: Any, target: Any) -> Any:
+        if self._saved is not None:
+            value = next(self._saved, _MISSING)
+            if value is _MISSING:
+                raise ValueError("the snapshot was taken from a different indicator")
+        self.values.append(value)
+        self.targets.append(target)
+        return value
+
+    def _visit(self, obj: Any, setter: Callable[[Any], None] | None) -> None:
+        if isinstance(obj, _SCALARS) and not isinstance(obj, Enum):
+            # the type is left out, as a counter can start as 0 and become 0.5.
+            self.layout.append("value")
+            self._take(obj, setter)
+            return
+
+        if isinstance(obj, type | ModuleType | Enum | memoryview):
+            # parameters and views of other state, never written to.
+            self.layout.append(repr(obj) if isinstance(obj, Enum) else "const")
+            return
+
+        if setter is not None and not isinstance(obj, _CONTAINERS):
+            self.layout.append("value")
+            if self._take(True, setter) is None:
+                return
+            self.targets[-1] = None  # kept, its own values are restored below
+            self.objects.append((setter, obj))
+
+        if id(obj) in self._seen:
+            self.layout.append("ref")
+            return
+        self._seen.add(id(obj))
+
+        if isinstance(obj, _CONTAINERS):
+            self.layout.append(_describe(obj))
+            self._take(obj, obj)
+        elif isinstance(obj, FunctionType):
+            self._visit_function(obj)
+        elif isinstance(obj, MethodType | BuiltinFunctionType):
+            owner = obj.__self__
+            if owner is not None and not isinstance(owner, ModuleType):
+                self._visit(owner, None)
+        elif hasattr(obj, "export_state"):
+            key, values = obj.export_state()
+            self.layout.append(f"{type(obj).__qualname__}:{key}")
+            for index, value in enumerate(values):
+                self._visit(value, partial(values.__setitem__, index))
+            self._exported.append((obj, values))
+        elif hasattr(type(obj), "__slots__"):
+            cls = type(obj)
+            self.layout.append(cls.__qualname__)
+            written = _written_slots(cls)
+            for name in _slot_names(cls):
+                if hasattr(obj, name):
+                    self.layout.append(name)
+                    value = getattr(obj, name)
+                    if name not in written and isinstance(value, _SCALARS):
+                        self._params.append((len(self.layout), 0, value))
+                    self._visit(value, partial(setattr, obj, name))
+        else:
+            raise TypeError(f"cannot snapshot a {type(obj).__qualname__}")
+
+    def _visit_function(self, fn: FunctionType) -> None:
+        self.layout.append(fn.__qualname__)
+        stored = _stored_names(fn.__code__)
+        for name, cell in zip(fn.__code__.co_freevars, fn.__closure__ or ()):
+            if name in stored:
+                self._written.add(id(cell))
+            # closures of the same factory share their cells.
+            if id(cell) in self._seen:
+                continue
+            self._seen.add(id(cell))
+            self.layout.append(name)
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                self.layout.append("empty")
+                continue
+            if isinstance(contents, _SCALARS):
+                self._params.append((len(self.layout), id(cell), contents))
+            self._visit(contents, partial(setattr, cell, "cell_contents"))
+        for name, value in vars(fn).items():
+            self._visit(value, partial(setattr, fn, name))
+
+    def apply(self, values: list[Any]) -> None:
+        """Write the values collected by a walk back to where they were found.
+
+        Objects with `import_state` are given their values back afterwards.
+        """
+        for target, value in zip(self.targets, values):
+            if isinstance(target, deque):
+                target.clear()
+                target.extend(value)
+            elif isinstance(target, _CONTAINERS):
+                target[:] = value
+            elif target is not None:
+                target(value)
+        for obj, exported in self._exported:
+            obj.import_state(exported)
+
+
+def _slot_names(cls: type) -> list[str]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def _describe(container: list | deque | array) -> str:
+    if isinstance(container, array):
+        return f"array:{container.typecode}:{len(container)}"
+    if isinstance(container, deque):
+        return f"deque:{container.maxlen}"
+    return "list"
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i" + _INT.pack(value)
+    elif isinstance(value, float):
+        out += b"f" + _FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode()
+        out += b"s" + _SIZE.pack(len(data)) + data
+    elif isinstance(value, array):
+        out += b"a" + value.typecode.encode() + _SIZE.pack(len(value))
+        out += value.tobytes()
+    elif isinstance(value, list | tuple | deque):
+        tag = (
+            b"l"
+            if isinstance(value, list)
+            else b"t"
+            if isinstance(value, tuple)
+            else b"q"
+        )
+        out += tag + _SIZE.pack(len(value))
+        for item in value:
+            _encode(item, out)
+    else:
+        raise TypeError(f"cannot snapshot a {type(value).__qualname__}")
+
+
+def _decode(data: memoryview, pos: int) -> tuple[Any, int]:
+    tag = data[pos : pos + 1].tobytes()
+    pos += 1
+    if tag == b"N":
+        return None, pos
+    if tag == b"T":
+        return True, pos
+    if tag == b"F":
+        return False, pos
+    if tag == b"i":
+        return _INT.unpack_from(data, pos)[0], pos + _INT.size
+    if tag == b"f":
+        return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+    if tag == b"s":
+        (size,) = _SIZE.unpack_from(data, pos)
+        pos += _SIZE.size
+        return data[pos : pos + size].tobytes().decode(), pos + size
+    if tag == b"a":
+        typecode = data[pos : pos + 1].tobytes().decode()
+        (size,) = _SIZE.unpack_from(data, pos + 1)
+        pos += 1 + _SIZE.size
+        values = array(typecode)
+        end = pos + size * values.itemsize
+        values.frombytes(data[pos:end])
+        return values, end
+    if tag in (b"l", b"t", b"q"):
+        (size,) = _SIZE.unpack_from(data, pos)
+        pos += _SIZE.size
+        items = []
+        for _ in range(size):
+            item, pos = _decode(data, pos)
+            items.append(item)
+        return (tuple(items) if tag == b"t" else items), pos
+    raise ValueError(f"corrupt indicator snapshot, unknown tag {tag!r}")
+
+
+def snapshot(indicator: Any) -> bytes:
+    """Export the state of a streaming indicator as a versioned byte blob.
+
+    Args:
+        indicator: An indicator created by one of the `pure_ta.ta` functions.
+
+    Returns:
+        The blob to pass to `restore`.
+
+    Raises:
+        TypeError: If the indicator holds state that can not be exported.
+    """
+    state = _State(indicator)
+    out = bytearray(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, state.checksum))
+    out += _SIZE.pack(len(state.values))
+    for value in state.values:
+        _encode(value, out)
+    return bytes(out)
+
+
+def restore(indicator: T, blob: bytes) -> T:
+    """Load a snapshot into an indicator, replacing its state.
+
+    The indicator must be created by the same function with the same
+    parameters as the one the snapshot was taken from, and it can then be
+    updated as if it had seen every bar the original one did.
+
+    Args:
+        indicator: A new indicator to restore the state into.
+        blob: The bytes returned by `snapshot`.
+
+    Returns:
+        The same indicator, for convenience.
+
+    Raises:
+        ValueError: If the blob is not a snapshot of a matching indicator or
+            was written by an unsupported version.
+    """
+    data = memoryview(blob)
+    if len(data) < _HEADER.size + _SIZE.size:
+        raise ValueError("not an indicator snapshot")
+    magic, version, checksum = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("not an indicator snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported indicator snapshot version {version}")
+
+    (count,) = _SIZE.unpack_from(data, _HEADER.size)
+    pos = _HEADER.size + _SIZE.size
+    values = []
+    for _ in range(count):
+        value, pos = _decode(data, pos)
+        values.append(value)
+
+    saved = iter(values)
+    state = _State(indicator, saved)
+    if checksum != state.checksum or next(saved, _MISSING) is not _MISSING:
+        raise ValueError("the snapshot was taken from a different indicator")
+
+    state.apply(state.values)
+    return indicator
+
+
+def checkpoint(indicator: Any) -> Callable[[], None]:
+    """Return a function putting an indicator back in its current state.
+
+    Unlike `snapshot` nothing is encoded, but every buffer is copied, so the
+    cost still grows with the size of the state.
+    """
+    state = _State(indicator)
+    values = [
+        copy(value) if isinstance(value, _CONTAINERS) else value
+        for value in state.values
+    ]
+    objects = state.objects
+
+    def revert() -> None:
+        for setter, obj in objects:
+            setter(obj)
+        state.apply(values)
+
+    return revert
@@ -0,0 +1,49 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""A sliding window that keeps its values in sorted order."""
+from bisect import bisect_left, bisect_right, insort
+from math import isnan
+
+from pure_ta._circular_buf import CircularBuf
+
+
+class SortedWindow:
+    """The last `size` values, kept sorted for O(log n) rank queries.
+
+    Insertion and eviction bisect into a sorted list, so they only cost a
+    memmove of the list tail. NaN values occupy a slot in the window but are
+    never ranked.
+    """
+
+    __slots__ = ("_buf", "_sorted")
+
+    def __init__(self, size: int):
+        self._buf = CircularBuf(size=size)
+        self._sorted: list[float] = []
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the window is full."""
+        return self._buf.is_full
+
+    @property
+    def length(self) -> int:
+        """The size of the window."""
+        return self._buf.length
+
+    def put(self, value: float) -> None:
+        """Put a value into the window, evicting the oldest one when full."""
+        if self._buf.is_full:
+            old = self._buf.first
+            if not isnan(old):
+                del self._sorted[bisect_left(self._sorted, old)]
+
+        self._buf.put(value)
+
+        if not isnan(value):
+            insort(self._sorted, value)
+
+    def count_le(self, value: float) -> int:
+        """The number of values in the window less than or equal to `value`."""
+        return 0 if isnan(value) else bisect_right(self._sorted, value)
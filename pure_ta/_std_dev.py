@@ -1,47 +1,23 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
-from math import sqrt
 
-from pure_ta._circular_buf import CircularBuf
 from pure_ta._enum_types import StDevOf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._rolling_moments import RollingMoments
 
 
 def get_st_dev(
     length: int = 20, bias: StDevOf = StDevOf.POPULATION
-) -> Callable[[float], float]:
-    buf = CircularBuf(size=length)
-    sum_ = 0.0
-    sum_of_squares = 0.0
-
-    def divisor() -> int:
-        if bias == StDevOf.POPULATION:
-            return length
-        elif length - 1 > 0:
-            return length - 1
-        else:
-            raise ValueError("Cannot calculate sample stdev for buffer of length 1")
+) -> Indicator[float, float]:
+    moments = RollingMoments(size=length)
 
     def compute(data: float) -> float:
-        nonlocal sum_, sum_of_squares
-
-        old_val = buf.first if buf.is_full else 0.0
-
-        # update the buffer
-        buf.put(data)
-
-        sum_ += data - old_val
-        sum_of_squares += data**2 - old_val * old_val
-
-        if not buf.is_full:
-            return float("nan")
+        moments.put(data)
 
-        mean = sum_ / length
-        mean_of_squares = sum_of_squares / length
-        variance = mean_of_squares - mean * mean
-        adjusted_variance = variance * length / divisor()  # Adjust variance for bias
+        return moments.st_dev(bias)
 
-        return sqrt(adjusted_variance)
+    def preview(data: float) -> float:
+        return moments.preview(data, bias)[1]
 
-    return compute
+    return series_indicator(compute, warmup=length, preview=preview)
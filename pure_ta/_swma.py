@@ -1,12 +1,12 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
 
 from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
 
 
-def get_swma() -> Callable[[float], float]:
+def get_swma() -> Indicator[float, float]:
     buf = CircularBuf(size=4)
 
     def swma(price: float):
@@ -16,15 +16,20 @@ def get_swma() -> Callable[[float], float]:
         if not buf.is_full:
             return float("nan")
 
-        # Retrieve the last four data points
-        last_four_prices = list(buf.ordered_values)
+        # Compute the SWMA from the last four data points
+        return (buf[0] * 1 / 6) + (buf[1] * 2 / 6) + (buf[2] * 2 / 6) + (buf[3] * 1 / 6)
 
-        # Compute the SWMA
+    def swma_preview(price: float):
+        if len(buf) < 3:
+            return float("nan")
+
+        # the last three values stay in the window after the put.
+        first = len(buf) - 3
         return (
-            (last_four_prices[0] * 1 / 6)
-            + (last_four_prices[1] * 2 / 6)
-            + (last_four_prices[2] * 2 / 6)
-            + (last_four_prices[3] * 1 / 6)
+            (buf[first] * 1 / 6)
+            + (buf[first + 1] * 2 / 6)
+            + (buf[first + 2] * 2 / 6)
+            + (price * 1 / 6)
         )
 
-    return swma
+    return series_indicator(swma, warmup=4, preview=swma_preview)
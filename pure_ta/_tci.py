@@ -1,46 +1,70 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-import math
-from collections.abc import Callable
 from math import nan
 
 from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, decay_bars, series_indicator
 
 
-def get_tci(length: int = 9) -> Callable[[float], float]:
-    ema_src = math.inf
-    ema_diff_abs = math.inf
-    ema_tci_raw = math.inf
-    data_buffer = CircularBuf(size=length)
+def get_tci(length: int = 9) -> Indicator[float, float]:
+    """Returns a function that calculates the Trend Confidence Index.
+
+    The first `length` values seed the averages, after that the seed buffer is
+    released and every update is just the EMA recurrences.
+    """
+    alpha = 2 / (length + 1)
+    tci_alpha = 2 / (6 + 1)
+    ema_src = nan
+    ema_diff_abs = nan
+    ema_tci_raw = nan
+    data_buffer: CircularBuf | None = CircularBuf(size=length)
+
+    def seed(values: list[float]) -> tuple[float, float, float]:
+        # the emaSrc, emaDiffAbs and emaTCIRaw seeded with SMAs
+        src = sum(values) / length
+        diff_abs = sum(abs(val - src) for val in values) / length
+        tci_raw_sum = sum((val - src) / (0.025 * abs(val - src)) for val in values)
+        return src, diff_abs, tci_raw_sum / 6
+
+    def step(data: float) -> tuple[float, float, float]:
+        # the next emaSrc, emaDiffAbs and emaTCIRaw
+        src = alpha * data + (1 - alpha) * ema_src
+        diff_abs = abs(data - src)
+        diff_abs_ema = alpha * diff_abs + (1 - alpha) * ema_diff_abs
+        tci_raw = (data - src) / (diff_abs_ema * 0.025)
+        return src, diff_abs_ema, tci_alpha * tci_raw + (1 - tci_alpha) * ema_tci_raw
 
     def tci(data: float) -> float:
-        nonlocal ema_src, ema_diff_abs, ema_tci_raw
-        data_buffer.put(data)
+        nonlocal ema_src, ema_diff_abs, ema_tci_raw, data_buffer
 
-        if data_buffer.is_full:
-            if ema_src == math.inf:
-                # Initialize emaSrc, emaDiffAbs and emaTCIRaw using SMA
-                ema_src = sum(data_buffer.ordered_values) / length
-                diff_sum = sum(abs(val - ema_src) for val in data_buffer.ordered_values)
-                ema_diff_abs = diff_sum / length
-                tci_raw_sum = sum(
-                    (val - ema_src) / (0.025 * abs(val - ema_src))
-                    for val in data_buffer.ordered_values
-                )
-                ema_tci_raw = tci_raw_sum / 6
-            else:
-                # Update emaSrc, emaDiffAbs and emaTCIRaw
-                ema_src = (2 / (length + 1)) * data + (1 - 2 / (length + 1)) * ema_src
-                diff_abs = abs(data - ema_src)
-                ema_diff_abs = (2 / (length + 1)) * diff_abs + (
-                    1 - 2 / (length + 1)
-                ) * ema_diff_abs
-                tci_raw = (data - ema_src) / (ema_diff_abs * 0.025)
-                ema_tci_raw = (2 / (6 + 1)) * tci_raw + (1 - 2 / (6 + 1)) * ema_tci_raw
+        if data_buffer is None:
+            ema_src, ema_diff_abs, ema_tci_raw = step(data)
 
             return ema_tci_raw + 50
-        else:
+
+        data_buffer.put(data)
+
+        if not data_buffer.is_full:
+            return nan
+
+        ema_src, ema_diff_abs, ema_tci_raw = seed(list(data_buffer.ordered_values))
+        data_buffer = None
+
+        return ema_tci_raw + 50
+
+    def tci_preview(data: float) -> float:
+        if data_buffer is None:
+            return step(data)[2] + 50
+        if data_buffer.filled_size + 1 < length:
             return nan
+        # the buffer is released once full, so the bar completes it.
+        return seed([*data_buffer.ordered_values, data])[2] + 50
 
-    return tci
+    # the source and deviation EMAs feed the TCI EMA, so their decays add up.
+    return series_indicator(
+        tci,
+        warmup=length,
+        convergence=2 * decay_bars(alpha) + decay_bars(tci_alpha),
+        preview=tci_preview,
+    )
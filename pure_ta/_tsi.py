@@ -3,21 +3,34 @@
 # license that can be found in the LICENSE file.
 
 
-from collections.abc import Callable
 from dataclasses import dataclass
 from math import isnan, nan
 
 from pure_ta._ema import get_ema
+from pure_ta._indicator import (
+    Indicator,
+    chain_warmup,
+    indicator,
+    series_indicator,
+)
 
 
-def double_smooth(long: int, short: int) -> Callable[[float], float]:
+def double_smooth(long: int, short: int) -> Indicator[float, float]:
     ema_short = get_ema(length=short)
     ema_long = get_ema(length=long)
 
     def apply_double_smooth(value: float) -> float:
         return ema_short(ema_long(value))
 
-    return apply_double_smooth
+    def preview_double_smooth(value: float) -> float:
+        return ema_short.preview(ema_long.preview(value))
+
+    return series_indicator(
+        apply_double_smooth,
+        warmup=chain_warmup(ema_long, ema_short),
+        convergence=ema_long.convergence + ema_short.convergence,
+        preview=preview_double_smooth,
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,22 +43,29 @@ class TsiResult:
 
 def get_tsi(
     length: int = 25, smooth_len: int = 13, signal_len: int = 13
-) -> Callable[[float], TsiResult]:
+) -> Indicator[float, TsiResult]:
     last_value = None
     double_smooth_pc = double_smooth(long=length, short=smooth_len)
     double_smooth_apc = double_smooth(long=length, short=smooth_len)
     ema_signal = get_ema(length=signal_len)
 
-    def tsi_function(value: float) -> TsiResult:
-        nonlocal last_value
+    def price_change(value: float) -> tuple[float, float]:
+        if last_value is None:
+            return nan, nan
+        pc = value - last_value
+        return pc, abs(pc)
 
-        pc = nan
-        apc: float = nan
+    def tsi_line(double_smooth_pc_value: float, double_smooth_apc_value: float):
+        return (
+            double_smooth_pc_value * 100 / double_smooth_apc_value
+            if double_smooth_apc_value != 0
+            else 0
+        )
 
-        if last_value is not None:
-            pc = value - last_value
-            apc = abs(pc)
+    def tsi_function(value: float) -> TsiResult:
+        nonlocal last_value
 
+        pc, apc = price_change(value)
         last_value = value
 
         double_smooth_pc_value = double_smooth_pc(pc)
@@ -54,13 +74,26 @@ def get_tsi(
         if isnan(double_smooth_pc_value) or isnan(double_smooth_apc_value):
             return TsiResult(tsi=float("nan"), signal=float("nan"))
 
-        tsi = (
-            double_smooth_pc_value * 100 / double_smooth_apc_value
-            if double_smooth_apc_value != 0
-            else 0
-        )
+        tsi = tsi_line(double_smooth_pc_value, double_smooth_apc_value)
         signal = ema_signal(tsi)
 
         return TsiResult(tsi=tsi, signal=signal)
 
-    return tsi_function
+    def tsi_preview(value: float) -> TsiResult:
+        pc, apc = price_change(value)
+        double_smooth_pc_value = double_smooth_pc.preview(pc)
+        double_smooth_apc_value = double_smooth_apc.preview(apc)
+
+        if isnan(double_smooth_pc_value) or isnan(double_smooth_apc_value):
+            return TsiResult(tsi=float("nan"), signal=float("nan"))
+
+        tsi = tsi_line(double_smooth_pc_value, double_smooth_apc_value)
+        return TsiResult(tsi=tsi, signal=ema_signal.preview(tsi))
+
+    # the first price change needs a previous value.
+    return indicator(
+        tsi_function,
+        warmup=1 + chain_warmup(double_smooth_pc, ema_signal),
+        convergence=double_smooth_pc.convergence + ema_signal.convergence,
+        preview=tsi_preview,
+    )
@@ -1,5 +1,6 @@
 """common types used throughout the library."""
-from dataclasses import InitVar, dataclass
+from abc import ABC, abstractmethod
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Self, Union
@@ -44,76 +45,68 @@ class PriceDataWithVol:
     volume: float
 
 
-@dataclass
-class Quote:
-    """Represents a quote for a financial asset."""
+class _QuoteParts(ABC):
+    """Derived prices and conversions shared by quote-like objects.
 
-    time: datetime
-    o: InitVar[float]
-    h: InitVar[float]
-    l: InitVar[float]
-    c: InitVar[float]
-    v: InitVar[float]
+    Subclasses provide the time stamp and the OHLCV prices.
+    """
 
-    def __post_init__(
-        self, o: float, h: float, l: float, c: float, v: float
-    ) -> None:  # noqa: E741
-        # pylint: disable=invalid-name
-        self._o = Decimal(o)
-        self._h = Decimal(h)
-        self._l = Decimal(l)
-        self._c = Decimal(c)
-        self._v = Decimal(v)
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def time_stamp(self) -> str:
+        """The time of the quote in ISO 8601 format."""
 
     @property
+    @abstractmethod
     def open(self) -> float:
         """Open price of the quote."""
-        return float(self._o)
 
     @property
+    @abstractmethod
     def high(self) -> float:
         """High price of the quote."""
-        return float(self._h)
 
     @property
+    @abstractmethod
     def low(self) -> float:
         """Low price of the quote."""
-        return float(self._l)
 
     @property
+    @abstractmethod
     def close(self) -> float:
         """Close price of the quote."""
-        return float(self._c)
 
     @property
+    @abstractmethod
     def vol(self) -> float:
         """Volume of the quote."""
-        return float(self._v)
 
     @property
     def hl2(self) -> float:
         """The average of the high and low prices."""
-        return float((self._h + self._l) / 2)
+        return (self.high + self.low) / 2
 
     @property
     def hlc3(self) -> float:
         """The average of the high, low, and close prices."""
-        return float((self._h + self._l + self._c) / 3)
+        return (self.high + self.low + self.close) / 3
 
     @property
     def oc2(self) -> float:
         """The average of the open and close prices."""
-        return float((self._o + self._c) / 2)
+        return (self.open + self.close) / 2
 
     @property
     def ohl3(self) -> float:
         """The average of the open, high, and low prices."""
-        return float((self._o + self._h + self._l) / 3)
+        return (self.open + self.high + self.low) / 3
 
     @property
     def ohlc4(self) -> float:
         """The average of the open, high, low, and close prices."""
-        return float((self._o + self._h + self._l + self._c) / 4)
+        return (self.open + self.high + self.low + self.close) / 4
 
     @property
     def hlc(self) -> Hlc:
@@ -124,98 +117,88 @@ class Quote:
     def open_with_vol(self) -> PriceDataWithVol:
         """The open price with volume."""
         return PriceDataWithVol(
-            value=self.open, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.open, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def high_with_vol(self) -> PriceDataWithVol:
         """The high price with volume."""
         return PriceDataWithVol(
-            value=self.high, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.high, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def low_with_vol(self) -> PriceDataWithVol:
         """The low price with volume."""
         return PriceDataWithVol(
-            value=self.low, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.low, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def close_with_vol(self) -> PriceDataWithVol:
         """The close price with volume."""
         return PriceDataWithVol(
-            value=self.close, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.close, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def hl2_with_vol(self) -> PriceDataWithVol:
         """The hl2 price with volume."""
         return PriceDataWithVol(
-            value=self.hl2, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.hl2, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def hlc3_with_vol(self) -> PriceDataWithVol:
         """The hlc3 price with volume."""
         return PriceDataWithVol(
-            value=self.hlc3, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.hlc3, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def oc2_with_vol(self) -> PriceDataWithVol:
         """The oc2 price with volume."""
         return PriceDataWithVol(
-            value=self.oc2, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.oc2, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def ohl3_with_vol(self) -> PriceDataWithVol:
         """The ohl3 price with volume."""
         return PriceDataWithVol(
-            value=self.ohl3, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.ohl3, time_stamp=self.time_stamp, volume=self.vol
         )
 
     @property
     def ohlc4_with_vol(self) -> PriceDataWithVol:
         """The ohlc4 price with volume."""
         return PriceDataWithVol(
-            value=self.ohlc4, time_stamp=self.time.isoformat(), volume=self.vol
+            value=self.ohlc4, time_stamp=self.time_stamp, volume=self.vol
         )
 
-    @classmethod
-    def empty(cls) -> Self:
-        """Return an empty quote."""
-        return cls(time=datetime.min, o=0, h=0, l=0, c=0, v=0)
-
-    @property
-    def is_empty(self) -> bool:
-        """Whether or not the quote is empty."""
-        return self.time == datetime.min
-
     def to_price_data(self, candle_part: CandlePart) -> PriceData:  # type: ignore
         """Convert the Quote to PriceData."""
         match candle_part:
             case candle_part.HIGH:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.high)
+                return PriceData(time_stamp=self.time_stamp, value=self.high)
             case candle_part.LOW:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.low)
+                return PriceData(time_stamp=self.time_stamp, value=self.low)
             case candle_part.CLOSE:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.close)
+                return PriceData(time_stamp=self.time_stamp, value=self.close)
             case candle_part.OPEN:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.open)
+                return PriceData(time_stamp=self.time_stamp, value=self.open)
             case candle_part.VOLUME:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.vol)
+                return PriceData(time_stamp=self.time_stamp, value=self.vol)
             case candle_part.HL2:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.hl2)
+                return PriceData(time_stamp=self.time_stamp, value=self.hl2)
             case candle_part.HLC3:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.hlc3)
+                return PriceData(time_stamp=self.time_stamp, value=self.hlc3)
             case candle_part.OC2:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.oc2)
+                return PriceData(time_stamp=self.time_stamp, value=self.oc2)
             case candle_part.OHL3:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.ohl3)
+                return PriceData(time_stamp=self.time_stamp, value=self.ohl3)
             case candle_part.OHLC4:
-                return PriceData(time_stamp=self.time.isoformat(), value=self.ohlc4)
+                return PriceData(time_stamp=self.time_stamp, value=self.ohlc4)
 
     def to_price_data_with_vol(self, candle_part: CandlePart) -> PriceDataWithVol:
         """converts Quote to PriceDataWithVol"""
@@ -224,6 +207,121 @@ class Quote:
             value=price_data.value, time_stamp=price_data.time_stamp, volume=self.vol
         )
 
+
+@dataclass(slots=True)
+class Quote(_QuoteParts):
+    """Represents a quote for a financial asset.
+
+    Prices are stored as floats, derived prices such as `hlc3` are computed
+    with float math the first time they are read and cached for the bar.
+    Use `DecimalQuote` when the derived prices need exact decimal arithmetic.
+    """
+
+    time: datetime
+    o: InitVar[float]
+    h: InitVar[float]
+    l: InitVar[float]
+    c: InitVar[float]
+    v: InitVar[float]
+    _o: float = field(init=False, repr=False, compare=False)
+    _h: float = field(init=False, repr=False, compare=False)
+    _l: float = field(init=False, repr=False, compare=False)
+    _c: float = field(init=False, repr=False, compare=False)
+    _v: float = field(init=False, repr=False, compare=False)
+    _hl2: float | None = field(default=None, init=False, repr=False, compare=False)
+    _hlc3: float | None = field(default=None, init=False, repr=False, compare=False)
+    _oc2: float | None = field(default=None, init=False, repr=False, compare=False)
+    _ohl3: float | None = field(default=None, init=False, repr=False, compare=False)
+    _ohlc4: float | None = field(default=None, init=False, repr=False, compare=False)
+    _iso: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(
+        self, o: float, h: float, l: float, c: float, v: float
+    ) -> None:  # noqa: E741
+        # pylint: disable=invalid-name
+        self._o = float(o)
+        self._h = float(h)
+        self._l = float(l)
+        self._c = float(c)
+        self._v = float(v)
+
+    @property
+    def open(self) -> float:
+        """Open price of the quote."""
+        return self._o
+
+    @property
+    def high(self) -> float:
+        """High price of the quote."""
+        return self._h
+
+    @property
+    def low(self) -> float:
+        """Low price of the quote."""
+        return self._l
+
+    @property
+    def close(self) -> float:
+        """Close price of the quote."""
+        return self._c
+
+    @property
+    def vol(self) -> float:
+        """Volume of the quote."""
+        return self._v
+
+    @property
+    def hl2(self) -> float:
+        """The average of the high and low prices."""
+        if self._hl2 is None:
+            self._hl2 = (self._h + self._l) / 2
+        return self._hl2
+
+    @property
+    def hlc3(self) -> float:
+        """The average of the high, low, and close prices."""
+        if self._hlc3 is None:
+            self._hlc3 = (self._h + self._l + self._c) / 3
+        return self._hlc3
+
+    @property
+    def oc2(self) -> float:
+        """The average of the open and close prices."""
+        if self._oc2 is None:
+            self._oc2 = (self._o + self._c) / 2
+        return self._oc2
+
+    @property
+    def ohl3(self) -> float:
+        """The average of the open, high, and low prices."""
+        if self._ohl3 is None:
+            self._ohl3 = (self._o + self._h + self._l) / 3
+        return self._ohl3
+
+    @property
+    def ohlc4(self) -> float:
+        """The average of the open, high, low, and close prices."""
+        if self._ohlc4 is None:
+            self._ohlc4 = (self._o + self._h + self._l + self._c) / 4
+        return self._ohlc4
+
+    @property
+    def time_stamp(self) -> str:
+        """The time of the quote in ISO 8601 format."""
+        if self._iso is None:
+            self._iso = self.time.isoformat()
+        return self._iso
+
+    @classmethod
+    def empty(cls) -> Self:
+        """Return an empty quote."""
+        return cls(time=datetime.min, o=0, h=0, l=0, c=0, v=0)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether or not the quote is empty."""
+        return self.time == datetime.min
+
     @classmethod
     def create(
         cls,
@@ -250,3 +348,68 @@ class Quote:
                 low: {low}, or close: {close} price"""
             )
         return cls(time, open_, high, low, close, volume)
+
+
+@dataclass(slots=True)
+class DecimalQuote(Quote):
+    """A quote that keeps its prices as `Decimal`.
+
+    Derived prices are computed with decimal arithmetic before converting to
+    float, which is slower than `Quote` but avoids binary rounding in the sums.
+    """
+
+    _dec: tuple[Decimal, Decimal, Decimal, Decimal, Decimal] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(
+        self, o: float, h: float, l: float, c: float, v: float
+    ) -> None:  # noqa: E741
+        # pylint: disable=invalid-name
+        self._dec = (Decimal(o), Decimal(h), Decimal(l), Decimal(c), Decimal(v))
+        self._o, self._h, self._l, self._c, self._v = (float(d) for d in self._dec)
+
+    @property
+    def decimals(self) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal]:
+        """The open, high, low, close and volume as `Decimal`."""
+        return self._dec
+
+    @property
+    def hl2(self) -> float:
+        """The average of the high and low prices."""
+        if self._hl2 is None:
+            _, h, l, _, _ = self._dec  # noqa: E741
+            self._hl2 = float((h + l) / 2)
+        return self._hl2
+
+    @property
+    def hlc3(self) -> float:
+        """The average of the high, low, and close prices."""
+        if self._hlc3 is None:
+            _, h, l, c, _ = self._dec  # noqa: E741
+            self._hlc3 = float((h + l + c) / 3)
+        return self._hlc3
+
+    @property
+    def oc2(self) -> float:
+        """The average of the open and close prices."""
+        if self._oc2 is None:
+            o, _, _, c, _ = self._dec
+            self._oc2 = float((o + c) / 2)
+        return self._oc2
+
+    @property
+    def ohl3(self) -> float:
+        """The average of the open, high, and low prices."""
+        if self._ohl3 is None:
+            o, h, l, _, _ = self._dec  # noqa: E741
+            self._ohl3 = float((o + h + l) / 3)
+        return self._ohl3
+
+    @property
+    def ohlc4(self) -> float:
+        """The average of the open, high, low, and close prices."""
+        if self._ohlc4 is None:
+            o, h, l, c, _ = self._dec  # noqa: E741
+            self._ohlc4 = float((o + h + l + c) / 4)
+        return self._ohlc4
@@ -3,18 +3,77 @@
 # license that can be found in the LICENSE file.
 
 
-from collections.abc import Callable
+from math import isnan, nan
 
-from pure_ta._sma import get_sma
+from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._rolling_sum import CompensatedSum, compensated_add
 from pure_ta._types import PriceDataWithVol
 
 
-def get_vwma(length: int = 20) -> Callable[[PriceDataWithVol], float]:
-    """Returns a function that calculates the volume weighted moving average."""
-    sma1 = get_sma(length=length)
-    sma2 = get_sma(length=length)
+def get_vwma(length: int = 20) -> Indicator[PriceDataWithVol, float]:
+    """Returns a function that calculates the volume weighted moving average.
+
+    Price * volume and volume are interleaved in one ring buffer of pairs, and
+    both running sums are updated in a single O(1) step.
+    """
+    window = CircularBuf(size=2 * length)
+    pv_sum = CompensatedSum()
+    vol_sum = CompensatedSum()
+    nan_count = 0
 
     def vwma_func(data: PriceDataWithVol) -> float:
-        return sma1(data.value * data.volume) / sma2(data.volume)
+        nonlocal nan_count
+        pv = data.value * data.volume
+        vol = data.volume
+
+        is_full = window.is_full
+        old_pv = window.put(pv)
+        old_vol = window.put(vol)
+
+        if is_full:
+            if isnan(old_pv):
+                nan_count -= 1
+            else:
+                pv_sum.add(-old_pv)
+                vol_sum.add(-old_vol)
+
+        if isnan(pv):
+            nan_count += 1
+        else:
+            pv_sum.add(pv)
+            vol_sum.add(vol)
+
+        if not window.is_full or nan_count:
+            return nan
+
+        total_vol = vol_sum.total
+
+        return pv_sum.total / total_vol if total_vol != 0 else nan
+
+    def vwma_preview(data: PriceDataWithVol) -> float:
+        pv = data.value * data.volume
+        vol = data.volume
+        pv_total, pv_comp = pv_sum.parts
+        vol_total, vol_comp = vol_sum.parts
+        count = nan_count
+
+        if window.is_full:
+            old_pv = window[0]
+            if isnan(old_pv):
+                count -= 1
+            else:
+                pv_total, pv_comp = compensated_add(pv_total, pv_comp, -old_pv)
+                vol_total, vol_comp = compensated_add(vol_total, vol_comp, -window[1])
+        elif window.filled_size + 2 < window.length:
+            return nan
+
+        if isnan(pv) or count:
+            return nan
+        pv_total, pv_comp = compensated_add(pv_total, pv_comp, pv)
+        vol_total, vol_comp = compensated_add(vol_total, vol_comp, vol)
+        total_vol = vol_total + vol_comp
+
+        return (pv_total + pv_comp) / total_vol if total_vol != 0 else nan
 
-    return vwma_func
+    return series_indicator(vwma_func, warmup=length, preview=vwma_preview)
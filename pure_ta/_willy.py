@@ -2,24 +2,32 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 import math
-from collections.abc import Callable
 
-from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._sliding_extremum import SlidingMax, SlidingMin
 
 
-def get_willy(length: int = 6) -> Callable[[float], float]:
+def get_willy(length: int = 6) -> Indicator[float, float]:
     """Returns a function that calculates the WILLY."""
-    buf = CircularBuf(size=length)
+    highest = SlidingMax(size=length)
+    lowest = SlidingMin(size=length)
 
     def willy_func(data: float) -> float:
-        buf.put(data)
+        highest.put(data)
+        lowest.put(data)
 
-        if buf.is_full:
-            high = max(buf.values)
-            low = min(buf.values)
+        if highest.is_full:
+            high = highest.value
+            low = lowest.value
 
             return 60 * (data - high) / (high - low) + 80
         else:
             return math.nan
 
-    return willy_func
+    def willy_preview(data: float) -> float:
+        # NaN until the window would be full, like the update.
+        high = highest.preview(data)
+        low = lowest.preview(data)
+        return 60 * (data - high) / (high - low) + 80
+
+    return series_indicator(willy_func, warmup=length, preview=willy_preview)
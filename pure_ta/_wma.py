@@ -1,28 +1,83 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from collections.abc import Callable
-from math import nan
+from math import fsum, isnan, nan
 
 from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
 
 
-def get_wma(length: int = 15) -> Callable[[float], float]:
+def get_wma(
+    length: int = 15, resync_every: int | None = None
+) -> Indicator[float, float]:
+    """Returns a function that calculates the weighted moving average.
+
+    A running plain sum and a running weighted sum are updated as values enter
+    and leave the window, so each update is O(1). When the window slides every
+    weight drops by one, which is the same as subtracting the plain sum.
+    """
     buf = CircularBuf(size=length)
     divisor = float(length) * (length + 1) / 2.0
+    sum_ = 0.0
+    weighted_sum = 0.0
+    nan_count = 0
+    evicted = 0
+
+    def resync() -> None:
+        nonlocal sum_, weighted_sum, evicted
+        values = [0.0 if isnan(v) else v for v in buf.ordered_values]
+        sum_ = fsum(values)
+        weighted_sum = fsum(v * (i + 1) for i, v in enumerate(values))
+        evicted = 0
 
     def wma_func(data: float) -> float:
-        buf.put(data)
+        nonlocal sum_, weighted_sum, nan_count, evicted
+        # NaN values hold a slot in the window but count as zero in the sums.
+        value = data
+        if isnan(data):
+            value = 0.0
+            nan_count += 1
 
         if buf.is_full:
-            sum_ = 0.0
-            ordered_values = list(buf.ordered_values)[::-1]  # reverse the order
-            for i in range(length):
-                weight = length - i
-                sum_ += ordered_values[i] * weight
+            old = buf.first
+            if isnan(old):
+                nan_count -= 1
+                old = 0.0
+            weighted_sum += length * value - sum_
+            sum_ += value - old
+            evicted += 1
+        else:
+            weighted_sum += (buf.filled_size + 1) * value
+            sum_ += value
+
+        buf.put(data)
+
+        if resync_every is not None and evicted >= resync_every:
+            resync()
 
-            return sum_ / divisor
+        if buf.is_full and not nan_count:
+            return weighted_sum / divisor
         else:
             return nan
 
-    return wma_func
+    def wma_preview(data: float) -> float:
+        count = nan_count + isnan(data)
+        value = 0.0 if isnan(data) else data
+
+        if buf.is_full:
+            if isnan(buf.first):
+                count -= 1
+            if resync_every is not None and evicted + 1 >= resync_every:
+                values = [0.0 if isnan(v) else v for v in buf.ordered_values][1:]
+                values.append(value)
+                weighted = fsum(v * (i + 1) for i, v in enumerate(values))
+            else:
+                weighted = weighted_sum + (length * value - sum_)
+        elif buf.filled_size + 1 == length:
+            weighted = weighted_sum + length * value
+        else:
+            return nan
+
+        return nan if count else weighted / divisor
+
+    return series_indicator(wma_func, warmup=length, preview=wma_preview)
@@ -3,28 +3,34 @@
 # license that can be found in the LICENSE file.
 
 import math
-from collections.abc import Callable
 
-from pure_ta._circular_buf import CircularBuf
+from pure_ta._indicator import Indicator, series_indicator
+from pure_ta._sliding_extremum import SlidingMax, SlidingMin
 from pure_ta._types import Hlc
 
 
-def get_wpr(length: int = 14) -> Callable[[Hlc], float]:
+def get_wpr(length: int = 14) -> Indicator[Hlc, float]:
     """Returns a function that calculates the Williams %R."""
-    highest_buffer = CircularBuf(size=length)
-    lowest_buffer = CircularBuf(size=length)
+    highest = SlidingMax(size=length)
+    lowest = SlidingMin(size=length)
 
     def wpr_func(data: Hlc) -> float:
-        highest_buffer.put(data.high)
-        lowest_buffer.put(data.low)
+        highest.put(data.high)
+        lowest.put(data.low)
         last_close = data.close
 
-        if highest_buffer.is_full and lowest_buffer.is_full:
-            highest_high = max(highest_buffer.values)
-            lowest_low = min(lowest_buffer.values)
+        if highest.is_full:
+            highest_high = highest.value
+            lowest_low = lowest.value
 
             return -100 * (highest_high - last_close) / (highest_high - lowest_low)
         else:
             return math.nan
 
-    return wpr_func
+    def wpr_preview(data: Hlc) -> float:
+        # NaN until the window would be full, like the update.
+        highest_high = highest.preview(data.high)
+        lowest_low = lowest.preview(data.low)
+        return -100 * (highest_high - data.close) / (highest_high - lowest_low)
+
+    return series_indicator(wpr_func, warmup=length, preview=wpr_preview)
@@ -0,0 +1,22 @@
+"""Benchmarks of the `ta` indicators over the bundled datasets.
+
+Run every indicator in streaming and batch modes and print per-bar latency
+and throughput, optionally saving a baseline or comparing against one:
+
+    python -m pure_ta.bench --save baseline.json
+    python -m pure_ta.bench --compare baseline.json
+"""
+from pure_ta.bench._bench import (
+    BASELINE_VERSION,  # type: ignore # noqa: F401
+    BATCH_CHUNK,  # type: ignore # noqa: F401
+    DATA_DIR,  # type: ignore # noqa: F401
+    DATASETS,  # type: ignore # noqa: F401
+    Measurement,  # type: ignore # noqa: F401
+    compare,  # type: ignore # noqa: F401
+    indicators,  # type: ignore # noqa: F401
+    load,  # type: ignore # noqa: F401
+    load_quotes,  # type: ignore # noqa: F401
+    percentile,  # type: ignore # noqa: F401
+    run,  # type: ignore # noqa: F401
+    save,  # type: ignore # noqa: F401
+)
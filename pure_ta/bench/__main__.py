@@ -0,0 +1,106 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Command line entry point of `python -m pure_ta.bench`."""
+import argparse
+import sys
+from pathlib import Path
+
+from pure_ta.bench._bench import (
+    DATA_DIR,
+    DATASETS,
+    Measurement,
+    compare,
+    indicators,
+    load,
+    load_quotes,
+    run,
+    save,
+)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m pure_ta.bench",
+        description="Time the pure_ta indicators over the bundled datasets.",
+    )
+    parser.add_argument(
+        "indicators", nargs="*", help="ta functions to time, all of them by default"
+    )
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=DATA_DIR,
+        help="directory of the csv files, tests/data of a source checkout",
+    )
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        default=list(DATASETS),
+        help="csv file names without extension",
+    )
+    parser.add_argument(
+        "--mode", choices=["streaming", "batch"], help="time only one mode"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="fresh indicators per mode"
+    )
+    parser.add_argument("--save", type=Path, help="write a baseline JSON file")
+    parser.add_argument("--compare", type=Path, help="a baseline JSON file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="slowdown of the median allowed by --compare, 0.1 is 10%%",
+    )
+    return parser
+
+
+def _row(m: Measurement, ratio: str = "") -> str:
+    return (
+        f"{m.indicator:<14}{m.mode:<11}{m.dataset:<10}{m.bars:>7}"
+        f"{m.median_ns:>12.0f}{m.p99_ns:>12.0f}{m.bars_per_sec:>14,.0f}{ratio:>9}"
+    ).rstrip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, returning 1 if --compare found a regression."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if not args.data.is_dir():
+        parser.error(
+            f"no data directory {args.data}, the datasets are not installed with "
+            "the package: pass --data with the tests/data directory of a checkout"
+        )
+    datasets = {name: load_quotes(args.data / f"{name}.csv") for name in args.datasets}
+    baseline = load(args.compare) if args.compare else {}
+
+    header = f"{'indicator':<14}{'mode':<11}{'dataset':<10}{'bars':>7}"
+    header += f"{'median ns':>12}{'p99 ns':>12}{'bars/sec':>14}"
+    print(header + (f"{'vs base':>9}" if baseline else ""))
+
+    modes = [args.mode] if args.mode else ["streaming", "batch"]
+    measurements = []
+    # one indicator at a time, so results show up as they are measured.
+    for name in args.indicators or list(indicators()):
+        for m in run(datasets, [name], modes, args.repeat):
+            old = baseline.get(m.key)
+            ratio = f"{m.median_ns / old.median_ns:.2f}x" if old else ""
+            print(_row(m, ratio), flush=True)
+            measurements.append(m)
+
+    if args.save:
+        save(measurements, args.save)
+        print(f"saved {len(measurements)} measurements to {args.save}")
+
+    regressions = compare(measurements, baseline, args.tolerance)
+    for new, old in regressions:
+        print(
+            f"regression: {new.key} {old.median_ns:.0f} -> {new.median_ns:.0f} ns",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Timing of the `ta` indicators and baseline files to compare them."""
+import inspect
+import json
+import platform
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from math import ceil
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+from typing import Any, get_args
+
+from pure_ta import ta
+from pure_ta._types import Hlc, PriceDataWithVol, Quote
+
+BASELINE_VERSION = 1
+
+DATASETS = ("longest", "longish", "spx", "bitcoin")
+
+# the data in a source checkout, next to the package. It is not installed
+# with the package, so elsewhere the csv files have to be passed with --data.
+DATA_DIR = Path(__file__).resolve().parents[2] / "tests" / "data"
+
+# the bars per `update_many` call timed in batch mode.
+BATCH_CHUNK = 512
+
+# how each input type of an indicator is read from a quote.
+_SOURCES: dict[Any, Callable[[Quote], Any]] = {
+    float: lambda q: q.close,
+    Hlc: lambda q: q.hlc,
+    PriceDataWithVol: lambda q: q.close_with_vol,
+    Quote: lambda q: q,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    """The timing of one indicator in one mode over one dataset.
+
+    Latencies are in nanoseconds per bar. In streaming mode they are the
+    times of single updates, in batch mode the time of an `update_many` call
+    over `BATCH_CHUNK` bars divided by its number of bars.
+    """
+
+    indicator: str
+    mode: str
+    dataset: str
+    bars: int
+    median_ns: float
+    p99_ns: float
+    bars_per_sec: float
+
+    @property
+    def key(self) -> str:
+        """The name of the measurement in a baseline."""
+        return f"{self.indicator}/{self.mode}/{self.dataset}"
+
+
+def _parse_time(text: str) -> datetime:
+    if "/" in text:
+        return datetime.strptime(text, "%m/%d/%Y")
+    return datetime.fromisoformat(text)
+
+
+def load_quotes(path: str | Path) -> list[Quote]:
+    """Read quotes from a csv file with time, open, high, low, close, volume."""
+    quotes = []
+    with open(path, encoding="utf-8-sig") as file:
+        next(file)  # Skip the header row
+        for line in file:
+            row = line.split(",")
+            quotes.append(
+                Quote(
+                    time=_parse_time(row[0]),
+                    o=float(row[1]),
+                    h=float(row[2]),
+                    l=float(row[3]),
+                    c=float(row[4]),
+                    v=float(row[5]),
+                )
+            )
+    return quotes
+
+
+def indicators() -> dict[str, tuple[Callable[[], Any], Callable[[Quote], Any]]]:
+    """Every public `ta` factory with default parameters and its input.
+
+    The input is read from the quotes according to the type the indicator
+    is annotated to take.
+    """
+    found = {}
+    for name, factory in inspect.getmembers(ta, inspect.isfunction):
+        if name.startswith("_") or factory.__module__ != ta.__name__:
+            continue
+        kind = get_args(inspect.signature(factory).return_annotation)[0]
+        found[name] = (factory, _SOURCES[kind])
+    return found
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """The nearest rank percentile of sorted `values`, for `q` in (0, 100]."""
+    return values[max(ceil(len(values) * q / 100) - 1, 0)]
+
+
+def _timer_overhead() -> int:
+    clock = perf_counter_ns
+    samples = []
+    for _ in range(1000):
+        start = clock()
+        samples.append(clock() - start)
+    return int(median(samples))
+
+
+def time_streaming(
+    factory: Callable[[], Any], data: Sequence[Any], repeat: int
+) -> list[int]:
+    """The time of every update, in ns, over `repeat` fresh indicators.
+
+    The overhead of reading the clock is subtracted.
+    """
+    clock = perf_counter_ns
+    overhead = _timer_overhead()
+    samples: list[int] = []
+    append = samples.append
+    for _ in range(repeat):
+        fn = factory()
+        for value in data:
+            start = clock()
+            fn(value)
+            append(clock() - start)
+    return [max(sample - overhead, 0) for sample in samples]
+
+
+def time_batch(
+    factory: Callable[[], Any],
+    data: Sequence[Any],
+    repeat: int,
+    chunk: int = BATCH_CHUNK,
+) -> list[float]:
+    """Per bar times of `update_many` calls, in ns, over `repeat` fresh indicators.
+
+    Each indicator is fed all of `data` in calls of `chunk` bars, each of
+    which is one sample, so there are enough of them for a percentile.
+    """
+    clock = perf_counter_ns
+    samples = []
+    for _ in range(repeat):
+        fn = factory()
+        for start in range(0, len(data), chunk):
+            part = data[start : start + chunk]
+            begin = clock()
+            fn.update_many(part)
+            samples.append((clock() - begin) / len(part))
+    return samples
+
+
+def _measure(
+    name: str, mode: str, dataset: str, bars: int, per_bar: list[float]
+) -> Measurement:
+    per_bar.sort()
+    mid = median(per_bar)
+    return Measurement(
+        indicator=name,
+        mode=mode,
+        dataset=dataset,
+        bars=bars,
+        median_ns=mid,
+        p99_ns=percentile(per_bar, 99),
+        bars_per_sec=1e9 / mid if mid else float("inf"),
+    )
+
+
+def run(
+    datasets: dict[str, list[Quote]],
+    names: Iterable[str] | None = None,
+    modes: Iterable[str] = ("streaming", "batch"),
+    repeat: int = 3,
+) -> list[Measurement]:
+    """Time indicators over every dataset.
+
+    Args:
+        datasets: The quotes of each dataset, by name.
+        names: The `ta` factories to time, all of them by default.
+        modes: "streaming" times every update, "batch" times `update_many`.
+        repeat: The number of fresh indicators run in each mode.
+
+    Returns:
+        One measurement per indicator, mode and dataset.
+    """
+    available = indicators()
+    selected = list(available) if names is None else list(names)
+    unknown = set(selected) - set(available)
+    if unknown:
+        raise ValueError(f"unknown indicators: {', '.join(sorted(unknown))}")
+
+    results = []
+    for name in selected:
+        factory, source = available[name]
+        for dataset, quotes in datasets.items():
+            data = [source(q) for q in quotes]
+            bars = len(data)
+            for mode in modes:
+                if mode == "streaming":
+                    per_bar = [float(t) for t in time_streaming(factory, data, repeat)]
+                elif mode == "batch":
+                    per_bar = time_batch(factory, data, repeat)
+                else:
+                    raise ValueError(f"unknown mode {mode}")
+                results.append(_measure(name, mode, dataset, bars, per_bar))
+    return results
+
+
+def save(measurements: Iterable[Measurement], path: str | Path) -> None:
+    """Write measurements to a baseline JSON file."""
+    baseline = {
+        "version": BASELINE_VERSION,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "results": {m.key: asdict(m) for m in measurements},
+    }
+    Path(path).write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def load(path: str | Path) -> dict[str, Measurement]:
+    """Read the measurements of a baseline JSON file, by key.
+
+    Raises:
+        ValueError: If the file was written by an unsupported version.
+    """
+    baseline = json.loads(Path(path).read_text(encoding="utf-8"))
+    version = baseline.get("version")
+    if version != BASELINE_VERSION:
+        raise ValueError(f"unsupported baseline version {version}")
+    return {key: Measurement(**value) for key, value in baseline["results"].items()}
+
+
+def compare(
+    measurements: Iterable[Measurement],
+    baseline: dict[str, Measurement],
+    tolerance: float = 0.1,
+) -> list[tuple[Measurement, Measurement]]:
+    """The measurements with a median more than `tolerance` above the baseline.
+
+    Returns:
+        Pairs of the new measurement and its baseline, for each regression.
+    """
+    regressions = []
+    for m in measurements:
+        old = baseline.get(m.key)
+        if old is not None and m.median_ns > old.median_ns * (1 + tolerance):
+            regressions.append((m, old))
+    return regressions
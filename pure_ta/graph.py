@@ -0,0 +1,366 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Declarative indicator graphs with shared sub-indicators.
+
+Indicators are declared as `Node`s, and nodes compare equal when they have
+the same function, parameters and inputs. An `IndicatorGraph` interns every
+node it is given, so a sub-indicator needed by several subscriptions is
+created once and computed once per bar.
+
+    close = graph.source("close")
+    g = graph.IndicatorGraph()
+    g.subscribe("bb", graph.bb(close, length=13))
+    g.subscribe("bbwp", graph.bbwp(close, length=13))
+    for quote in quotes:
+        results = g.update(quote)  # one 13 bar window of the close serves both
+
+The composite builders in this module (`atr`, `atr_sl`, `bb`, `bbw`, `bbwp`
+and `tsi`) are declared in terms of their parts, so those parts are shared
+with anything else on the same graph. Their results match the `pure_ta.ta`
+versions to within floating point tolerance.
+"""
+import ast
+import inspect
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cache, partial
+from math import nan
+from operator import attrgetter
+from typing import Any
+
+from pure_ta import ta
+from pure_ta._atr_sl import AtrSlResult
+from pure_ta._bb import BollingerResult
+from pure_ta._enum_types import AtrSlMaType
+from pure_ta._indicator import Indicator, indicator, series_indicator
+from pure_ta._phx import PhoenixResult
+from pure_ta._rolling_moments import RollingMoments
+from pure_ta._tsi import TsiResult
+from pure_ta._types import Hlc
+
+_SOURCE = "source"
+_INDICATOR = "indicator"
+_COMBINE = "combine"
+_EXPR = "expr"
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    """One indicator in a graph, identified by what it computes.
+
+    Build nodes with `source`, `node`, `combine` and `expr` rather than
+    directly.
+    """
+
+    kind: str
+    fn: Any
+    inputs: tuple["Node", ...] = ()
+    params: tuple[tuple[str, Any], ...] = ()
+
+
+def _bind(fn: Callable[..., Any], params: dict[str, Any]) -> tuple:
+    """Return `params` with the defaults of `fn` filled in, as a sorted tuple.
+
+    This makes `node(ta.ema, close)` and `node(ta.ema, close, length=20)` the
+    same node.
+    """
+    try:
+        signature = inspect.signature(fn)
+    except (TypeError, ValueError):
+        return tuple(sorted(params.items()))
+
+    kwargs = {
+        name: p.default
+        for name, p in signature.parameters.items()
+        if p.kind is p.KEYWORD_ONLY or p.kind is p.POSITIONAL_OR_KEYWORD
+        if p.default is not p.empty
+    }
+    kwargs.update(params)
+    return tuple(sorted(kwargs.items()))
+
+
+def source(name: str) -> Node:
+    """A value read from each bar, such as "close" or "hlc" of a `Quote`."""
+    return Node(kind=_SOURCE, fn=name)
+
+
+def node(factory: Callable[..., Any], data: Node, **params: Any) -> Node:
+    """A streaming indicator created by `factory(**params)` and fed `data`."""
+    return Node(
+        kind=_INDICATOR, fn=factory, inputs=(data,), params=_bind(factory, params)
+    )
+
+
+def combine(fn: Callable[..., Any], *inputs: Node, **params: Any) -> Node:
+    """A stateless `fn(*inputs, **params)` of other nodes, computed each bar."""
+    return Node(kind=_COMBINE, fn=fn, inputs=inputs, params=_bind(fn, params))
+
+
+# the syntax allowed in an `expr`: arithmetic, comparisons and conditionals.
+_EXPR_SYNTAX = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.IfExp,
+    ast.Constant,
+    ast.Name,
+    ast.Call,
+    ast.Load,
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+)
+_EXPR_GLOBALS = {"__builtins__": {}, "nan": nan, "abs": abs}
+
+
+def _check_expression(template: str, arity: int) -> str:
+    """Return the template with its inputs named, if it is a plain expression.
+
+    Raises:
+        ValueError: If the template uses anything other than arithmetic,
+            comparisons, conditionals, numbers, `nan`, `abs` and its inputs.
+    """
+    names = [f"x{i}" for i in range(arity)]
+    try:
+        code = template.format(*names)
+        tree = ast.parse(code, mode="eval")
+    except (IndexError, KeyError, SyntaxError) as e:
+        raise ValueError(f"invalid expression {template!r}: {e}") from None
+
+    allowed = {*names, *_EXPR_GLOBALS} - {"__builtins__"}
+    for item in ast.walk(tree):
+        if (
+            not isinstance(item, _EXPR_SYNTAX)
+            or isinstance(item, ast.Name)
+            and item.id not in allowed
+            or isinstance(item, ast.Constant)
+            and not isinstance(item.value, int | float)
+            or isinstance(item, ast.Call)
+            and (
+                not isinstance(item.func, ast.Name)
+                or item.func.id != "abs"
+                or item.keywords
+            )
+        ):
+            raise ValueError(f"unsupported syntax in expression {template!r}")
+    return code
+
+
+def expr(template: str, *inputs: Node) -> Node:
+    """An arithmetic expression of other nodes, such as "({0} + {1}) / 2".
+
+    The inputs are substituted for `{0}`, `{1}`... Unlike `combine`, a pipeline
+    compiler can inline expressions instead of calling a function. Only
+    arithmetic, comparisons, conditionals, numbers, `nan` and `abs` are
+    allowed, so a template can not run arbitrary code.
+
+    Raises:
+        ValueError: If the template is not such an expression.
+    """
+    _check_expression(template, len(inputs))
+    return Node(kind=_EXPR, fn=template, inputs=inputs)
+
+
+@cache
+def _expression(template: str, arity: int) -> Callable[..., Any]:
+    names = [f"x{i}" for i in range(arity)]
+    code = f"lambda {', '.join(names)}: {_check_expression(template, arity)}"
+    return eval(code, dict(_EXPR_GLOBALS))  # noqa: S307
+
+
+CLOSE = source("close")
+HLC = source("hlc")
+
+
+class IndicatorGraph:
+    """Streams every subscribed node, computing each distinct node once per bar.
+
+    Nodes can be subscribed at any time. Nodes already in the graph keep their
+    state, and only the new ones start from scratch.
+    """
+
+    __slots__ = ("_slots", "_steps", "_values", "_outputs")
+
+    def __init__(self, outputs: Mapping[str, Node] | None = None):
+        """Subscribe every node in `outputs` under its name."""
+        self._slots: dict[Node, int] = {}
+        # one (function, input slots) per distinct node, in dependency order.
+        self._steps: list[tuple[Callable[..., Any], tuple[int, ...]]] = []
+        self._values: list[Any] = [None]  # slot 0 holds the bar itself
+        self._outputs: dict[str, int] = {}
+        for name, output in (outputs or {}).items():
+            self.subscribe(name, output)
+
+    def __len__(self) -> int:
+        """The number of distinct nodes computed per bar."""
+        return len(self._steps)
+
+    def _intern(self, item: Node) -> int:
+        slot = self._slots.get(item)
+        if slot is not None:
+            return slot
+
+        args = tuple(self._intern(i) for i in item.inputs)
+        params = dict(item.params)
+        if item.kind == _SOURCE:
+            fn: Callable[..., Any] = attrgetter(item.fn)
+            args = (0,)
+        elif item.kind == _INDICATOR:
+            fn = item.fn(**params)
+        elif item.kind == _EXPR:
+            fn = _expression(item.fn, len(args))
+        else:
+            fn = partial(item.fn, **params) if params else item.fn
+
+        self._steps.append((fn, args))
+        self._values.append(None)
+        slot = self._slots[item] = len(self._steps)
+        return slot
+
+    def subscribe(self, name: str, output: Node) -> None:
+        """Add `output` to the results of every update under `name`."""
+        self._outputs[name] = self._intern(output)
+
+    def update(self, bar: Any) -> dict[str, Any]:
+        """Advance the graph by one bar and return every subscribed result."""
+        values = self._values
+        values[0] = bar
+        slot = 1
+        for fn, args in self._steps:
+            if len(args) == 1:
+                values[slot] = fn(values[args[0]])
+            else:
+                values[slot] = fn(*[values[i] for i in args])
+            slot += 1
+
+        return {name: values[i] for name, i in self._outputs.items()}
+
+
+_MA_FACTORIES: dict[AtrSlMaType, Callable[..., Any]] = {
+    AtrSlMaType.SMA: ta.sma,
+    AtrSlMaType.WMA: ta.wma,
+    AtrSlMaType.EMA: ta.ema,
+    AtrSlMaType.RMA: ta.rma,
+}
+
+
+def tr(data: Node = HLC, handle_na: bool = True) -> Node:
+    """The True Range of an Hlc node."""
+    return node(ta.tr, data, handle_na=handle_na)
+
+
+def atr(data: Node = HLC, length: int = 14) -> Node:
+    """The Average True Range, an RMA of the True Range."""
+    return node(ta.rma, tr(data), length=length)
+
+
+def _atr_sl(data: Hlc, ma: float, multi: float) -> AtrSlResult:
+    return AtrSlResult(long_sl=data.low - ma * multi, short_sl=ma * multi + data.high)
+
+
+def atr_sl(
+    data: Node = HLC,
+    length: int = 14,
+    ma_type: AtrSlMaType = AtrSlMaType.RMA,
+    multi: float = 1.5,
+) -> Node:
+    """The Average True Range Stop Loss, with one shared MA of the True Range."""
+    ma = node(_MA_FACTORIES[ma_type], tr(data), length=length)
+    return combine(_atr_sl, data, ma, multi=multi)
+
+
+def _get_moments(length: int = 20) -> Indicator[float, tuple[float, float]]:
+    """The mean and standard deviation of one window of values."""
+    moments = RollingMoments(size=length)
+
+    def update(value: float) -> tuple[float, float]:
+        moments.put(value)
+        return moments.mean(), moments.st_dev()
+
+    return indicator(update, warmup=length, preview=moments.preview)
+
+
+def _bb(moments: tuple[float, float], multi: float) -> BollingerResult:
+    middle, std = moments
+    return BollingerResult(
+        upper=middle + multi * std, middle=middle, lower=middle - multi * std
+    )
+
+
+def bb(data: Node = CLOSE, length: int = 20, multi: int = 2) -> Node:
+    """The Bollinger Bands, from one window of mean and standard deviation."""
+    return combine(_bb, node(_get_moments, data, length=length), multi=multi)
+
+
+def _bbw(moments: tuple[float, float], multi: float) -> float:
+    bands = _bb(moments, multi)
+    return (bands.upper - bands.lower) / bands.middle if bands.middle != 0 else nan
+
+
+def bbw(data: Node = CLOSE, length: int = 5, multi: int = 4) -> Node:
+    """The Bollinger Bands Width, sharing the window of `bb`."""
+    return combine(_bbw, node(_get_moments, data, length=length), multi=multi)
+
+
+def bbwp(data: Node = CLOSE, length: int = 13, rank_length: int = 252) -> Node:
+    """The Bollinger Bands Width Percentile, sharing the nodes of `bb`."""
+    return node(ta.percent_rank, bbw(data, length=length, multi=1), length=rank_length)
+
+
+def _get_change() -> Indicator[float, float]:
+    last_value = None
+
+    def change(value: float) -> float:
+        nonlocal last_value
+        pc = nan if last_value is None else value - last_value
+        last_value = value
+        return pc
+
+    def change_preview(value: float) -> float:
+        return nan if last_value is None else value - last_value
+
+    # the first change needs a previous value.
+    return series_indicator(change, warmup=2, preview=change_preview)
+
+
+def _tsi_line(data: Node, length: int, smooth_len: int) -> Node:
+    pc = node(_get_change, data)
+    apc = expr("abs({0})", pc)
+    smooth_pc = node(ta.ema, node(ta.ema, pc, length=length), length=smooth_len)
+    smooth_apc = node(ta.ema, node(ta.ema, apc, length=length), length=smooth_len)
+    return expr(
+        "nan if {0} != {0} or {1} != {1} else ({0} * 100 / {1} if {1} != 0 else 0)",
+        smooth_pc,
+        smooth_apc,
+    )
+
+
+def tsi(
+    data: Node = CLOSE, length: int = 25, smooth_len: int = 13, signal_len: int = 13
+) -> Node:
+    """The True Strength Index, its smoothing chains built from shared EMAs."""
+    value = _tsi_line(data, length, smooth_len)
+    return combine(TsiResult, value, node(ta.ema, value, length=signal_len))
+
+
+def phx() -> Node:
+    """The Phoenix Ascending Oscillator of a `Quote` node."""
+    hlc3 = source("hlc3")
+    tci = node(ta.tci, hlc3, length=9)
+    mfi = node(ta.mfi, source("hlc3_with_vol"), length=3)
+    willy = node(ta.willy, hlc3, length=6)
+    rsi = node(ta.rsi, hlc3, length=3)
+    tsi = expr("{0} / 100", _tsi_line(source("open"), length=9, smooth_len=6))
+
+    csi = expr("({0} + ({1} * 50 + 50)) / 2", rsi, tsi)
+    phx = expr("({0} + {1} + {2} + {3}) / 4", tci, csi, mfi, willy)
+    trad = expr("({0} + {1} + {2}) / 3", tci, mfi, rsi)
+    fast = expr("({0} + {1}) / 2", phx, trad)
+
+    slow = node(ta.sma, fast, length=6)
+    lsma = node(ta.linreg, fast, length=32)
+    return combine(PhoenixResult, fast, slow, lsma)
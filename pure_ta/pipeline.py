@@ -0,0 +1,746 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Compile indicator graphs into one flat update function.
+
+`compile_pipeline` takes the nodes of a `pure_ta.graph` and generates the
+source of a single generator. Every node is computed once per bar, in
+dependency order, with its state held in the generator's locals:
+
+    phx = compile_pipeline(graph.phx())
+    for quote in quotes:
+        result = phx(quote)
+
+The common indicators (sma, ema, rsi, mfi, tci, willy and linreg from
+`pure_ta.ta`) and every `graph.expr` are inlined. Record inputs such as
+`hlc` or `hlc3_with_vol` are read field by field from the bar, so they are
+never built. Any other node is called through the streaming indicator it
+declares, so every graph can be compiled.
+
+The results are the same as streaming the indicators one by one, and an
+error raised by a bar leaves the pipeline usable for the next one. A
+preview runs the same code on the inlined state and restores it afterwards,
+while called nodes are previewed through their own `preview`. The generator
+hands its state to `pure_ta.snapshot`, so pipelines can be snapshotted,
+restored into a pipeline compiled from the same nodes and run by a
+`HistoryRunner`.
+"""
+import re
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import fields, is_dataclass
+from functools import partial
+from math import nan
+from textwrap import dedent, indent
+from typing import Any
+from zlib import crc32
+
+from pure_ta import ta
+from pure_ta._indicator import Indicator, indicator
+from pure_ta._types import Hlc, PriceData, PriceDataWithVol, Quote
+from pure_ta.graph import (
+    _COMBINE,
+    _EXPR,
+    _INDICATOR,
+    _SOURCE,
+    Node,
+    _get_change,
+    source,
+)
+
+# a template returns the code run once before the first bar and the code run
+# on every bar. "@" stands for the node's own prefix, "$0" for its input and
+# "$0.field" for one field of a record input.
+Template = Callable[..., tuple[str, str] | None]
+
+_TEMPLATES: dict[Callable[..., Any], Template] = {}
+
+# fields of record sources that can be read straight from the bar.
+_SOURCE_FIELDS = {"hlc": {"high": "high", "low": "low", "close": "close"}}
+
+_RECORDS = (Hlc, PriceData, PriceDataWithVol)
+
+# the derived prices of a `Quote`, with the formulas it uses. Each source is
+# read once per bar, so the caching of its properties is skipped.
+_QUOTE_SOURCES = {
+    "hl2": "(_bar.high + _bar.low) / 2",
+    "hlc3": "(_bar.high + _bar.low + _bar.close) / 3",
+    "oc2": "(_bar.open + _bar.close) / 2",
+    "ohl3": "(_bar.open + _bar.high + _bar.low) / 3",
+    "ohlc4": "(_bar.open + _bar.high + _bar.low + _bar.close) / 4",
+}
+
+
+def _template(factory: Callable[..., Any]) -> Callable[[Template], Template]:
+    def register(template: Template) -> Template:
+        _TEMPLATES[factory] = template
+        return template
+
+    return register
+
+
+def _rolling_sum_init(name: str, length: int) -> str:
+    return f"""
+    @{name}_buf = [0.0] * {length}
+    @{name}_pos = 0
+    @{name}_filled = 0
+    @{name}_sum = 0.0
+    @{name}_comp = 0.0
+    @{name}_nan = 0
+    """
+
+
+def _neumaier_add(name: str, value: str) -> str:
+    # the magnitudes are compared inline, which is cheaper than calling abs.
+    sum_abs = f"(@{name}_sum if @{name}_sum >= 0.0 else -@{name}_sum)"
+    value_abs = f"({value} if {value} >= 0.0 else -{value})"
+    return f"""
+    @total = @{name}_sum + {value}
+    if {sum_abs} >= {value_abs}:
+        @{name}_comp += (@{name}_sum - @total) + {value}
+    else:
+        @{name}_comp += ({value} - @total) + @{name}_sum
+    @{name}_sum = @total
+    """
+
+
+def _rolling_sum_put(name: str, value: str, length: int) -> str:
+    """The code of `RollingSum.put` without resyncing.
+
+    Adding or evicting zero leaves a compensated sum unchanged, so zeros skip
+    the Neumaier step.
+    """
+    evict = indent(_block(_neumaier_add(name, "@old")), " " * 12)
+    add = indent(_block(_neumaier_add(name, value)), " " * 8)
+    return f"""
+    if @{name}_filled == {length}:
+        @old = @{name}_buf[@{name}_pos]
+        if @old != @old:
+            @{name}_nan -= 1
+        elif @old:
+            @old = -@old
+{evict}
+    else:
+        @{name}_filled += 1
+    @{name}_buf[@{name}_pos] = {value}
+    @{name}_pos += 1
+    if @{name}_pos == {length}:
+        @{name}_pos = 0
+    if {value} != {value}:
+        @{name}_nan += 1
+    elif {value}:
+{add}
+    """
+
+
+class _Preview(Exception):
+    """Thrown into a pipeline to compute the results of a bar without it."""
+
+    def __init__(self, bar: Any):
+        super().__init__()
+        self.bar = bar
+
+
+class _Export(Exception):
+    """Thrown into a pipeline to get the values of its state."""
+
+
+class _Import(Exception):
+    """Thrown into a pipeline to replace its state with exported values."""
+
+    def __init__(self, values: list[Any]):
+        super().__init__()
+        self.values = values
+
+
+class _Raised:
+    """Yielded by a pipeline in place of a result when a bar raised an error.
+
+    The error is caught inside the generator, which would be finished by it,
+    and raised again to the caller.
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _keep(value: Any) -> Any:
+    return value.copy() if isinstance(value, list | deque) else value
+
+
+def _put_back(value: Any, saved: Any) -> Any:
+    """Restore a local saved by `_keep`, refilling containers in place."""
+    if isinstance(value, list):
+        value[:] = saved
+        return value
+    if isinstance(value, deque):
+        value.clear()
+        value.extend(saved)
+        return value
+    return saved
+
+
+def _load(value: Any, saved: Any) -> Any:
+    """Restore an exported local, unless it was already refilled in place."""
+    return value if saved is value else _put_back(value, saved)
+
+
+class _Pipeline:
+    """A running pipeline generator, with its state exported for snapshots."""
+
+    __slots__ = ("send", "throw", "_key")
+
+    def __init__(self, generator: Any, key: str):
+        next(generator)
+        self.send = generator.send
+        self.throw = generator.throw
+        self._key = key
+
+    def export_state(self) -> tuple[str, list[Any]]:
+        """A key of the generated code and the values of its state."""
+        return self._key, self.throw(_Export())
+
+    def import_state(self, values: list[Any]) -> None:
+        """Replace the state with values of `export_state`."""
+        self.throw(_Import(values))
+
+
+def _block(code: str) -> str:
+    """Dedent a template snippet, keeping the snippets spliced into it aligned."""
+    lines = [line for line in code.split("\n") if line.strip()]
+    return dedent("\n".join(lines))
+
+
+@_template(ta.sma)
+def _sma(length: int, resync_every: int | None) -> tuple[str, str] | None:
+    if resync_every is not None:
+        return None
+    body = _block(_rolling_sum_put("s", "$0", length)) + dedent(
+        f"""
+        @out = (@s_sum + @s_comp) / {length} if @s_filled == {length} and not @s_nan else nan
+        """  # noqa: E501
+    )
+    return _block(_rolling_sum_init("s", length)), body
+
+
+@_template(ta.ema)
+def _ema(length: int) -> tuple[str, str]:
+    alpha = 2 / (length + 1)
+    init = """
+    @ema = nan
+    @count = 0
+    @sum = 0
+    @seeded = False
+    """
+    body = f"""
+    if $0 != $0:
+        @out = $0
+    elif @seeded:
+        @out = @ema = ($0 - @ema) * {alpha!r} + @ema
+    else:
+        @count += 1
+        @sum += $0
+        if @count == {length}:
+            @ema = @sum / {length}
+            @seeded = True
+        @out = @ema
+    """
+    return init, body
+
+
+@_template(_get_change)
+def _change() -> tuple[str, str]:
+    body = """
+    @out = nan if @last is None else $0 - @last
+    @last = $0
+    """
+    return "@last = None", body
+
+
+@_template(ta.rsi)
+def _rsi(length: int) -> tuple[str, str]:
+    init = """
+    @last = nan
+    @gain = 0.0
+    @loss = 0.0
+    @count = 0
+    """
+    # once the averages are seeded, the gain or loss that is zero is left out
+    # of its sum rather than added.
+    rs = "100 - (100 / (@rs + 1)) if @rs == @rs else nan"
+    body = f"""
+    if @count >= {length}:
+        @change = $0 - @last
+        @last = $0
+        if @change > 0:
+            @gain = ((@gain * {length - 1}) + @change) / {length}
+            @loss = (@loss * {length - 1}) / {length}
+        elif @change < 0:
+            @gain = (@gain * {length - 1}) / {length}
+            @loss = ((@loss * {length - 1}) - @change) / {length}
+        else:
+            @gain = (@gain * {length - 1}) / {length}
+            @loss = (@loss * {length - 1}) / {length}
+        if @loss == 0:
+            @out = nan
+        else:
+            @rs = @gain / @loss
+            @out = {rs}
+    else:
+        @g = 0.0
+        @l = 0.0
+        if @last == @last:
+            @change = $0 - @last
+            @g = @change if @change > 0 else 0
+            @l = -@change if -@change > 0 else 0
+        @gain = ((@gain * @count) + @g) / (@count + 1)
+        @loss = ((@loss * @count) + @l) / (@count + 1)
+        @count += 1
+        @last = $0
+        if @count < {length} or @loss == 0:
+            @out = nan
+        else:
+            @rs = @gain / @loss
+            @out = {rs}
+    """
+    return init, body
+
+
+@_template(ta.mfi)
+def _mfi(length: int) -> tuple[str, str]:
+    init = _block(_rolling_sum_init("u", length)) + "\n"
+    init += _block(_rolling_sum_init("d", length)) + "\n@prev = nan"
+    head = """
+    @value = $0.value
+    @change = 0.0 if @prev != @prev else @value - @prev
+    @mf = $0.volume * @value
+    if @change > 0:
+        @up = @mf
+        @down = 0.0
+    elif @change < 0:
+        @up = 0.0
+        @down = @mf
+    else:
+        @up = 0.0
+        @down = 0.0
+    """
+    tail = f"""
+    @prev = @value
+    if @u_filled == {length}:
+        if @u_nan or @d_nan:
+            @out = nan
+        else:
+            @upper = @u_sum + @u_comp
+            @lower = @d_sum + @d_comp
+            if @lower != 0:
+                @out = 100 - (100 / (@upper / @lower + 1))
+            else:
+                @out = 100
+    else:
+        @out = nan
+    """
+    body = "\n".join(
+        [
+            _block(head),
+            _block(_rolling_sum_put("u", "@up", length)),
+            _block(_rolling_sum_put("d", "@down", length)),
+            _block(tail),
+        ]
+    )
+    return init, body
+
+
+def _tci_seed(values: list[float], length: int) -> tuple[float, float, float]:
+    """Seed the TCI averages exactly like `get_tci`."""
+    ema_src = sum(values) / length
+    ema_diff_abs = sum(abs(val - ema_src) for val in values) / length
+    tci_raw_sum = sum((val - ema_src) / (0.025 * abs(val - ema_src)) for val in values)
+    return ema_src, ema_diff_abs, tci_raw_sum / 6
+
+
+@_template(ta.tci)
+def _tci(length: int) -> tuple[str, str]:
+    alpha = 2 / (length + 1)
+    tci_alpha = 2 / (6 + 1)
+    init = """
+    @buf = []
+    @seeded = False
+    @src = nan
+    @diff = nan
+    @raw = nan
+    """
+    body = f"""
+    if @seeded:
+        @src = {alpha!r} * $0 + {1 - alpha!r} * @src
+        @diff_abs = abs($0 - @src)
+        @diff = {alpha!r} * @diff_abs + {1 - alpha!r} * @diff
+        @tci_raw = ($0 - @src) / (@diff * 0.025)
+        @raw = {tci_alpha!r} * @tci_raw + {1 - tci_alpha!r} * @raw
+        @out = @raw + 50
+    else:
+        @buf.append($0)
+        if len(@buf) < {length}:
+            @out = nan
+        else:
+            @src, @diff, @raw = _tci_seed(@buf, {length})
+            @buf.clear()
+            @seeded = True
+            @out = @raw + 50
+    """
+    return init, body
+
+
+@_template(ta.willy)
+def _willy(length: int) -> tuple[str, str]:
+    # like `SlidingMax` and `SlidingMin`, NaN takes a slot in the window but
+    # never enters the deques.
+    init = """
+    @high_values = deque()
+    @high_indices = deque()
+    @low_values = deque()
+    @low_indices = deque()
+    @high_push = @high_values.append
+    @high_push_index = @high_indices.append
+    @low_push = @low_values.append
+    @low_push_index = @low_indices.append
+    @count = 0
+    """
+    body = f"""
+    if $0 == $0:
+        while @high_values and @high_values[-1] <= $0:
+            @high_values.pop()
+            @high_indices.pop()
+        @high_push($0)
+        @high_push_index(@count)
+        while @low_values and @low_values[-1] >= $0:
+            @low_values.pop()
+            @low_indices.pop()
+        @low_push($0)
+        @low_push_index(@count)
+    @oldest = @count - {length - 1}
+    @count += 1
+    if @high_indices and @high_indices[0] < @oldest:
+        @high_indices.popleft()
+        @high_values.popleft()
+    if @low_indices and @low_indices[0] < @oldest:
+        @low_indices.popleft()
+        @low_values.popleft()
+    if @count >= {length}:
+        @high = @high_values[0] if @high_values else nan
+        @low = @low_values[0] if @low_values else nan
+        @out = 60 * ($0 - @high) / (@high - @low) + 80
+    else:
+        @out = nan
+    """
+    return init, body
+
+
+@_template(ta.linreg)
+def _linreg(length: int) -> tuple[str, str]:
+    # the x values are kept as floats, which is exact below 2**53 bars.
+    init = f"""
+    @buf = [0.0] * {length}
+    @pos = 0
+    @x_sum = 0.0
+    @y_sum = 0.0
+    @xx_sum = 0.0
+    @xy_sum = 0.0
+    @x = 0.0
+    """
+    body = f"""
+    if $0 != $0:
+        @out = $0
+    else:
+        if @x >= {length}:
+            @first_y = @buf[@pos]
+            @first_x = @x - {length}
+            @x_sum -= @first_x
+            @y_sum -= @first_y
+            @xx_sum -= @first_x * @first_x
+            @xy_sum -= @first_x * @first_y
+        @x_sum += @x
+        @y_sum += $0
+        @xx_sum += @x * @x
+        @xy_sum += @x * $0
+        @buf[@pos] = $0
+        @pos += 1
+        if @pos == {length}:
+            @pos = 0
+        if @x < {length - 1}:
+            @out = nan
+        else:
+            @slope = ({length} * @xy_sum - @x_sum * @y_sum) / ({length} * @xx_sum - @x_sum**2)
+            @intercept = (@y_sum - @slope * @x_sum) / {length}
+            @out = @slope * @x + @intercept
+        @x += 1.0
+    """  # noqa: E501
+    return init, body
+
+
+def _is_plain_record(cls: Any, size: int) -> bool:
+    """Whether `cls(*values)` only stores `values` in the slots of a dataclass."""
+    return (
+        isinstance(cls, type)
+        and is_dataclass(cls)
+        and "__slots__" in cls.__dict__
+        and not hasattr(cls, "__post_init__")
+        and [f.init for f in fields(cls)] == [True] * size
+    )
+
+
+_PLACEHOLDER = re.compile(r"\$(\d+)(?:\.([A-Za-z_]\w*))?")
+
+
+class _Compiler:
+    """Emits the code of each node the first time it is referenced."""
+
+    def __init__(self, bar_type: type | None = None) -> None:
+        self.sources = _QUOTE_SOURCES if bar_type is Quote else {}
+        self.names: dict[Node, str] = {}
+        self.init: list[str] = []
+        self.body: list[str] = []
+        self.preview: list[str] = []
+        # the locals holding the state of inlined nodes.
+        self.state: list[str] = []
+        # the locals holding the indicators of called nodes.
+        self.called: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "nan": nan,
+            "deque": deque,
+            "_tci_seed": _tci_seed,
+            "_Preview": _Preview,
+            "_Export": _Export,
+            "_Import": _Import,
+            "_Raised": _Raised,
+            "_keep": _keep,
+            "_put_back": _put_back,
+            "_load": _load,
+        }
+
+    def _prefix(self) -> str:
+        return f"n{len(self.names)}_"
+
+    def ref(self, item: Node) -> str:
+        """The local holding the value of `item`, emitting its code if needed."""
+        name = self.names.get(item)
+        if name is None:
+            name = self._emit(item)
+            self.names[item] = name
+        return name
+
+    def field(self, item: Node, name: str) -> str:
+        """An expression for one field of a record node."""
+        if item.kind == _SOURCE:
+            if item.fn.endswith("_with_vol") and name in ("value", "volume"):
+                part = item.fn[: -len("_with_vol")] if name == "value" else "vol"
+                return self.ref(source(part))
+            if name in _SOURCE_FIELDS.get(item.fn, {}):
+                return self.ref(source(_SOURCE_FIELDS[item.fn][name]))
+        elif item.kind == _COMBINE and item.fn in _RECORDS and not item.params:
+            names = [f.name for f in fields(item.fn)]
+            if name in names and len(item.inputs) == len(names):
+                return self.ref(item.inputs[names.index(name)])
+        return f"{self.ref(item)}.{name}"
+
+    def _substitute(self, code: str, inputs: tuple[Node, ...]) -> str:
+        def replace(match: re.Match[str]) -> str:
+            item = inputs[int(match.group(1))]
+            name = match.group(2)
+            return self.field(item, name) if name else self.ref(item)
+
+        return _PLACEHOLDER.sub(replace, code)
+
+    def _emit(self, item: Node) -> str:
+        prefix = self._prefix()
+        # reserve the prefix before emitting the inputs.
+        self.names[item] = f"{prefix}out"
+        params = dict(item.params)
+        preview = None
+
+        if item.kind == _SOURCE:
+            body = f"@out = {self.sources.get(item.fn, f'_bar.{item.fn}')}"
+        elif item.kind == _EXPR:
+            args = [self.ref(i) for i in item.inputs]
+            body = f"@out = {item.fn.format(*args)}"
+        elif item.kind == _INDICATOR and item.fn in _TEMPLATES:
+            code = _TEMPLATES[item.fn](**params)
+            if code is None:
+                body = self._call(prefix, item.fn(**params), item.inputs)
+                preview = self._invoke("@fn.preview", item.inputs)
+                self.called.append(f"{prefix}fn")
+            else:
+                init = _block(code[0]).replace("@", prefix)
+                self.init.append(init)
+                self.state += re.findall(r"^(\w+) =", init, re.MULTILINE)
+                body = self._substitute(_block(code[1]), item.inputs)
+        elif item.kind == _INDICATOR:
+            body = self._call(prefix, item.fn(**params), item.inputs)
+            preview = self._invoke("@fn.preview", item.inputs)
+            self.called.append(f"{prefix}fn")
+        elif not params and _is_plain_record(item.fn, len(item.inputs)):
+            body = self._record(prefix, item.fn, item.inputs)
+        else:
+            fn = partial(item.fn, **params) if params else item.fn
+            body = self._call(prefix, fn, item.inputs)
+
+        self.body.append(body.replace("@", prefix))
+        self.preview.append((preview or body).replace("@", prefix))
+        return f"{prefix}out"
+
+    def _local(self, prefix: str, name: str, value: Any) -> None:
+        """Make `value` available to the node as the local `@name`."""
+        self.namespace[f"_{prefix}{name}"] = value
+        self.init.append(f"{prefix}{name} = _{prefix}{name}")
+
+    def _call(self, prefix: str, fn: Callable[..., Any], inputs: tuple) -> str:
+        self._local(prefix, "fn", fn)
+        return self._invoke("@fn", inputs)
+
+    def _invoke(self, target: str, inputs: tuple) -> str:
+        args = ", ".join(f"${i}" for i in range(len(inputs)))
+        return self._substitute(f"@out = {target}({args})", inputs)
+
+    def _record(self, prefix: str, cls: type, inputs: tuple) -> str:
+        """Build a frozen dataclass by setting its slots directly.
+
+        This skips the `object.__setattr__` calls of the generated `__init__`.
+        """
+        self._local(prefix, "new", object.__new__)
+        self._local(prefix, "cls", cls)
+        lines = ["@out = @new(@cls)"]
+        for i, f in enumerate(fields(cls)):
+            self._local(prefix, f"set{i}", cls.__dict__[f.name].__set__)
+            lines.append(f"@set{i}(@out, ${i})")
+        return self._substitute("\n".join(lines), inputs)
+
+
+def _settling(
+    item: Node, memo: dict[Node, tuple[int, int]] | None = None
+) -> tuple[int, int]:
+    """The warm-up and convergence of a node, through its slowest input.
+
+    Each indicator node adds its own to those of its inputs, like
+    `chain_warmup`, while sources, combinations and expressions add nothing.
+    """
+    memo = {} if memo is None else memo
+    found = memo.get(item)
+    if found is not None:
+        return found
+
+    inputs = [_settling(i, memo) for i in item.inputs]
+    warmup = max((w for w, _ in inputs), default=1)
+    convergence = max((c for _, c in inputs), default=0)
+    if item.kind == _INDICATOR:
+        fn = item.fn(**dict(item.params))
+        warmup += fn.warmup - 1
+        convergence += fn.convergence
+    memo[item] = (warmup, convergence)
+    return warmup, convergence
+
+
+def generate(
+    outputs: Node | Mapping[str, Node], bar_type: type | None = None
+) -> tuple[str, dict[str, Any]]:
+    """Return the source of the pipeline generator and the globals it needs."""
+    compiler = _Compiler(bar_type)
+    if isinstance(outputs, Node):
+        result = compiler.ref(outputs)
+    else:
+        items = ", ".join(
+            f"{name!r}: {compiler.ref(output)}" for name, output in outputs.items()
+        )
+        result = f"{{{items}}}"
+
+    # a preview is thrown in at the yield, and the inlined state is saved
+    # before running the preview code and put back after it. An error is
+    # yielded instead of raised, which would finish the generator. Snapshots
+    # export the state and the called indicators, and import the state.
+    state = ", ".join(compiler.state)
+    exported = ", ".join(compiler.state + compiler.called)
+    lines = ["def _pipeline():"]
+    lines += [indent(code, " " * 4) for code in compiler.init]
+    lines.append("    _result = None")
+    lines.append("    while True:")
+    lines.append("        try:")
+    lines.append("            _bar = yield _result")
+    lines.append("        except _Preview as _signal:")
+    lines.append("            _bar = _signal.bar")
+    if state:
+        lines.append(f"            _state = ({state},)")
+        lines.append("            _saved = tuple(map(_keep, _state))")
+    lines.append("            try:")
+    lines += [indent(code, " " * 16) for code in compiler.preview]
+    lines.append(f"                _result = {result}")
+    lines.append("            except Exception as _error:")
+    lines.append("                _result = _Raised(_error)")
+    if state:
+        lines.append(f"            {state}, = map(_put_back, _state, _saved)")
+    lines.append("            continue")
+    lines.append("        except _Export:")
+    lines.append(f"            _result = [{exported}]")
+    lines.append("            continue")
+    lines.append("        except _Import as _signal:")
+    if state:
+        lines.append(f"            _state = ({state},)")
+        lines.append(f"            {state}, = map(_load, _state, _signal.values)")
+    lines.append("            _result = None")
+    lines.append("            continue")
+    lines.append("        try:")
+    lines += [indent(code, " " * 12) for code in compiler.body]
+    lines.append(f"            _result = {result}")
+    lines.append("        except Exception as _error:")
+    lines.append("            _result = _Raised(_error)")
+    return "\n".join(lines) + "\n", compiler.namespace
+
+
+def compile_pipeline(
+    outputs: Node | Mapping[str, Node], bar_type: type | None = None
+) -> Indicator[Any, Any]:
+    """Compile graph nodes into one streaming indicator.
+
+    Args:
+        outputs: A node, whose value is returned for every bar, or a mapping of
+            names to nodes, returned as a dict of the same names.
+        bar_type: Pass `Quote` when every bar is exactly a `Quote` (not a
+            subclass such as `DecimalQuote`), so derived prices such as `hlc3`
+            are computed from its float prices instead of read through its
+            cached properties.
+
+    Returns:
+        An indicator taking one bar per call, with the warm-up and convergence
+        of its slowest output. Its generated source is kept in the `source`
+        attribute.
+    """
+    code, namespace = generate(outputs, bar_type)
+    exec(compile(code, "<pure_ta pipeline>", "exec"), namespace)  # noqa: S102
+    pipeline = _Pipeline(namespace["_pipeline"](), f"{crc32(code.encode()):08x}")
+
+    def update(bar: Any) -> Any:
+        result = pipeline.send(bar)
+        if result.__class__ is _Raised:
+            raise result.error
+        return result
+
+    def update_many(bars: Any) -> list[Any]:
+        return list(map(update, bars))
+
+    def preview(bar: Any) -> Any:
+        result = pipeline.throw(_Preview(bar))
+        if result.__class__ is _Raised:
+            raise result.error
+        return result
+
+    memo: dict[Node, tuple[int, int]] = {}
+    items = [outputs] if isinstance(outputs, Node) else list(outputs.values())
+    settling = [_settling(item, memo) for item in items]
+    fn = indicator(
+        update,
+        update_many,
+        warmup=max(w for w, _ in settling),
+        convergence=max(c for _, c in settling),
+        preview=preview,
+    )
+    fn.source = code  # type: ignore[attr-defined]
+    return fn
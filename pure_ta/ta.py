@@ -1,6 +1,9 @@
-"""functions for calculating technical indicators."""
-from collections.abc import Callable
+"""functions for calculating technical indicators.
 
+Every indicator previews a bar from its current state, without copying it.
+The previews of `alma`, and of `tci` until it is seeded, are O(length) as
+they recompute the window like their updates do.
+"""
 from pure_ta._alma import get_alma
 from pure_ta._atr import get_atr
 from pure_ta._atr_sl import AtrSlResult, get_atr_sl
@@ -12,6 +15,7 @@ from pure_ta._ema import get_ema
 from pure_ta._enum_types import AtrSlMaType, StDevOf
 from pure_ta._er import get_er
 from pure_ta._hma import get_hma
+from pure_ta._indicator import Indicator
 from pure_ta._kama import get_kama
 from pure_ta._linreg import get_linreg
 from pure_ta._mfi import get_mfi
@@ -43,13 +47,18 @@ def _validate_arg(indicator: str, value: int, min_value: int = 1):
         )
 
 
-def sma(length: int = 20) -> Callable[[float], float]:
-    """Return a function that calculates the simple moving average."""
+def sma(length: int = 20, resync_every: int | None = None) -> Indicator[float, float]:
+    """Return a function that calculates the simple moving average.
+
+    Set `resync_every` to recompute the running sum exactly after that many
+    evictions, so first after `length + resync_every` updates, which bounds
+    floating point drift on long-lived streams.
+    """
     _validate_arg("SMA (Simple Moving Average)", length)
-    return get_sma(length)
+    return get_sma(length, resync_every)
 
 
-def ema(length: int = 20) -> Callable[[float], float]:
+def ema(length: int = 20) -> Indicator[float, float]:
     """Return a function that calculates the exponential moving average."""
     _validate_arg("EMA (Exponential Moving Average)", length)
     return get_ema(length)
@@ -57,7 +66,7 @@ def ema(length: int = 20) -> Callable[[float], float]:
 
 def alma(
     length: int = 20, sigma: float = 6, offset: float = 0.85
-) -> Callable[[float], float]:
+) -> Indicator[float, float]:
     """Return a function to calculates the Arnaud Legoux Moving Average."""
     _validate_arg("ALMA (Arnaud Legoux Moving Average)", length)
     if sigma < 1:
@@ -67,32 +76,37 @@ def alma(
     return get_alma(length, sigma=sigma, offset=offset)
 
 
-def rma(length: int = 14) -> Callable[[float], float]:
+def rma(length: int = 14) -> Indicator[float, float]:
     """Return a function that calculates the Relative Moving Average."""
     _validate_arg("RMA (Relative Moving Average)", length)
     return get_rma(length)
 
 
-def atr(length: int = 14) -> Callable[[Hlc], float]:
+def atr(length: int = 14) -> Indicator[Hlc, float]:
     """Return a function that calculates the Average True Range."""
     _validate_arg("ATR (Average True Range)", length)
     return get_atr(length)
 
 
-def wma(length: int = 15) -> Callable[[float], float]:
-    """Return a function that calculates the Weighted Moving Average."""
+def wma(length: int = 15, resync_every: int | None = None) -> Indicator[float, float]:
+    """Return a function that calculates the Weighted Moving Average.
+
+    Set `resync_every` to recompute the running sums exactly after that many
+    evictions, so first after `length + resync_every` updates, which bounds
+    floating point drift on long-lived streams.
+    """
     _validate_arg("WMA (Weighted Moving Average)", length)
-    return get_wma(length)
+    return get_wma(length, resync_every)
 
 
-def tr(handle_na: bool = True) -> Callable[[Hlc], float]:
+def tr(handle_na: bool = True) -> Indicator[Hlc, float]:
     """Return a function that calculates the True Range."""
     return get_tr(handle_na)
 
 
 def atr_sl(
     length: int = 14, ma_type: AtrSlMaType = AtrSlMaType.RMA, multi: float = 1.5
-) -> Callable[[Hlc], AtrSlResult]:
+) -> Indicator[Hlc, AtrSlResult]:
     """Return a function that calculates the Average True Range Stop Loss."""
     _validate_arg("ATR_SL (Average True Range, Stop Loss)", length)
     return get_atr_sl(length, ma_type, multi)
@@ -100,102 +114,106 @@ def atr_sl(
 
 def std_dev(
     length: int = 20, bias: StDevOf = StDevOf.POPULATION
-) -> Callable[[float], float]:
+) -> Indicator[float, float]:
     """Return a function that calculates the standard deviation."""
     _validate_arg("Standard Deviation", length)
     return get_st_dev(length, bias)
 
 
-def bb(length: int = 20, multi: int = 2) -> Callable[[float], BollingerResult]:
+def bb(length: int = 20, multi: int = 2) -> Indicator[float, BollingerResult]:
     """Return a function that calculates the Bollinger Bands."""
     _validate_arg("Bollinger Bands", length)
     return get_bb(length, multi)
 
 
-def bbw(length: int = 5, multi: int = 4) -> Callable[[float], float]:
+def bbw(length: int = 5, multi: int = 4) -> Indicator[float, float]:
     """Return a function that calculates the Bollinger Bands Width."""
     _validate_arg("Bollinger Bands Width", length)
     return get_bbw(length, multi)
 
 
-def percent_rank(length: int = 20) -> Callable[[float], float]:
+def percent_rank(length: int = 20) -> Indicator[float, float]:
     """Return a function that calculates the Percent Rank."""
     _validate_arg("Percent Rank", length)
     return get_percent_rank(length)
 
 
-def bbwp(length: int = 13) -> Callable[[float], float]:
-    """Return a function that calculates the Bollinger Bands Width Percentile."""
+def bbwp(length: int = 13, rank_length: int = 252) -> Indicator[float, float]:
+    """Return a function that calculates the Bollinger Bands Width Percentile.
+
+    `rank_length` is the number of past widths the current one is ranked in.
+    """
     _validate_arg("Bollinger Bands Width Percentile", length)
-    return get_bbwp(length)
+    _validate_arg("Bollinger Bands Width Percentile", rank_length)
+    return get_bbwp(length, rank_length)
 
 
-def dema(length: int = 20) -> Callable[[float], float]:
+def dema(length: int = 20) -> Indicator[float, float]:
     """Return a function that calculates the double exponential moving average."""
     _validate_arg("DEMA (Double Exponential Moving Average)", length)
     return get_dema(length)
 
 
-def er(length: int = 10) -> Callable[[float], float]:
+def er(length: int = 10) -> Indicator[float, float]:
     """Return a function that calculates the efficiency ratio."""
     _validate_arg("ER (Efficiency Ratio)", length)
     return get_er(length)
 
 
-def hma(length: int = 16) -> Callable[[float], float]:
+def hma(length: int = 16) -> Indicator[float, float]:
     """Return a function that calculates the Hull Moving Average."""
     _validate_arg("HMA (Hull Moving Average)", length)
     return get_hma(length)
 
 
-def kama(length: int = 10) -> Callable[[float], float]:
+def kama(length: int = 10) -> Indicator[float, float]:
     """Return a function that calculates the Kaufman's Adaptive Moving Average."""
     _validate_arg("KAMA (Kaufman's Adaptive Moving Average)", length)
     return get_kama(length)
 
 
-def linreg(length: int = 9) -> Callable[[float], float]:
+def linreg(length: int = 9) -> Indicator[float, float]:
     """Return a function that calculates the Linear Regression."""
     _validate_arg("Linear Regression", length)
     return get_linreg(length)
 
 
-def mfi(length: int = 14) -> Callable[[PriceDataWithVol], float]:
+def mfi(length: int = 14) -> Indicator[PriceDataWithVol, float]:
     """Return a function that calculates the Money Flow Index."""
     _validate_arg("MFI (Money Flow Index)", length)
     return get_mfi(length)
 
 
-def mom(length: int = 20) -> Callable[[float], float]:
+def mom(length: int = 20) -> Indicator[float, float]:
     """Return a function that calculates the Momentum."""
     _validate_arg("Momentum", length)
     return get_mom(length)
 
 
-def rsi(length: int = 14) -> Callable[[float], float]:
+def rsi(length: int = 14) -> Indicator[float, float]:
     """Return a function that calculates the Relative Strength Index."""
     _validate_arg("RSI (Relative Strength Index)", length, 2)
     return get_rsi(length)
 
 
-def swma() -> Callable[[float], float]:
+def swma() -> Indicator[float, float]:
     """Return a function that calculates the Symmetrically Weighted Moving Average."""
     return get_swma()
 
 
-def smma(length: int = 20) -> Callable[[float], float]:
+def smma(length: int = 20) -> Indicator[float, float]:
     """Return a function that calculates the Smoothed Moving Average."""
     _validate_arg("SMMA (Smoothed Moving Average)", length)
     return get_smma(length)
 
 
-def tci(length: int = 9) -> Callable[[float], float]:
+def tci(length: int = 9) -> Indicator[float, float]:
     """Return a function that calculates the Trend Confidence Index."""
     _validate_arg("TCI (Trend Confidence Index)", length)
     return get_tci(length)
 
 
-def tema(length: int = 20) -> Callable[[float], float]:
+def tema(length: int = 20) -> Indicator[float, float]:
     """Return a function that calculates the Triple Exponential Moving Average."""
     _validate_arg("TEMA (Triple Exponential Moving Average)", length)
     return get_tema(length)
@@ -203,30 +221,30 @@ def tema(length: int = 20) -> Callable[[float], float]:
 
 def tsi(
     length: int = 25, smooth_len: int = 13, signal_len: int = 13
-) -> Callable[[float], TsiResult]:
+) -> Indicator[float, TsiResult]:
     """Return a function that calculates the True Strength Index."""
     _validate_arg("TSI (True Strength Index)", length)
     return get_tsi(length, smooth_len, signal_len)
 
 
-def vwma(length: int = 20) -> Callable[[PriceDataWithVol], float]:
+def vwma(length: int = 20) -> Indicator[PriceDataWithVol, float]:
     """Return a function that calculates the Volume Weighted Moving Average."""
     _validate_arg("VWMA (Volume Weighted Moving Average)", length)
     return get_vwma(length)
 
 
-def willy(length: int = 6) -> Callable[[float], float]:
+def willy(length: int = 6) -> Indicator[float, float]:
     """Return a function that calculates the Willy (A specialized Williams %R)."""
     _validate_arg("WILLY (Williams %R)", length)
     return get_willy(length)
 
 
-def wpr(length: int = 14) -> Callable[[Hlc], float]:
+def wpr(length: int = 14) -> Indicator[Hlc, float]:
     """Return a function that calculates the Williams %R."""
     _validate_arg("WPR (Williams %R)", length)
     return get_wpr(length)
 
 
-def phx() -> Callable[[Quote], PhoenixResult]:
+def phx() -> Indicator[Quote, PhoenixResult]:
     """Return a function that calculates the Phoenix Ascending Oscillator."""
     return get_phx()
@@ -0,0 +1,361 @@
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+"""Whole-series indicators computed with NumPy.
+
+Every function takes the full history and returns one value per bar, NaN
+during warm-up, matching the streaming indicators in `pure_ta.ta` to within
+floating point tolerance.
+
+Windowed indicators are computed over sliding window views. Recursive ones
+run a loop compiled with numba when it is installed, otherwise they fall back
+to the batch kernels of the streaming indicators.
+
+This module requires NumPy, importing it without NumPy raises ImportError.
+"""
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+    from numpy.typing import ArrayLike, NDArray
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "pure_ta.vectorized requires numpy, install it with `pip install numpy`"
+    ) from e
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+from pure_ta._ema import get_ema
+from pure_ta._enum_types import StDevOf
+from pure_ta._rma import get_rma
+from pure_ta._smma import get_smma
+
+FloatArray = NDArray[np.float64]
+
+
+class BollingerSeries(NamedTuple):
+    """Bollinger Bands for a whole series."""
+
+    upper: FloatArray
+    middle: FloatArray
+    lower: FloatArray
+
+
+class TsiSeries(NamedTuple):
+    """True Strength Index for a whole series."""
+
+    tsi: FloatArray
+    signal: FloatArray
+
+
+def _validate_arg(indicator: str, value: int, min_value: int = 1) -> None:
+    if value < min_value:
+        raise ValueError(
+            f"""LookBack must be greater than {min_value}
+            to calculate the {indicator}"""
+        )
+
+
+def _as_array(values: ArrayLike) -> FloatArray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _windows(values: FloatArray, length: int) -> FloatArray | None:
+    """Return a (bars - length + 1, length) view of every window, if any."""
+    if values.shape[0] < length:
+        return None
+    return sliding_window_view(values, length)
+
+
+def _nan_like(values: FloatArray) -> FloatArray:
+    return np.full(values.shape[0], np.nan)
+
+
+def _rolling_sum(values: FloatArray, length: int) -> FloatArray:
+    out = _nan_like(values)
+    windows = _windows(values, length)
+    if windows is not None:
+        out[length - 1 :] = windows.sum(axis=1)
+    return out
+
+
+def sma(values: ArrayLike, length: int = 20) -> FloatArray:
+    """The simple moving average of a whole series."""
+    _validate_arg("SMA (Simple Moving Average)", length)
+    return _rolling_sum(_as_array(values), length) / length
+
+
+def wma(values: ArrayLike, length: int = 15) -> FloatArray:
+    """The weighted moving average of a whole series."""
+    _validate_arg("WMA (Weighted Moving Average)", length)
+    data = _as_array(values)
+    out = _nan_like(data)
+    windows = _windows(data, length)
+    if windows is not None:
+        weights = np.arange(1, length + 1, dtype=np.float64)
+        out[length - 1 :] = windows @ weights / (length * (length + 1) / 2.0)
+    return out
+
+
+def std_dev(
+    values: ArrayLike, length: int = 20, bias: StDevOf = StDevOf.POPULATION
+) -> FloatArray:
+    """The rolling standard deviation of a whole series."""
+    _validate_arg("Standard Deviation", length)
+    ddof = 0 if bias == StDevOf.POPULATION else 1
+    if length - ddof < 1:
+        raise ValueError("Cannot calculate sample stdev for buffer of length 1")
+    data = _as_array(values)
+    out = _nan_like(data)
+    windows = _windows(data, length)
+    if windows is not None:
+        out[length - 1 :] = windows.std(axis=1, ddof=ddof)
+    return out
+
+
+def bb(values: ArrayLike, length: int = 20, multi: int = 2) -> BollingerSeries:
+    """The Bollinger Bands of a whole series."""
+    _validate_arg("Bollinger Bands", length)
+    data = _as_array(values)
+    middle = sma(data, length)
+    width = multi * std_dev(data, length)
+    return BollingerSeries(upper=middle + width, middle=middle, lower=middle - width)
+
+
+def _linreg_dense(data: FloatArray, length: int) -> FloatArray:
+    out = _nan_like(data)
+    windows = _windows(data, length)
+    if windows is None:
+        return out
+    x = np.arange(length, dtype=np.float64)
+    x_sum = x.sum()
+    xx_sum = (x * x).sum()
+    y_sum = windows.sum(axis=1)
+    xy_sum = windows @ x
+    slope = (length * xy_sum - x_sum * y_sum) / (length * xx_sum - x_sum**2)
+    intercept = (y_sum - slope * x_sum) / length
+    out[length - 1 :] = slope * (length - 1) + intercept
+    return out
+
+
+def linreg(values: ArrayLike, length: int = 9) -> FloatArray:
+    """The linear regression value of a whole series.
+
+    Like the streaming version, NaN values are skipped rather than breaking
+    the regression window.
+    """
+    _validate_arg("Linear Regression", length)
+    data = _as_array(values)
+    valid = ~np.isnan(data)
+    out = _nan_like(data)
+    out[valid] = _linreg_dense(data[valid], length)
+    return out
+
+
+def mfi(values: ArrayLike, volumes: ArrayLike, length: int = 14) -> FloatArray:
+    """The money flow index of a whole series of prices and volumes."""
+    _validate_arg("MFI (Money Flow Index)", length)
+    data = _as_array(values)
+    flow = data * _as_array(volumes)
+    change = np.zeros_like(data)
+    change[1:] = np.diff(data)
+    upper = _rolling_sum(np.where(change > 0, flow, 0.0), length)
+    lower = _rolling_sum(np.where(change < 0, flow, 0.0), length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(lower != 0, 100 - (100 / (upper / lower + 1)), 100.0)
+    result[np.isnan(upper) | np.isnan(lower)] = np.nan
+    return result
+
+
+def vwma(values: ArrayLike, volumes: ArrayLike, length: int = 20) -> FloatArray:
+    """The volume weighted moving average of a whole series."""
+    _validate_arg("VWMA (Volume Weighted Moving Average)", length)
+    vol = _as_array(volumes)
+    pv_sum = _rolling_sum(_as_array(values) * vol, length)
+    vol_sum = _rolling_sum(vol, length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(vol_sum != 0, pv_sum / vol_sum, np.nan)
+
+
+def _rolling_extremum(
+    values: FloatArray, length: int, reduce: Callable[..., Any]
+) -> FloatArray:
+    # NaN is skipped by `np.fmax` and `np.fmin`, like `SlidingMax` and
+    # `SlidingMin`, and only left when the whole window is NaN.
+    out = _nan_like(values)
+    windows = _windows(values, length)
+    if windows is not None:
+        out[length - 1 :] = reduce(windows, axis=1)
+    return out
+
+
+def willy(values: ArrayLike, length: int = 6) -> FloatArray:
+    """The Willy (a specialized Williams %R) of a whole series."""
+    _validate_arg("WILLY (Williams %R)", length)
+    data = _as_array(values)
+    high = _rolling_extremum(data, length, np.fmax.reduce)
+    low = _rolling_extremum(data, length, np.fmin.reduce)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 60 * (data - high) / (high - low) + 80
+
+
+def wpr(
+    high: ArrayLike, low: ArrayLike, close: ArrayLike, length: int = 14
+) -> FloatArray:
+    """The Williams %R of a whole series of highs, lows and closes."""
+    _validate_arg("WPR (Williams %R)", length)
+    highest = _rolling_extremum(_as_array(high), length, np.fmax.reduce)
+    lowest = _rolling_extremum(_as_array(low), length, np.fmin.reduce)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return -100 * (highest - _as_array(close)) / (highest - lowest)
+
+
+def _ema_loop(data: FloatArray, length: int) -> FloatArray:
+    out = np.empty(data.shape[0])
+    alpha = 2 / (length + 1)
+    ema = np.nan
+    total = 0.0
+    count = 0
+    seeded = False
+    for i in range(data.shape[0]):
+        value = data[i]
+        if np.isnan(value):
+            out[i] = value
+            continue
+        if seeded:
+            ema = (value - ema) * alpha + ema
+        else:
+            count += 1
+            total += value
+            if count == length:
+                ema = total / length
+                seeded = True
+        out[i] = ema
+    return out
+
+
+def _rma_loop(data: FloatArray, length: int) -> FloatArray:
+    out = np.empty(data.shape[0])
+    alpha = 1.0 / length
+    rma = np.nan
+    total = 0.0
+    count = 0
+    seeded = False
+    for i in range(data.shape[0]):
+        value = data[i]
+        if seeded:
+            rma = alpha * value + (1 - alpha) * rma
+        elif np.isnan(value):
+            total = 0.0
+            count = 0
+        else:
+            total += value
+            count += 1
+            if count == length:
+                rma = total / length
+                seeded = True
+        out[i] = rma
+    return out
+
+
+def _smma_loop(data: FloatArray, length: int) -> FloatArray:
+    out = np.empty(data.shape[0])
+    smma = np.nan
+    total = 0.0
+    count = 0
+    for i in range(data.shape[0]):
+        value = data[i]
+        if not np.isnan(smma):
+            smma = ((smma * (length - 1)) + value) / length
+            if np.isnan(smma):
+                total = 0.0
+                count = 0
+        elif np.isnan(value):
+            total = 0.0
+            count = 0
+        else:
+            total += value
+            count += 1
+            if count == length:
+                smma = total / length
+        out[i] = smma
+    return out
+
+
+def _recursive(
+    loop: Callable[[FloatArray, int], FloatArray],
+    factory: Callable[[int], Any],
+) -> Callable[[FloatArray, int], FloatArray]:
+    """Compile `loop` with numba, or fall back to the streaming batch kernel."""
+    if njit is not None:
+        return njit(cache=True)(loop)  # type: ignore[no-any-return]
+
+    def fallback(data: FloatArray, length: int) -> FloatArray:
+        return np.frombuffer(factory(length).update_many(data.tolist()))
+
+    return fallback
+
+
+_ema_kernel = _recursive(_ema_loop, get_ema)
+_rma_kernel = _recursive(_rma_loop, get_rma)
+_smma_kernel = _recursive(_smma_loop, get_smma)
+
+
+def ema(values: ArrayLike, length: int = 20) -> FloatArray:
+    """The exponential moving average of a whole series."""
+    _validate_arg("EMA (Exponential Moving Average)", length)
+    return _ema_kernel(_as_array(values), length)
+
+
+def rma(values: ArrayLike, length: int = 14) -> FloatArray:
+    """The relative moving average of a whole series."""
+    _validate_arg("RMA (Relative Moving Average)", length)
+    return _rma_kernel(_as_array(values), length)
+
+
+def smma(values: ArrayLike, length: int = 20) -> FloatArray:
+    """The smoothed moving average of a whole series."""
+    _validate_arg("SMMA (Smoothed Moving Average)", length)
+    return _smma_kernel(_as_array(values), length)
+
+
+def dema(values: ArrayLike, length: int = 20) -> FloatArray:
+    """The double exponential moving average of a whole series."""
+    _validate_arg("DEMA (Double Exponential Moving Average)", length)
+    ema1 = _ema_kernel(_as_array(values), length)
+    ema2 = _ema_kernel(ema1, length)
+    result = 2 * ema1 - ema2
+    result[np.isnan(ema1) | np.isnan(ema2)] = np.nan
+    return result
+
+
+def tema(values: ArrayLike, length: int = 20) -> FloatArray:
+    """The triple exponential moving average of a whole series."""
+    _validate_arg("TEMA (Triple Exponential Moving Average)", length)
+    ema1 = _ema_kernel(_as_array(values), length)
+    ema2 = _ema_kernel(ema1, length)
+    ema3 = _ema_kernel(ema2, length)
+    result = (ema1 * 3) - (ema2 * 3) + ema3
+    result[np.isnan(ema1) | np.isnan(ema2) | np.isnan(ema3)] = np.nan
+    return result
+
+
+def tsi(
+    values: ArrayLike, length: int = 25, smooth_len: int = 13, signal_len: int = 13
+) -> TsiSeries:
+    """The true strength index and its signal line for a whole series."""
+    _validate_arg("TSI (True Strength Index)", length)
+    data = _as_array(values)
+    pc = np.full(data.shape[0], np.nan)
+    pc[1:] = np.diff(data)
+    smooth_pc = _ema_kernel(_ema_kernel(pc, length), smooth_len)
+    smooth_apc = _ema_kernel(_ema_kernel(np.abs(pc), length), smooth_len)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(smooth_apc != 0, smooth_pc * 100 / smooth_apc, 0.0)
+    result[np.isnan(smooth_pc) | np.isnan(smooth_apc)] = np.nan
+    return TsiSeries(tsi=result, signal=_ema_kernel(result, signal_len))
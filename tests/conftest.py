@@ -7,6 +7,7 @@ from typing import Any, Generator
 
 import pytest
 
+from pure_ta._quote_series import QuoteSeries
 from pure_ta._types import Quote
 
 
@@ -48,6 +49,15 @@ def _get_quotes(filename: str, days: int, use_timestamp: bool = False):
     return quotes
 
 
+def _get_quote_series(filename: str, days: int) -> QuoteSeries:
+    filepath = os.path.join("tests", "data", filename)
+    with codecs.open(filepath, "r", encoding="utf-8") as file:
+        next(file)  # Skip the header row
+        return QuoteSeries.from_quotes(
+            quote_from_csv(line) for _, line in zip(range(days), file)
+        )
+
+
 @pytest.fixture(scope="package")
 def get_default(days: int = 502) -> list[Quote]:
     """gets the default quotes."""
@@ -166,3 +176,14 @@ def get_btc_tsi(days: int = 900):
 
 def get_longish(days: int = 5285):  # type: ignore
     yield from _read_file_stream("longish.csv", days)
+
+
+@pytest.fixture(scope="package")
+def get_longish_series(days: int = 5285) -> QuoteSeries:
+    return _get_quote_series("longish.csv", days)
+
+
+@pytest.fixture(scope="package")
+def get_intraday(days: int = 1564) -> list[Quote]:
+    """gets one minute quotes."""
+    return _get_quotes("intraday.csv", days)
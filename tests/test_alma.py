@@ -2,6 +2,7 @@
 import math
 
 from pure_ta import Quote, ta
+from pure_ta._alma import _alma_kernel
 
 # expected results.
 # https://docs.google.com/spreadsheets/d/1T14VAhzM14Yqf4sjE7UEcl1yJUyS27TRLPf0Bg-n3BY/edit?usp=sharing.
@@ -32,3 +33,11 @@ def test_alma_returns_correct_calculation_results(get_default: list[Quote]):
     assert round(results[24], 4) == 216.0619
     assert round(results[249], 4) == 257.5787
     assert round(results[501], 4) == 242.1871
+
+
+def test_alma_instances_share_kernel():
+    """Instances with the same parameters should reuse one weight kernel."""
+    first = _alma_kernel(20, 0.85, 6.0)
+    second = _alma_kernel(20, 0.85, 6.0)
+    assert first is second
+    assert math.isclose(math.fsum(first), 1.0)
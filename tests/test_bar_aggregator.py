@@ -0,0 +1,149 @@
+"""bar aggregator tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Any
+
+import pytest
+
+from pure_ta import BarAggregator, Quote, TimeFrame, ta
+
+
+def _bars(quotes: list[Quote], period: Callable[[datetime], Any]) -> list[Quote]:
+    bars = []
+    for start, group in groupby(quotes, key=lambda q: period(q.time)):
+        group = list(group)
+        bars.append(
+            Quote(
+                time=start,
+                o=group[0].open,
+                h=max(q.high for q in group),
+                l=min(q.low for q in group),
+                c=group[-1].close,
+                v=sum(q.vol for q in group),
+            )
+        )
+    return bars
+
+
+def _floor(minutes: int) -> Callable[[datetime], datetime]:
+    def period(time: datetime) -> datetime:
+        return time.replace(minute=time.minute - time.minute % minutes)
+
+    return period
+
+
+def _same_bars(result: list[Quote], expected: list[Quote]) -> bool:
+    return [(b.time, b.open, b.high, b.low, b.close) for b in result] == [
+        (b.time, b.open, b.high, b.low, b.close) for b in expected
+    ] and [b.vol for b in result] == pytest.approx([b.vol for b in expected])
+
+
+@pytest.mark.parametrize(
+    "time_frame, minutes",
+    [(TimeFrame.FIVE_MIN, 5), (TimeFrame.FIFTEEN_MIN, 15), (TimeFrame.ONE_HOUR, 60)],
+)
+def test_aggregates_intraday_quotes(
+    get_intraday: list[Quote], time_frame: TimeFrame, minutes: int
+):
+    """Completed and flushed bars should match grouping the quotes by period."""
+    aggregator = BarAggregator(time_frame)
+    bars = aggregator.update_many(get_intraday)
+    bars.append(aggregator.flush())
+
+    expected = _bars(get_intraday, _floor(minutes) if minutes < 60 else _hour)
+    assert _same_bars(bars, expected)
+
+
+def _hour(time: datetime) -> datetime:
+    return time.replace(minute=0)
+
+
+def test_aggregates_calendar_months(get_default: list[Quote]):
+    """Months should follow the calendar rather than a fixed length."""
+    aggregator = BarAggregator(TimeFrame.MONTH)
+    bars = aggregator.update_many(get_default)
+    bars.append(aggregator.flush())
+
+    expected = _bars(get_default, lambda t: datetime(t.year, t.month, 1))
+    assert len(expected) == 24
+    assert _same_bars(bars, expected)
+
+
+def test_weeks_start_on_monday(get_default: list[Quote]):
+    """Weekly bars should be timed at the monday of their week."""
+    bars = BarAggregator(TimeFrame.WEEK).update_many(get_default)
+
+    expected = _bars(
+        get_default, lambda t: datetime(t.year, t.month, t.day) - timedelta(t.weekday())
+    )
+    assert all(bar.time.weekday() == 0 for bar in bars)
+    assert _same_bars(bars, expected[: len(bars)])
+
+
+def test_forming_bar_tracks_the_open_period():
+    """The forming bar should include every quote of the current period."""
+    start = datetime(2023, 1, 2, 10)
+    aggregator = BarAggregator(TimeFrame.ONE_HOUR)
+    assert aggregator.forming is None
+
+    assert aggregator.update(Quote(start, 10, 12, 9, 11, 100)) is None
+    assert (
+        aggregator.update(Quote(start.replace(minute=30), 11, 15, 10, 14, 50)) is None
+    )
+    forming = aggregator.forming
+
+    assert forming is not None
+    assert (forming.time, forming.open, forming.high, forming.low) == (start, 10, 15, 9)
+    assert (forming.close, forming.vol, aggregator.count) == (14, 150, 2)
+
+    completed = aggregator.update(Quote(start.replace(hour=12), 14, 14, 13, 13, 10))
+    assert completed == forming
+    assert aggregator.forming.time == start.replace(hour=12)
+
+
+def test_quotes_before_origin_start_a_bar():
+    """Quotes in the periods before `origin` should build bars like any other."""
+    origin = datetime(2023, 7, 3, 9, 30)
+    aggregator = BarAggregator(TimeFrame.ONE_HOUR, origin=origin)
+    quotes = [
+        Quote(datetime(2023, 7, 3, 9, 15 * i), 10 + i, 20, 5 + i, 16.5, 5)
+        for i in range(4)
+    ]
+
+    (first,) = aggregator.update_many(quotes)
+
+    assert (first.time, first.open, first.high, first.low) == (
+        origin - timedelta(hours=1),
+        10,
+        20,
+        5,
+    )
+    assert (first.close, first.vol) == (16.5, 10)
+    assert aggregator.flush().time == origin
+
+
+def test_out_of_order_quotes_are_rejected():
+    """A quote older than the forming bar should raise."""
+    aggregator = BarAggregator(TimeFrame.ONE_HOUR)
+    aggregator.update(Quote(datetime(2023, 1, 2, 10), 1, 1, 1, 1, 1))
+
+    with pytest.raises(ValueError):
+        aggregator.update(Quote(datetime(2023, 1, 2, 9), 1, 1, 1, 1, 1))
+
+
+def test_completed_bars_feed_indicators(get_intraday: list[Quote]):
+    """Completed bars can be passed straight to indicators."""
+    aggregator = BarAggregator(TimeFrame.FIVE_MIN)
+    atr = ta.atr(3)
+    results = [
+        atr(bar.hlc) for bar in map(aggregator.update, get_intraday) if bar is not None
+    ]
+
+    expected = ta.atr(3).update_many(
+        [bar.hlc for bar in _bars(get_intraday, _floor(5))][: len(results)]
+    )
+    assert results == pytest.approx(list(expected), nan_ok=True)
@@ -44,3 +44,12 @@ def test_bbwp_returns_correct_calculation_results(get_eth_bbwp: list[Quote]):
     assert round(results[589], 6) == 25.793651
 
     assert round(results[699], 6) == 55.158730
+
+
+def test_bbwp_rank_length_is_configurable(get_eth_bbwp: list[Quote]):
+    """A shorter rank window should produce results sooner."""
+    bbwp = ta.bbwp(rank_length=100)
+    results = [bbwp(q.close) for q in get_eth_bbwp]
+    results_without_nan = [result for result in results if not isnan(result)]
+    assert len(results_without_nan) == 600
+    assert all(0 <= result <= 100 for result in results_without_nan)
@@ -0,0 +1,78 @@
+"""benchmark harness tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from pure_ta import bench, ta
+from pure_ta.bench.__main__ import main
+from pure_ta.bench._bench import time_batch
+
+
+def test_every_ta_function_is_benchmarked():
+    """Every public function of `ta` should be found with its input."""
+    found = bench.indicators()
+
+    assert {"sma", "atr", "mfi", "phx", "tsi"} <= set(found)
+    assert all(found[name][0] is getattr(ta, name) for name in found)
+
+
+def test_run_save_and_compare(tmp_path: Path):
+    """Measurements should round trip through a baseline and be compared."""
+    quotes = bench.load_quotes(bench.DATA_DIR / "default.csv")
+    results = bench.run({"default": quotes}, ["ema", "atr"], repeat=1)
+
+    assert [(m.indicator, m.mode) for m in results] == [
+        ("ema", "streaming"),
+        ("ema", "batch"),
+        ("atr", "streaming"),
+        ("atr", "batch"),
+    ]
+    assert all(m.bars == len(quotes) and m.p99_ns >= m.median_ns for m in results)
+
+    path = tmp_path / "baseline.json"
+    bench.save(results, path)
+    baseline = bench.load(path)
+
+    assert list(baseline.values()) == results
+    assert bench.compare(results, baseline) == []
+    slower = [replace(m, median_ns=m.median_ns * 2 + 1) for m in results]
+    assert [new for new, _ in bench.compare(slower, baseline)] == slower
+
+
+def test_batches_are_timed_in_chunks():
+    """Batch mode should give one sample per chunk, enough for a percentile."""
+    samples = time_batch(ta.sma, [1.0] * 1000, repeat=2, chunk=100)
+
+    assert len(samples) == 20
+
+
+def test_percentile():
+    """Percentiles should use the nearest rank."""
+    values = list(range(1, 101))
+
+    assert bench.percentile(values, 50) == 50
+    assert bench.percentile(values, 99) == 99
+    assert bench.percentile([7], 99) == 7
+
+
+def test_main_saves_a_baseline(tmp_path: Path, capsys):
+    """The command line should print a table and write the baseline."""
+    path = tmp_path / "baseline.json"
+    argv = ["sma", "--datasets", "default", "--repeat", "1", "--mode", "batch"]
+
+    assert main([*argv, "--save", str(path)]) == 0
+    assert list(bench.load(path)) == ["sma/batch/default"]
+    assert "sma" in capsys.readouterr().out
+    assert main([*argv, "--compare", str(path), "--tolerance", "100"]) == 0
+
+
+def test_main_needs_the_data(tmp_path: Path, capsys):
+    """A missing data directory should be reported, not fail on a csv file."""
+    with pytest.raises(SystemExit):
+        main(["sma", "--data", str(tmp_path / "missing")])
+
+    assert "--data" in capsys.readouterr().err
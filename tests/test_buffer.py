@@ -99,3 +99,41 @@ def test_circular_buf_fill_up():
             assert buf.is_full is False
         else:
             assert buf.is_full is True
+
+
+def test_circular_buf_indexed_access():
+    """Index 0 should be the oldest value, -1 the newest."""
+    buf = CircularBuf(4)
+    # sourcery skip: no-loop-in-tests
+    for val in [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]:
+        buf.put(val)
+
+    assert [buf[i] for i in range(4)] == [3.0, 4.0, 5.0, 6.0]
+    assert buf[-1] == 6.0
+    assert len(buf) == 4
+
+
+def test_circular_buf_put_returns_evicted_value():
+    """Putting into a full buffer should return the evicted value."""
+    buf = CircularBuf(2)
+    assert isnan(buf.put(1.0))
+    assert isnan(buf.put(2.0))
+    assert buf.put(3.0) == 1.0
+    assert buf.put(4.0) == 2.0
+
+
+def test_circular_buf_segments_are_views():
+    """The segments should cover the buffer in order without copying."""
+    buf = CircularBuf(3)
+    buf.put(1.0)
+    older, newer = buf.segments()
+    assert older.tolist() == [1.0]
+    assert newer.tolist() == []
+
+    # sourcery skip: no-loop-in-tests
+    for val in [2.0, 3.0, 4.0]:
+        buf.put(val)
+
+    older, newer = buf.segments()
+    assert older.tolist() + newer.tolist() == [2.0, 3.0, 4.0]
+    assert older.obj is newer.obj
@@ -2,7 +2,7 @@
 # Copyright 2023 Takin Profit. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
-from math import isnan
+from math import isclose, isnan
 
 from pure_ta import Quote, ta
 
@@ -36,3 +36,26 @@ def test_er_returns_correct_calculation_results(get_eth_er: list[Quote]) -> None
     assert round(results[92], 6) == 19.972991
     assert round(results[313], 5) == 81.92721
     assert round(results[438], 5) == 53.67261
+
+
+def test_er_matches_full_recalculation(get_eth_er: list[Quote]) -> None:
+    """The rolling change sum should match summing the window every bar."""
+    length = 10
+    er = ta.er(length=length)
+    closes = [q.close for q in get_eth_er]
+    # sourcery skip: no-loop-in-tests
+    for i, close in enumerate(closes):
+        result = er(close)
+        # sourcery skip: no-conditionals-in-tests
+        if i >= length:
+            window = closes[i - length : i + 1]
+            total = sum(abs(b - a) for a, b in zip(window, window[1:]))
+            expected = (close - window[0]) / total * 100 if total != 0 else 0.0
+            assert isclose(result, expected, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_er_is_zero_for_flat_prices() -> None:
+    """A window without any change should have an efficiency ratio of zero."""
+    er = ta.er(length=3)
+    results = [er(v) for v in [1.5, 1.5, 1.5, 1.5, 1.5]]
+    assert results[3:] == [0.0, 0.0]
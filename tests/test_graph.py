@@ -0,0 +1,116 @@
+"""indicator graph tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from math import isnan
+from typing import Any
+
+import pytest
+
+from pure_ta import AtrSlMaType, Hlc, Quote, graph, ta
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, int | float):
+        return a == pytest.approx(b, rel=1e-9) or (isnan(a) and isnan(b))
+    return all(_same(getattr(a, field), getattr(b, field)) for field in a.__slots__)
+
+
+def test_identical_nodes_are_equal():
+    """Nodes with the same function, parameters and input should be equal."""
+    close = graph.source("close")
+
+    assert graph.node(ta.ema, close) == graph.node(ta.ema, close, length=20)
+    assert graph.node(ta.ema, close) != graph.node(ta.ema, close, length=10)
+    assert graph.node(ta.ema, close) != graph.node(ta.ema, graph.source("open"))
+
+
+def test_graph_shares_identical_nodes():
+    """Shared sub-indicators should only be computed once per bar."""
+    g = graph.IndicatorGraph()
+    g.subscribe("bb", graph.bb(length=13))
+    g.subscribe("bbwp", graph.bbwp(length=13))
+    # close, moments, bb, bbw, percent_rank
+    assert len(g) == 5
+
+    g.subscribe("atr_sl", graph.atr_sl())
+    g.subscribe("atr", graph.atr())
+    # hlc, tr, rma, atr_sl
+    assert len(g) == 9
+
+
+@pytest.mark.parametrize(
+    "output, factory, source",
+    [
+        (graph.atr(), ta.atr, lambda q: q.hlc),
+        (graph.atr_sl(), ta.atr_sl, lambda q: q.hlc),
+        (
+            graph.atr_sl(ma_type=AtrSlMaType.WMA),
+            lambda: ta.atr_sl(ma_type=AtrSlMaType.WMA),
+            lambda q: q.hlc,
+        ),
+        (graph.bb(), ta.bb, lambda q: q.close),
+        (graph.bbw(), ta.bbw, lambda q: q.close),
+        (
+            graph.bbwp(rank_length=50),
+            lambda: ta.bbwp(rank_length=50),
+            lambda q: q.close,
+        ),
+        (graph.tsi(), ta.tsi, lambda q: q.close),
+        (graph.phx(), ta.phx, lambda q: q),
+    ],
+)
+def test_graph_matches_streaming(
+    get_default: list[Quote], output: graph.Node, factory: Any, source: Any
+):
+    """Composite nodes should match the streaming indicators."""
+    g = graph.IndicatorGraph({"out": output, "sma": graph.node(ta.sma, graph.CLOSE)})
+    streamed = factory()
+
+    for q in get_default:
+        assert _same(g.update(q)["out"], streamed(source(q)))
+
+
+def test_expressions_are_computed_per_bar():
+    """Expression nodes should substitute their inputs into the template."""
+    g = graph.IndicatorGraph(
+        {"mid": graph.expr("({0} + {1}) / 2", graph.source("high"), graph.CLOSE)}
+    )
+
+    assert g.update(Hlc(high=4.0, low=1.0, close=2.0))["mid"] == 3.0
+
+
+def test_late_subscriptions_keep_shared_state(get_default: list[Quote]):
+    """Nodes added later should reuse the state of nodes already running."""
+    g = graph.IndicatorGraph({"ema": graph.node(ta.ema, graph.CLOSE, length=10)})
+    ema = ta.ema(10)
+    for q in get_default[:100]:
+        g.update(q)
+        ema(q.close)
+
+    g.subscribe("same", graph.node(ta.ema, graph.CLOSE, length=10))
+
+    for q in get_default[100:]:
+        results = g.update(q)
+        expected = ema(q.close)
+        assert results["ema"] == expected
+        assert results["same"] == expected
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "().__class__",
+        "{0}.__class__",
+        "__import__('os')",
+        "open('x')",
+        "[{0}]",
+        "'a'",
+        "(lambda: 1)()",
+        "{1}",
+    ],
+)
+def test_expressions_only_allow_arithmetic(template: str):
+    """Templates that could run arbitrary code should be rejected."""
+    with pytest.raises(ValueError):
+        graph.expr(template, graph.CLOSE)
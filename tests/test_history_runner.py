@@ -0,0 +1,86 @@
+"""history runner tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pure_ta import HistoryRunner, Quote, ta
+from tests.test_update_many import _same
+
+CASES = [
+    (ta.ema, {"length": 20}),
+    (ta.kama, {}),
+    (ta.tsi, {}),
+    (ta.tci, {}),
+    (ta.wma, {"length": 9}),
+]
+
+
+@pytest.mark.parametrize("factory, params", CASES)
+def test_correction_matches_full_rerun(
+    get_default: list[Quote], factory: Callable[..., Any], params: dict
+):
+    """Correcting a bar should give the results of rerunning every bar."""
+    closes = [q.close for q in get_default]
+    runner = HistoryRunner(factory, every=50, **params)
+    runner.extend(closes)
+
+    for index in [0, 49, 50, 177, len(closes) - 1]:
+        closes[index] *= 1.01
+        tail = runner.correct(index, closes[index])
+        expected = factory(**params).update_many(closes)
+
+        assert all(map(_same, runner.results, expected))
+        assert all(map(_same, tail, expected[index:]))
+    assert runner.checkpoints == len(closes) // 50 + 1
+
+
+@pytest.mark.parametrize("factory, params", CASES)
+def test_state_at_continues_the_history(
+    get_default: list[Quote], factory: Callable[..., Any], params: dict
+):
+    """The state at a bar should continue exactly like the full history."""
+    closes = [q.close for q in get_default]
+    runner = HistoryRunner(factory, every=64, **params)
+    for close in closes:
+        runner.append(close)
+    expected = factory(**params).update_many(closes)
+
+    for index in [0, 63, 64, 100, len(closes) - 2]:
+        state = runner.state_at(index)
+        assert _same(state(closes[index + 1]), expected[index + 1])
+
+
+def test_index_is_checked():
+    """Bars outside the history should raise an IndexError."""
+    runner = HistoryRunner(ta.sma, every=2, length=3)
+    runner.extend([1.0, 2.0, 3.0])
+
+    assert runner.correct(-1, 6.0) == [3.0]
+    with pytest.raises(IndexError):
+        runner.correct(3, 1.0)
+    with pytest.raises(IndexError):
+        runner.state_at(-4)
+    with pytest.raises(ValueError):
+        HistoryRunner(ta.sma, every=0)
+
+
+def test_failed_updates_leave_the_history():
+    """A bar that raises should leave the history and checkpoints as they were."""
+    runner = HistoryRunner(ta.willy, every=2, length=2)
+    runner.extend([1.0, 2.0, 3.0])
+    results = runner.results
+
+    # a flat window divides by zero.
+    with pytest.raises(ZeroDivisionError):
+        runner.extend([4.0, 4.0])
+    with pytest.raises(ZeroDivisionError):
+        runner.correct(2, 2.0)
+
+    assert runner.bars == [1.0, 2.0, 3.0]
+    assert all(map(_same, runner.results, results))
+    assert runner.checkpoints == 2
+    assert runner.append(4.0) == ta.willy(2).update_many([1.0, 2.0, 3.0, 4.0])[-1]
@@ -38,3 +38,27 @@ def test_should_return_the_correct_calculation_values(get_default: list[Quote]):
     assert round(results[473], 4) == 63.2747
     assert round(results[177], 4) == 74.7191
     assert round(results[325], 4) == 56.2805
+
+
+def test_mfi_matches_full_recalculation(get_default: list[Quote]):
+    """The running flow sums should match summing the window every bar."""
+    length = 14
+    mfi = ta.mfi(length=length)
+    data = [q.hlc3_with_vol for q in get_default]
+    upper = [0.0]
+    lower = [0.0]
+    # sourcery skip: no-loop-in-tests
+    for prev, cur in zip(data, data[1:]):
+        flow = cur.value * cur.volume
+        upper.append(flow if cur.value > prev.value else 0.0)
+        lower.append(flow if cur.value < prev.value else 0.0)
+
+    # sourcery skip: no-loop-in-tests
+    for i, d in enumerate(data):
+        result = mfi(d)
+        # sourcery skip: no-conditionals-in-tests
+        if i >= length - 1:
+            upper_sum = sum(upper[i - length + 1 : i + 1])
+            lower_sum = sum(lower[i - length + 1 : i + 1])
+            expected = 100 - 100 / (upper_sum / lower_sum + 1) if lower_sum else 100
+            assert math.isclose(result, expected, rel_tol=1e-9)
@@ -0,0 +1,99 @@
+"""multi symbol engine tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from math import isnan, nan
+
+import pytest
+
+from pure_ta import EmaColumns, MultiSymbolEngine, Quote, RmaColumns, RsiColumns, ta
+
+try:
+    import numpy  # noqa: F401
+
+    BACKENDS = [False, True]
+except ImportError:
+    BACKENDS = [False]
+
+FIXTURES = ["get_default", "get_eth_rma", "get_gold_willy", "get_gold_lin_reg"]
+BARS = 500
+
+
+def _same(a: float, b: float) -> bool:
+    return a == pytest.approx(b, rel=1e-9) or (isnan(a) and isnan(b))
+
+
+@pytest.fixture()
+def instruments(request: pytest.FixtureRequest) -> list[list[Quote]]:
+    """The first bars of several instruments."""
+    return [request.getfixturevalue(name)[:BARS] for name in FIXTURES]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_engine_matches_streaming(instruments: list[list[Quote]], use_numpy: bool):
+    """Every column should match the streaming indicators of its instrument."""
+    engine = MultiSymbolEngine(FIXTURES, use_numpy=use_numpy)
+    streams = [(ta.ema(), ta.rsi(), ta.atr(), ta.bb()) for _ in range(len(instruments))]
+
+    for bar in range(BARS):
+        quotes = [quotes[bar] for quotes in instruments]
+        result = engine.update(
+            [q.close for q in quotes],
+            highs=[q.high for q in quotes],
+            lows=[q.low for q in quotes],
+        )
+
+        for i, (q, (ema, rsi, atr, bb)) in enumerate(zip(quotes, streams)):
+            expected_bb = bb(q.close)
+            assert _same(result.ema[i], ema(q.close))
+            assert _same(result.rsi[i], rsi(q.close))
+            assert _same(result.atr[i], atr(q.hlc))
+            assert _same(result.bb.upper[i], expected_bb.upper)
+            assert _same(result.bb.middle[i], expected_bb.middle)
+            assert _same(result.bb.lower[i], expected_bb.lower)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_columns_handle_nan_like_streaming(use_numpy: bool):
+    """NaN values should be handled per instrument like the streaming versions."""
+    data = [
+        [1.0, 2.0, nan, 4.0, 5.0, 6.0, 7.0, nan, 9.0, 10.0],
+        [3.0, nan, 5.0, 4.0, 6.0, 8.0, 7.0, 9.0, nan, 12.0],
+    ]
+
+    for columns_type, factory in [
+        (EmaColumns, ta.ema),
+        (RmaColumns, ta.rma),
+        (RsiColumns, ta.rsi),
+    ]:
+        columns = columns_type(len(data), 3, use_numpy=use_numpy)
+        expected = [factory(3).update_many(series) for series in data]
+
+        for bar in range(len(data[0])):
+            result = columns.update([series[bar] for series in data])
+            for i in range(len(data)):
+                assert _same(result[i], expected[i][bar])
+
+
+def test_engine_accepts_a_mapping_of_closes():
+    """Symbols missing from a mapping should be taken as NaN."""
+    engine = MultiSymbolEngine(["a", "b"], ema_length=2, use_numpy=False)
+    engine.update({"a": 1.0, "b": 2.0})
+    result = engine.update({"a": 3.0})
+
+    assert result.ema[engine.index("a")] == 2.0
+    assert isnan(result.ema[engine.index("b")])
+
+
+def test_engine_rejects_wrong_number_of_values():
+    """Every update needs exactly one value per symbol."""
+    engine = MultiSymbolEngine(["a", "b"], use_numpy=False)
+
+    with pytest.raises(ValueError):
+        engine.update([1.0])
+
+
+def test_engine_rejects_duplicate_symbols():
+    """Symbols must be unique."""
+    with pytest.raises(ValueError):
+        MultiSymbolEngine(["a", "a"])
@@ -0,0 +1,68 @@
+"""multi time frame runner tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import pytest
+
+from pure_ta import BarAggregator, MultiTimeFrameRunner, Quote, TimeFrame, ta
+
+
+def _runner() -> MultiTimeFrameRunner:
+    runner = MultiTimeFrameRunner()
+    runner.subscribe("rsi_1m", None, ta.rsi, length=5)
+    runner.subscribe("rsi_5m", TimeFrame.FIVE_MIN, ta.rsi, length=5)
+    runner.subscribe("atr_5m", TimeFrame.FIVE_MIN, ta.atr, source="hlc", length=5)
+    runner.subscribe("ema_1h", TimeFrame.ONE_HOUR, ta.ema, length=3)
+    return runner
+
+
+def test_time_frames_match_separate_pipelines(get_intraday: list[Quote]):
+    """Each subscription should match aggregating and streaming it alone."""
+    runner = _runner()
+    results: dict[str, list] = {}
+    for quote in get_intraday:
+        for name, value in runner.update(quote).items():
+            results.setdefault(name, []).append(value)
+
+    five_min = BarAggregator(TimeFrame.FIVE_MIN).update_many(get_intraday)
+    hourly = BarAggregator(TimeFrame.ONE_HOUR).update_many(get_intraday)
+    expected = {
+        "rsi_1m": ta.rsi(5).update_many([q.close for q in get_intraday]),
+        "rsi_5m": ta.rsi(5).update_many([bar.close for bar in five_min]),
+        "atr_5m": ta.atr(5).update_many([bar.hlc for bar in five_min]),
+        "ema_1h": ta.ema(3).update_many([bar.close for bar in hourly]),
+    }
+    for name, values in expected.items():
+        assert results[name] == pytest.approx(list(values), nan_ok=True)
+    assert runner.values["ema_1h"] == results["ema_1h"][-1]
+
+
+def test_preview_does_not_commit_state(get_intraday: list[Quote]):
+    """Previews should give the forming bar's result without advancing."""
+    runner = _runner()
+    twin = _runner()
+    aggregator = BarAggregator(TimeFrame.FIVE_MIN)
+    closes: list[float] = []
+    for quote in get_intraday[:200]:
+        closed = aggregator.update(quote)
+        if closed is not None:
+            closes.append(closed.close)
+        runner.update(quote)
+        twin.update(quote)
+        preview = runner.preview()
+
+        assert set(preview) == {"rsi_5m", "atr_5m", "ema_1h"}
+        forming = ta.rsi(5).update_many([*closes, aggregator.forming.close])
+        assert preview["rsi_5m"] == pytest.approx(forming[-1], nan_ok=True)
+
+    for quote in get_intraday[200:]:
+        assert runner.update(quote) == pytest.approx(twin.update(quote), nan_ok=True)
+
+
+def test_names_are_unique():
+    """Subscribing a name twice should raise."""
+    runner = MultiTimeFrameRunner()
+    runner.subscribe("rsi", TimeFrame.ONE_HOUR, ta.rsi)
+
+    with pytest.raises(ValueError):
+        runner.subscribe("rsi", TimeFrame.ONE_DAY, ta.rsi)
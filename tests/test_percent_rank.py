@@ -44,3 +44,17 @@ def test_percent_rank_returns_correct_calculation_results(
     assert results[400] == 20
     assert results[501] == 50
     assert results[628] == 15
+
+
+def test_percent_rank_matches_window_scan(get_crude_percent_rank: list[Quote]):
+    """The sorted window should rank like scanning the whole window."""
+    length = 20
+    percent_rank = ta.percent_rank(length=length)
+    closes = [q.close for q in get_crude_percent_rank]
+    # sourcery skip: no-loop-in-tests
+    for i, close in enumerate(closes):
+        result = percent_rank(close)
+        # sourcery skip: no-conditionals-in-tests
+        if i >= length:
+            window = closes[i - length : i]
+            assert result == sum(v <= close for v in window) * 100.0 / length
@@ -0,0 +1,190 @@
+"""compiled pipeline tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from math import isnan
+from typing import Any
+
+import pytest
+
+from pure_ta import HistoryRunner, Quote, graph, restore, snapshot, ta
+from pure_ta.pipeline import compile_pipeline
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, int | float):
+        return a == b or (isnan(a) and isnan(b))
+    return all(_same(getattr(a, field), getattr(b, field)) for field in a.__slots__)
+
+
+@pytest.mark.parametrize("bar_type", [None, Quote])
+def test_compiled_phx_matches_streaming(get_eur_usd_phx: list[Quote], bar_type):
+    """The compiled Phoenix should give exactly the streaming results."""
+    phx = compile_pipeline(graph.phx(), bar_type)
+    streamed = ta.phx()
+
+    for q in get_eur_usd_phx:
+        assert _same(phx(q), streamed(q))
+
+
+@pytest.mark.parametrize(
+    "output, factory, source",
+    [
+        (graph.node(ta.sma, graph.CLOSE, length=5), lambda: ta.sma(5), "close"),
+        (graph.node(ta.ema, graph.CLOSE, length=5), lambda: ta.ema(5), "close"),
+        (graph.node(ta.rsi, graph.CLOSE, length=5), lambda: ta.rsi(5), "close"),
+        (graph.node(ta.tci, graph.CLOSE, length=5), lambda: ta.tci(5), "close"),
+        (graph.node(ta.willy, graph.CLOSE, length=5), lambda: ta.willy(5), "close"),
+        (graph.node(ta.linreg, graph.CLOSE, length=5), lambda: ta.linreg(5), "close"),
+        (
+            graph.node(ta.mfi, graph.source("close_with_vol"), length=5),
+            lambda: ta.mfi(5),
+            "close_with_vol",
+        ),
+        (graph.atr_sl(), ta.atr_sl, "hlc"),
+        (graph.tsi(), ta.tsi, "close"),
+        (graph.bbwp(rank_length=50), lambda: ta.bbwp(rank_length=50), "close"),
+        (
+            graph.node(ta.sma, graph.CLOSE, length=5, resync_every=10),
+            lambda: ta.sma(5, resync_every=10),
+            "close",
+        ),
+    ],
+)
+def test_compiled_nodes_match_streaming(
+    get_default: list[Quote], output: graph.Node, factory: Any, source: str
+):
+    """Inlined and called nodes should match the streaming indicators."""
+    fn = compile_pipeline(output)
+    streamed = factory()
+
+    for q in get_default:
+        assert _same(fn.preview(q), streamed.preview(getattr(q, source)))
+        assert _same(fn(q), streamed(getattr(q, source)))
+
+
+class _Bar:
+    __slots__ = ("value",)
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+def test_compiled_nodes_handle_nan_like_streaming():
+    """NaN gaps should be handled the same way as the streaming versions."""
+    data = [1.0, 2.0, float("nan"), 4.0, 5.0, 6.0, 7.0, float("nan"), 9.0, 10.0]
+    value = graph.source("value")
+
+    for factory in [ta.sma, ta.ema, ta.rsi, ta.tci, ta.willy, ta.linreg]:
+        fn = compile_pipeline(graph.node(factory, value, length=3))
+        result = fn.update_many([_Bar(x) for x in data])
+
+        assert all(map(_same, result, factory(3).update_many(data)))
+
+
+@pytest.mark.parametrize("bar_type", [None, Quote])
+def test_compiled_preview_leaves_state(get_eur_usd_phx: list[Quote], bar_type):
+    """A preview should give the committed result and leave the state as is."""
+    phx = compile_pipeline(graph.phx(), bar_type)
+    streamed = ta.phx()
+
+    for q in get_eur_usd_phx:
+        phx.preview(get_eur_usd_phx[0])
+        preview = phx.preview(q)
+        assert _same(preview, phx(q))
+        assert _same(preview, streamed(q))
+
+
+def test_compiled_pipeline_survives_errors():
+    """A bar that raises should not stop the pipeline, as with streaming."""
+    value = graph.source("value")
+    fn = compile_pipeline(graph.node(ta.willy, value, length=2))
+    streamed = ta.willy(2)
+
+    assert _same(fn(_Bar(1.0)), streamed(1.0))
+    # the flat window divides by zero.
+    with pytest.raises(ZeroDivisionError):
+        fn.preview(_Bar(1.0))
+    with pytest.raises(ZeroDivisionError):
+        fn(_Bar(1.0))
+    with pytest.raises(ZeroDivisionError):
+        streamed(1.0)
+
+    assert fn.preview(_Bar(2.0)) == streamed.preview(2.0) == 80.0
+    assert fn(_Bar(2.0)) == streamed(2.0) == 80.0
+
+
+def test_compiled_quotes_use_public_prices():
+    """Quote bars should only be read through their public attributes."""
+    fn = compile_pipeline(graph.phx(), Quote)
+
+    assert "_bar._" not in fn.source
+
+
+def test_compiled_outputs_share_nodes(get_default: list[Quote]):
+    """A mapping of outputs should give a dict, computing shared nodes once."""
+    fn = compile_pipeline(
+        {
+            "sma": graph.node(ta.sma, graph.CLOSE, length=13),
+            "bbwp": graph.bbwp(length=13),
+        }
+    )
+    sma = ta.sma(13)
+    bbwp = ta.bbwp(length=13)
+
+    # read once in the commit code and once in the preview code.
+    assert fn.source.count("_bar.close") == 2
+    for q in get_default:
+        result = fn(q)
+        assert _same(result["sma"], sma(q.close))
+        assert _same(result["bbwp"], bbwp(q.close))
+
+
+@pytest.mark.parametrize(
+    "output, factory",
+    [(graph.phx(), ta.phx), (graph.tsi(), ta.tsi), (graph.bbwp(), ta.bbwp)],
+)
+def test_compiled_pipeline_settles_like_streaming(
+    get_default: list[Quote], output: graph.Node, factory: Any
+):
+    """A pipeline should warm up and seed like the matching indicator."""
+    fn = compile_pipeline(output)
+    streamed = factory()
+    source = (lambda q: q) if factory is ta.phx else (lambda q: q.close)
+
+    assert (fn.warmup, fn.convergence) == (streamed.warmup, streamed.convergence)
+    seeded = fn.seed(get_default)
+    expected = streamed.seed([source(q) for q in get_default])
+
+    assert len(seeded) == len(expected) == fn.warmup + fn.convergence
+    assert all(map(_same, seeded, expected))
+
+
+@pytest.mark.parametrize("split", [3, 100])
+@pytest.mark.parametrize("output", [graph.phx(), graph.bbwp(rank_length=50)])
+def test_compiled_pipeline_snapshots(
+    get_eur_usd_phx: list[Quote], output: graph.Node, split: int
+):
+    """A restored pipeline should continue exactly, inlined and called nodes."""
+    original = compile_pipeline(output)
+    original.update_many(get_eur_usd_phx[:split])
+
+    restored = restore(compile_pipeline(output), snapshot(original))
+
+    expected = original.update_many(get_eur_usd_phx[split:])
+    assert all(map(_same, restored.update_many(get_eur_usd_phx[split:]), expected))
+    with pytest.raises(ValueError):
+        restore(compile_pipeline(graph.bbwp(rank_length=40)), snapshot(original))
+
+
+def test_compiled_pipeline_runs_in_history_runner(get_eur_usd_phx: list[Quote]):
+    """A history of a pipeline should be correctable through its checkpoints."""
+    quotes = list(get_eur_usd_phx)
+    runner = HistoryRunner(compile_pipeline, every=50, outputs=graph.phx())
+    runner.extend(quotes)
+
+    quotes[120] = get_eur_usd_phx[0]
+    runner.correct(120, quotes[120])
+    expected = ta.phx().update_many(quotes)
+
+    assert all(map(_same, runner.results, expected))
@@ -0,0 +1,62 @@
+"""preview and commit tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from collections.abc import Callable
+from math import nan
+from typing import Any
+
+import pytest
+
+from pure_ta import Quote, snapshot, ta
+from tests.test_update_many import CASES, _same
+
+
+@pytest.mark.parametrize("factory, source", CASES)
+def test_preview_matches_commit_without_changing_state(
+    get_default: list[Quote],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+):
+    """Previewing a bar should give its committed result and change nothing."""
+    fn = factory()
+    twin = factory()
+    for q in get_default:
+        data = source(q)
+        state = snapshot(fn)
+        # a forming bar is revised a few times before it closes.
+        fn.preview(source(get_default[0]))
+        preview = fn.preview(data)
+
+        assert snapshot(fn) == state
+        assert _same(preview, fn.commit(data))
+        assert _same(preview, twin(data))
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        ta.sma,
+        ta.ema,
+        ta.rma,
+        ta.smma,
+        ta.rsi,
+        ta.wma,
+        ta.linreg,
+        ta.tci,
+        ta.alma,
+        ta.willy,
+        ta.std_dev,
+        ta.er,
+        ta.mom,
+        ta.kama,
+        ta.dema,
+        lambda length: ta.sma(length, resync_every=2),
+        lambda length: ta.wma(length, resync_every=2),
+    ],
+)
+def test_preview_handles_nan(factory: Callable[..., Any]):
+    """NaN bars should preview the same as they commit."""
+    fn = factory(3)
+    for value in [1.0, 2.0, nan, 4.0, 5.0, 6.0, 7.0, nan, 9.0, 10.0, 12.0, 11.0]:
+        assert _same(fn.preview(value), fn(value))
@@ -0,0 +1,39 @@
+"""quote tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from datetime import datetime
+from decimal import Decimal
+
+from pure_ta import DecimalQuote, Quote
+from pure_ta._enum_types import CandlePart
+from pure_ta._types import ErrMsg
+
+TIME = datetime(2023, 7, 1)
+
+
+def test_quote_prices_are_floats():
+    """Prices and derived prices should be plain floats."""
+    quote = Quote(time=TIME, o=1, h=4, l=1, c=2, v=10)
+    assert type(quote.open) is float
+    assert quote.hl2 == 2.5
+    assert quote.hlc3 == (4.0 + 1.0 + 2.0) / 3
+    assert quote.ohlc4 == 2.0
+    assert quote.hlc3 is quote.hlc3
+
+
+def test_quote_create_validates_prices():
+    """Create should return an ErrMsg for inconsistent prices."""
+    assert isinstance(Quote.create(TIME, 1, 3, 5, 2, 100), ErrMsg)
+    assert isinstance(Quote.create(TIME, 1, 1.5, 0.5, 2, 100), ErrMsg)
+    assert isinstance(DecimalQuote.create(TIME, 1, 3, 0.5, 2, 100), DecimalQuote)
+
+
+def test_decimal_quote_uses_decimal_arithmetic():
+    """A DecimalQuote should derive prices from its exact decimal values."""
+    quote = DecimalQuote(time=TIME, o=0.1, h=0.3, l=0.1, c=0.2, v=1)
+    assert quote.decimals[0] == Decimal(0.1)
+    assert quote.hlc3 == float((Decimal(0.3) + Decimal(0.1) + Decimal(0.2)) / 3)
+    price_data = quote.to_price_data(CandlePart.HLC3)
+    assert price_data.value == quote.hlc3
+    assert price_data.time_stamp == TIME.isoformat()
@@ -0,0 +1,86 @@
+"""quote series tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pure_ta import Quote, QuoteSeries, ta
+from pure_ta._enum_types import CandlePart
+from tests.conftest import get_longish
+
+
+def test_quote_series_has_every_bar(get_longish_series: QuoteSeries):
+    """The series should hold every bar of the file."""
+    assert len(get_longish_series) == 5285
+    assert len(get_longish_series.close) == 5285
+
+
+def test_quote_series_matches_quotes(get_longish_series: QuoteSeries):
+    """Bars read through views should match the parsed quotes."""
+    # sourcery skip: no-loop-in-tests
+    for quote, view in zip(get_longish(), get_longish_series):
+        assert view.time == quote.time
+        assert view.close == quote.close
+        assert view.hlc3 == quote.hlc3
+        assert view.hlc3_with_vol == quote.hlc3_with_vol
+
+
+def test_quote_series_slices_share_columns(get_longish_series: QuoteSeries):
+    """Slices should be views of the same columns, not copies."""
+    window = get_longish_series[100:110]
+    assert len(window) == 10
+    assert window[0].close == get_longish_series[100].close
+    assert window[-1].close == get_longish_series[109].close
+    assert window.close.obj is get_longish_series.close.obj
+    assert list(window[2:4].close) == list(get_longish_series.close[102:104])
+
+
+def test_quote_series_candle_parts(get_longish_series: QuoteSeries):
+    """Derived candle parts should match the per-bar values."""
+    window = get_longish_series[:50]
+    hlc3 = window.candle_part(CandlePart.HLC3)
+    assert list(hlc3) == [bar.hlc3 for bar in window]
+
+
+def test_quote_series_feeds_indicators(get_longish_series: QuoteSeries):
+    """Views should work anywhere a quote is expected."""
+    atr = ta.atr()
+    sma = ta.sma()
+    window = get_longish_series[:100]
+    atr_results = [atr(bar) for bar in window]
+    sma_results = [sma(close) for close in window.close]
+    assert len(atr_results) == len(sma_results) == 100
+
+
+def test_quote_series_append():
+    """Appending should grow the series, but not a slice of it."""
+    series = QuoteSeries.from_quotes(get_longish(days=3))
+    bar = series[0].to_quote()
+    series.append(bar.time, bar.open, bar.high, bar.low, bar.close, bar.vol)
+    assert len(series) == 4
+    assert series[-1].close == bar.close
+
+    with pytest.raises(ValueError):
+        series[1:].append(bar.time, bar.open, bar.high, bar.low, bar.close, bar.vol)
+
+
+def test_quote_series_keeps_exact_times():
+    """Aware, sub-second and extreme times should read back unchanged."""
+    times = [
+        datetime(2023, 7, 1, 12, 30, tzinfo=timezone.utc),
+        datetime(2023, 7, 1, 8, 30, 15, 250000, tzinfo=timezone(timedelta(hours=-4))),
+        datetime(2023, 7, 1, 12, 30, 0, 123456),
+        datetime.min,
+    ]
+    series = QuoteSeries()
+    # sourcery skip: no-loop-in-tests
+    for time in times:
+        series.append(time, 1.0, 2.0, 0.5, 1.5, 10.0)
+    series.append(Quote.empty().time, 1.0, 1.0, 1.0, 1.0, 0.0)
+
+    assert [bar.time for bar in series] == [*times, Quote.empty().time]
+    assert [bar.time.tzinfo for bar in series[:2]] == [t.tzinfo for t in times[:2]]
+    assert series[0].time_stamp == "2023-07-01T12:30:00+00:00"
+    assert series[1:3][0].time == times[1]
@@ -3,7 +3,7 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from math import isclose
+from math import isclose, isnan, nan
 
 from pure_ta import Quote, ta
 
@@ -30,3 +30,12 @@ def test_rma_returns_correct_values_for_eth_rma(get_eth_rma: list[Quote]):
     assert abs(results[271] - 1642.014873) <= 0.000002
     assert round(results[452], 6) == 1568.421575
     assert round(results[488], 5) == 1879.23033
+
+
+def test_rma_seed_needs_consecutive_values():
+    """A NaN during warm-up should restart the seeding SMA."""
+    rma = ta.rma(length=2)
+    results = [rma(v) for v in [1.0, nan, 2.0, 4.0, 6.0]]
+    assert all(isnan(r) for r in results[:3])
+    assert results[3] == 3.0
+    assert results[4] == 4.5
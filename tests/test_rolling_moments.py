@@ -0,0 +1,41 @@
+"""rolling moments tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import random
+import statistics
+from math import isclose, isnan, nan
+
+from pure_ta import StDevOf
+from pure_ta._rolling_moments import RollingMoments
+
+
+def test_rolling_moments_match_statistics():
+    """The windowed Welford step should match recomputing every window."""
+    rng = random.Random(3)
+    size = 8
+    data = [rng.uniform(100, 110) for _ in range(300)]
+    moments = RollingMoments(size=size)
+    # sourcery skip: no-loop-in-tests
+    for i, val in enumerate(data):
+        moments.put(val)
+        # sourcery skip: no-conditionals-in-tests
+        if i >= size - 1:
+            window = data[i - size + 1 : i + 1]
+            assert isclose(moments.mean(), statistics.fmean(window))
+            assert isclose(moments.st_dev(), statistics.pstdev(window))
+            assert isclose(moments.st_dev(StDevOf.SAMPLE), statistics.stdev(window))
+
+
+def test_rolling_moments_recover_after_nan():
+    """Moments should be NaN while a NaN is in the window, then recover."""
+    moments = RollingMoments(size=3)
+    results = []
+    # sourcery skip: no-loop-in-tests
+    for val in [1.0, nan, 3.0, 4.0, 5.0, 6.0]:
+        moments.put(val)
+        results.append(moments.mean())
+
+    assert all(isnan(r) for r in results[:4])
+    assert results[4:] == [4.0, 5.0]
+    assert isclose(moments.z_score(7.0), 6**0.5)
@@ -0,0 +1,39 @@
+"""rolling sum tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import math
+
+from pure_ta._rolling_sum import RollingSum
+
+
+def test_rolling_sum_evicts_oldest_value():
+    """The sum should only cover the last `size` values."""
+    window = RollingSum(size=3)
+    # sourcery skip: no-loop-in-tests
+    for val in [1.0, 2.0, 3.0, 4.0]:
+        window.put(val)
+
+    assert window.is_full is True
+    assert window.total == 9.0
+    assert window.mean() == 3.0
+
+
+def test_rolling_sum_compensates_cancellation():
+    """Large values entering and leaving should not leave residue behind."""
+    window = RollingSum(size=2)
+    # sourcery skip: no-loop-in-tests
+    for val in [1e16, 1.0, -1e16, 1.0, 1.0]:
+        window.put(val)
+
+    assert window.total == 2.0
+
+
+def test_rolling_sum_resync():
+    """Resyncing should recompute the exact sum of the window."""
+    window = RollingSum(size=3, resync_every=2)
+    # sourcery skip: no-loop-in-tests
+    for val in [0.1] * 10:
+        window.put(val)
+
+    assert window.total == math.fsum([0.1, 0.1, 0.1])
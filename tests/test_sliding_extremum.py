@@ -0,0 +1,75 @@
+"""sliding extremum tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import random
+from math import isnan
+
+from pure_ta import SlidingMax, SlidingMin
+
+
+def test_sliding_extremum_is_nan_until_full():
+    """The extremum should be NaN until the window is full."""
+    highest = SlidingMax(size=3)
+    lowest = SlidingMin(size=3)
+    # sourcery skip: no-loop-in-tests
+    for val in [1.0, 2.0]:
+        highest.put(val)
+        lowest.put(val)
+
+    assert highest.is_full is False
+    assert isnan(highest.value)
+    assert isnan(lowest.value)
+
+
+def test_sliding_extremum_matches_window_scan():
+    """The extremum should match scanning the whole window."""
+    rng = random.Random(7)
+    size = 5
+    data = [rng.uniform(-10, 10) for _ in range(500)] + [1.0] * 10
+    highest = SlidingMax(size=size)
+    lowest = SlidingMin(size=size)
+    # sourcery skip: no-loop-in-tests
+    for i, val in enumerate(data):
+        highest.put(val)
+        lowest.put(val)
+        # sourcery skip: no-conditionals-in-tests
+        if i >= size - 1:
+            assert highest.value == max(data[i - size + 1 : i + 1])
+            assert lowest.value == min(data[i - size + 1 : i + 1])
+
+
+def test_sliding_extremum_skips_nan():
+    """NaN values should be skipped and reported until they leave the window."""
+    highest = SlidingMax(size=3)
+    lowest = SlidingMin(size=3)
+    # sourcery skip: no-loop-in-tests
+    for val in [1.0, float("nan"), 5.0]:
+        highest.put(val)
+        lowest.put(val)
+
+    assert highest.value == 5.0
+    assert lowest.value == 1.0
+    assert highest.has_nan
+
+    highest.put(2.0)
+    highest.put(3.0)
+    assert highest.value == 5.0
+    highest.put(1.0)
+    assert highest.value == 3.0
+    assert not highest.has_nan
+
+
+def test_sliding_extremum_preview_matches_put():
+    """A preview should give the extremum after a put, without putting it."""
+    rng = random.Random(11)
+    data = [rng.choice([rng.uniform(-10, 10), 0.0, float("nan")]) for _ in range(300)]
+    highest = SlidingMax(size=4)
+    lowest = SlidingMin(size=4)
+    # sourcery skip: no-loop-in-tests
+    for val in data:
+        preview = highest.preview(val), lowest.preview(val)
+        highest.put(val)
+        lowest.put(val)
+        for previewed, value in zip(preview, (highest.value, lowest.value)):
+            assert previewed == value or (isnan(previewed) and isnan(value))
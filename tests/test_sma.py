@@ -56,3 +56,25 @@ def test_volume_tests(get_default: list[Quote]):
     assert round(results[24], 1) == 77293768.2
     assert round(results[290], 1) == 157958070.8
     assert round(results[501], 0) == 163695200
+
+
+def test_sma_with_resync_matches(get_default: list[Quote]):
+    """Resyncing the running sum should not change the results."""
+    sma = ta.sma()
+    resynced = ta.sma(resync_every=7)
+    results = [sma(q.close) for q in get_default]
+    resynced_results = [resynced(q.close) for q in get_default]
+    assert all(math.isnan(r) for r in resynced_results[:19])
+    assert all(
+        math.isclose(a, b, rel_tol=1e-12)
+        for a, b in zip(results[19:], resynced_results[19:])
+    )
+
+
+def test_sma_is_nan_while_window_holds_nan():
+    """A NaN input should only affect the windows that contain it."""
+    sma = ta.sma(length=3)
+    results = [sma(v) for v in [1.0, 2.0, math.nan, 4.0, 5.0, 6.0, 7.0]]
+    assert all(math.isnan(r) for r in results[:5])
+    assert results[5] == 5.0
+    assert results[6] == 6.0
@@ -3,7 +3,7 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from math import isnan
+from math import isnan, nan
 
 from pure_ta import Quote, ta
 
@@ -41,3 +41,13 @@ def test_smma_correct_calculation_results(get_default: list[Quote]):
     assert round(results[21], 4) == 214.5832
     assert round(results[100], 4) == 225.7807
     assert round(results[501], 4) == 255.6746
+
+
+def test_smma_reseeds_after_nan():
+    """A NaN should make the smma reseed from the next `length` values."""
+    smma = ta.smma(length=2)
+    results = [smma(v) for v in [1.0, 3.0, nan, 5.0, 7.0, 9.0]]
+    assert results[1] == 2.0
+    assert all(isnan(r) for r in results[2:4])
+    assert results[4] == 6.0
+    assert results[5] == 7.5
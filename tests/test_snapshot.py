@@ -0,0 +1,91 @@
+"""indicator snapshot tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from collections.abc import Callable
+from math import isnan
+from typing import Any
+
+import pytest
+
+from pure_ta import Quote, restore, snapshot, ta
+from pure_ta._snapshot import SNAPSHOT_VERSION
+from tests.test_update_many import CASES
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, float):
+        return a == b or (isnan(a) and isnan(b))
+    return repr(a) == repr(b)
+
+
+@pytest.mark.parametrize("split", [0, 3, 250])
+@pytest.mark.parametrize("factory, source", CASES)
+def test_restored_indicator_continues_exactly(
+    get_default: list[Quote],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+    split: int,
+):
+    """A restored indicator should continue as if it had seen every bar."""
+    data = [source(q) for q in get_default]
+    original = factory()
+    original.update_many(data[:split])
+
+    restored = restore(factory(), snapshot(original))
+
+    assert _same(restored(data[split]), original(data[split]))
+    expected = original.update_many(data[split + 1 :])
+    result = restored.update_many(data[split + 1 :])
+    assert all(map(_same, result, expected))
+
+
+def test_snapshot_does_not_share_state():
+    """Restoring should copy the state, leaving the original untouched."""
+    original = ta.sma(3)
+    original.update_many([1.0, 2.0, 3.0])
+    restored = restore(ta.sma(3), snapshot(original))
+
+    assert restored(4.0) == 3.0
+    assert original(10.0) == 5.0
+
+
+def test_restore_rejects_other_indicators():
+    """A snapshot should only load into an indicator of the same kind."""
+    blob = snapshot(ta.sma(5))
+
+    with pytest.raises(ValueError):
+        restore(ta.ema(5), blob)
+    with pytest.raises(ValueError):
+        restore(ta.sma(6), blob)
+
+
+@pytest.mark.parametrize(
+    "factory, other",
+    [
+        (lambda: ta.ema(20), lambda: ta.ema(10)),
+        (lambda: ta.willy(6), lambda: ta.willy(5)),
+        (lambda: ta.bb(multi=2), lambda: ta.bb(multi=3)),
+    ],
+)
+def test_restore_rejects_other_parameters(
+    factory: Callable[[], Any], other: Callable[[], Any]
+):
+    """A snapshot should not overwrite the parameters of another indicator."""
+    original = factory()
+    original.update_many([1.0, 2.0, 3.0])
+    blob = snapshot(original)
+
+    with pytest.raises(ValueError):
+        restore(other(), blob)
+    assert _same(restore(factory(), blob)(4.0), original(4.0))
+
+
+def test_restore_rejects_bad_blobs():
+    """Foreign bytes and unknown versions should be rejected."""
+    blob = snapshot(ta.ema())
+
+    with pytest.raises(ValueError):
+        restore(ta.ema(), b"not a snapshot")
+    with pytest.raises(ValueError, match="version"):
+        restore(ta.ema(), blob[:4] + bytes([SNAPSHOT_VERSION + 1]) + blob[5:])
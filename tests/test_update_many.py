@@ -0,0 +1,96 @@
+"""batch update tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from array import array
+from collections.abc import Callable
+from math import isnan
+from typing import Any
+
+import pytest
+
+from pure_ta import AtrSlMaType, Quote, ta
+
+# (factory, how each quote is fed to the indicator)
+CASES: list[tuple[Callable[[], Any], Callable[[Quote], Any]]] = [
+    (ta.sma, lambda q: q.close),
+    (lambda: ta.sma(length=5, resync_every=3), lambda q: q.close),
+    (ta.ema, lambda q: q.close),
+    (ta.alma, lambda q: q.close),
+    (ta.rma, lambda q: q.close),
+    (ta.atr, lambda q: q.hlc),
+    (ta.wma, lambda q: q.close),
+    (ta.tr, lambda q: q.hlc),
+    (ta.atr_sl, lambda q: q.hlc),
+    (lambda: ta.atr_sl(ma_type=AtrSlMaType.WMA), lambda q: q.hlc),
+    (ta.std_dev, lambda q: q.close),
+    (ta.bb, lambda q: q.close),
+    (ta.bbw, lambda q: q.close),
+    (ta.percent_rank, lambda q: q.close),
+    (lambda: ta.bbwp(rank_length=50), lambda q: q.close),
+    (ta.dema, lambda q: q.close),
+    (ta.er, lambda q: q.close),
+    (ta.hma, lambda q: q.close),
+    (ta.kama, lambda q: q.close),
+    (ta.linreg, lambda q: q.close),
+    (ta.mfi, lambda q: q.hlc3_with_vol),
+    (ta.mom, lambda q: q.close),
+    (ta.rsi, lambda q: q.close),
+    (ta.swma, lambda q: q.close),
+    (ta.smma, lambda q: q.close),
+    (ta.tci, lambda q: q.close),
+    (ta.tema, lambda q: q.close),
+    (ta.tsi, lambda q: q.close),
+    (ta.vwma, lambda q: q.close_with_vol),
+    (ta.willy, lambda q: q.close),
+    (ta.wpr, lambda q: q.hlc),
+    (ta.phx, lambda q: q),
+]
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, float):
+        return a == b or (isnan(a) and isnan(b))
+    return repr(a) == repr(b)
+
+
+@pytest.mark.parametrize("factory, source", CASES)
+def test_update_many_matches_streaming(
+    get_default: list[Quote],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+):
+    """A batch should return exactly what streaming the values returns."""
+    data = [source(q) for q in get_default]
+    streamed = factory()
+    expected = [streamed(d) for d in data]
+    results = factory().update_many(data)
+
+    assert len(results) == len(expected)
+    assert all(_same(a, b) for a, b in zip(results, expected))
+
+
+@pytest.mark.parametrize("factory, source", CASES)
+def test_update_many_keeps_streaming_state(
+    get_default: list[Quote],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+):
+    """Batch-warming then streaming should match streaming throughout."""
+    data = [source(q) for q in get_default]
+    streamed = factory()
+    expected = [streamed(d) for d in data]
+    batched = factory()
+    results = list(batched.update_many(iter(data[:300])))
+    results += [batched(d) for d in data[300:400]]
+    results += list(batched.update_many(data[400:]))
+
+    assert all(_same(a, b) for a, b in zip(results, expected))
+
+
+def test_update_many_returns_float_array(get_default: list[Quote]):
+    """Indicators with float results should return an array of doubles."""
+    results = ta.sma().update_many(q.close for q in get_default)
+    assert isinstance(results, array)
+    assert results.typecode == "d"
+    assert len(results) == 502
@@ -0,0 +1,167 @@
+"""vectorized backend tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pure_ta import Hlc, Quote, StDevOf, ta
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("pure_ta.vectorized")
+
+FIXTURES = ["get_default", "get_eth_rma", "get_gold_willy", "get_gold_lin_reg"]
+
+
+def _closes(quotes: list[Quote]) -> Any:
+    return np.array([q.close for q in quotes])
+
+
+def _volumes(quotes: list[Quote]) -> Any:
+    return np.array([q.vol for q in quotes])
+
+
+def _hlc3(quotes: list[Quote]) -> Any:
+    return np.array([q.hlc3 for q in quotes])
+
+
+# (vectorized call, streaming factory, how each quote is fed to it)
+CASES: list[tuple[Callable[[list[Quote]], Any], Callable[[], Any], Any]] = [
+    (lambda qs: vectorized.sma(_closes(qs)), ta.sma, lambda q: q.close),
+    (lambda qs: vectorized.wma(_closes(qs)), ta.wma, lambda q: q.close),
+    (lambda qs: vectorized.std_dev(_closes(qs)), ta.std_dev, lambda q: q.close),
+    (
+        lambda qs: vectorized.std_dev(_closes(qs), 10, StDevOf.SAMPLE),
+        lambda: ta.std_dev(10, StDevOf.SAMPLE),
+        lambda q: q.close,
+    ),
+    (lambda qs: vectorized.linreg(_closes(qs)), ta.linreg, lambda q: q.close),
+    (
+        lambda qs: vectorized.mfi(_hlc3(qs), _volumes(qs)),
+        ta.mfi,
+        lambda q: q.hlc3_with_vol,
+    ),
+    (
+        lambda qs: vectorized.vwma(_closes(qs), _volumes(qs)),
+        ta.vwma,
+        lambda q: q.close_with_vol,
+    ),
+    (lambda qs: vectorized.willy(_closes(qs)), ta.willy, lambda q: q.close),
+    (
+        lambda qs: vectorized.wpr(
+            [q.high for q in qs], [q.low for q in qs], _closes(qs)
+        ),
+        ta.wpr,
+        lambda q: q.hlc,
+    ),
+    (lambda qs: vectorized.ema(_closes(qs)), ta.ema, lambda q: q.close),
+    (lambda qs: vectorized.rma(_closes(qs)), ta.rma, lambda q: q.close),
+    (lambda qs: vectorized.smma(_closes(qs)), ta.smma, lambda q: q.close),
+    (lambda qs: vectorized.dema(_closes(qs)), ta.dema, lambda q: q.close),
+    (lambda qs: vectorized.tema(_closes(qs)), ta.tema, lambda q: q.close),
+]
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+@pytest.mark.parametrize("compute, factory, source", CASES)
+def test_vectorized_matches_streaming(
+    request: pytest.FixtureRequest,
+    fixture: str,
+    compute: Callable[[list[Quote]], Any],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+):
+    """Whole-series results should match the streaming indicator."""
+    quotes = request.getfixturevalue(fixture)
+    streamed = factory()
+    expected = [streamed(source(q)) for q in quotes]
+
+    np.testing.assert_allclose(compute(quotes), expected, rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_vectorized_bb_matches_streaming(request: pytest.FixtureRequest, fixture):
+    """Each band should match the streaming Bollinger Bands."""
+    quotes = request.getfixturevalue(fixture)
+    bb = ta.bb()
+    expected = [bb(q.close) for q in quotes]
+    result = vectorized.bb(_closes(quotes))
+
+    for band in ("upper", "middle", "lower"):
+        np.testing.assert_allclose(
+            getattr(result, band),
+            [getattr(r, band) for r in expected],
+            rtol=1e-9,
+            equal_nan=True,
+        )
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_vectorized_tsi_matches_streaming(request: pytest.FixtureRequest, fixture):
+    """The TSI and its signal line should match the streaming TSI."""
+    quotes = request.getfixturevalue(fixture)
+    tsi = ta.tsi()
+    expected = [tsi(q.close) for q in quotes]
+    result = vectorized.tsi(_closes(quotes))
+
+    np.testing.assert_allclose(
+        result.tsi, [r.tsi for r in expected], rtol=1e-9, equal_nan=True
+    )
+    np.testing.assert_allclose(
+        result.signal, [r.signal for r in expected], rtol=1e-9, equal_nan=True
+    )
+
+
+def test_vectorized_handles_nan_like_streaming():
+    """NaN gaps should be handled the same way as the streaming versions."""
+    data = [1.0, 2.0, float("nan"), 4.0, 5.0, 6.0, 7.0, float("nan"), 9.0, 10.0]
+
+    for compute, factory in [
+        (vectorized.sma, ta.sma),
+        (vectorized.ema, ta.ema),
+        (vectorized.rma, ta.rma),
+        (vectorized.smma, ta.smma),
+        (vectorized.linreg, ta.linreg),
+        (vectorized.willy, ta.willy),
+    ]:
+        np.testing.assert_allclose(
+            compute(data, 3), factory(3).update_many(data), equal_nan=True
+        )
+
+    wpr = ta.wpr(3).update_many([Hlc(x + 1, x - 1, x) for x in data])
+    np.testing.assert_allclose(
+        vectorized.wpr(np.add(data, 1), np.subtract(data, 1), data, 3),
+        wpr,
+        equal_nan=True,
+    )
+
+
+def test_vectorized_short_series_is_all_nan():
+    """A series shorter than the window should give only NaN."""
+    result = vectorized.sma([1.0, 2.0], 5)
+
+    assert len(result) == 2
+    assert np.isnan(result).all()
+
+
+def test_recursive_fallback_matches_loop(monkeypatch: pytest.MonkeyPatch):
+    """Without numba the recursive family should use the streaming kernels."""
+    monkeypatch.setattr(vectorized, "njit", None)
+    data = np.array([1.0, 3.0, float("nan"), 2.0, 5.0, 4.0, 6.0, 8.0, 7.0])
+
+    for loop, factory in [
+        (vectorized._ema_loop, ta.ema),
+        (vectorized._rma_loop, ta.rma),
+        (vectorized._smma_loop, ta.smma),
+    ]:
+        kernel = vectorized._recursive(loop, factory)
+
+        np.testing.assert_array_equal(kernel(data, 3), loop(data, 3))
+
+
+def test_vectorized_validates_length():
+    """A zero length should be rejected."""
+    with pytest.raises(ValueError):
+        vectorized.sma([1.0, 2.0], 0)
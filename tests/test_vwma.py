@@ -5,7 +5,7 @@
 
 from math import isnan
 
-from pure_ta import Quote, ta
+from pure_ta import PriceDataWithVol, Quote, ta
 
 # expected results.
 # https://docs.google.com/spreadsheets/d/1FhE3RHgoEguLQgZN48trNTmL1i-7aifQitNO7tBxmOs/edit?usp=sharing
@@ -46,3 +46,11 @@ def test_vwma_correct_calculation_results(get_default: list[Quote]):
     assert round(result99, 6) == 226.302760
     assert round(result249, 6) == 257.053654
     assert round(result501, 6) == 242.101548
+
+
+def test_vwma_is_nan_without_volume():
+    """A window without any volume should not divide by zero."""
+    vwma = ta.vwma(length=2)
+    data = [PriceDataWithVol(time_stamp="", value=v, volume=0.0) for v in [1, 2, 3]]
+    results = [vwma(d) for d in data]
+    assert all(isnan(r) for r in results)
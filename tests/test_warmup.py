@@ -0,0 +1,85 @@
+"""warm-up metadata and seeding tests."""
+# Copyright 2023 Takin Profit. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+from collections.abc import Callable
+from math import isnan
+from typing import Any
+
+import pytest
+
+from pure_ta import Quote, ta
+from pure_ta._indicator import decay_bars
+from tests.test_update_many import CASES
+
+
+def _values(result: Any) -> list[float]:
+    if isinstance(result, float):
+        return [result]
+    return [getattr(result, field) for field in result.__slots__]
+
+
+@pytest.mark.parametrize("factory, source", CASES)
+def test_results_are_valid_after_warmup(
+    get_default: list[Quote],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+):
+    """The result at the warm-up bar should never be NaN."""
+    fn = factory()
+    results = fn.update_many([source(q) for q in get_default])
+
+    assert not any(map(isnan, _values(results[fn.warmup - 1])))
+
+
+@pytest.mark.parametrize("factory, source", CASES)
+def test_seeded_indicator_continues_like_full_history(
+    get_default: list[Quote],
+    factory: Callable[[], Any],
+    source: Callable[[Quote], Any],
+):
+    """Seeding with the needed tail should match an indicator fed everything."""
+    data = [source(q) for q in get_default]
+    history, live = data[:-50], data[-50:]
+    full = factory()
+    full.update_many(history)
+    seeded = factory()
+
+    assert len(seeded.seed(history)) == min(
+        len(history), seeded.warmup + seeded.convergence
+    )
+    rel = 1e-9 if seeded.convergence == 0 else 1e-5
+    for expected, result in zip(full.update_many(live), seeded.update_many(live)):
+        assert _values(result) == pytest.approx(_values(expected), rel=rel, abs=rel)
+
+
+@pytest.mark.parametrize(
+    "fn, warmup",
+    [
+        (ta.sma(20), 20),
+        (ta.hma(200), 200 + 14 - 1),
+        (ta.bbwp(13, 252), 13 + 252),
+        (ta.dema(10), 19),
+        (ta.phx(), 46),
+    ],
+)
+def test_composite_warmups(fn: Any, warmup: int):
+    """Composite indicators should add up the warm-ups of their parts."""
+    assert fn.warmup == warmup
+
+
+def test_convergence_follows_the_smoothing():
+    """Slower smoothing should need more bars to forget its seed."""
+    assert ta.sma(20).convergence == 0
+    assert ta.ema(20).convergence == decay_bars(2 / 21)
+    assert ta.ema(50).convergence > ta.ema(20).convergence
+    assert ta.dema(20).convergence == 2 * ta.ema(20).convergence
+
+
+def test_seed_with_short_history_uses_all_of_it():
+    """A history shorter than the warm-up should be consumed entirely."""
+    fn = ta.sma(5)
+
+    assert len(fn.seed([1.0, 2.0, 3.0])) == 3
+    assert isnan(fn(4.0))
+    assert fn(5.0) == 3.0
@@ -44,3 +44,12 @@ def test_willy_returns_correct_calculation_results(get_gold_willy: list[Quote]):
     assert round(results[731], 6) == 21.756124
 
     assert round(results[972], 8) == 69.90551288
+
+
+def test_willy_skips_nan_in_window():
+    """A NaN in the window should not hide the high and low around it."""
+    willy = ta.willy(3)
+    results = [willy(val) for val in [1.0, float("nan"), 5.0, 2.0, 3.0]]
+
+    assert isnan(results[1])
+    assert results[2:] == [80.0, 20.0, 40.0]
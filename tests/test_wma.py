@@ -3,7 +3,7 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from math import isnan
+from math import isclose, isnan, nan
 
 from pure_ta import Quote, ta
 
@@ -36,3 +36,29 @@ def test_wma_returns_correct_calculation_results(get_default: list[Quote]):
     # toPrecision(4) in Dart equals round with 3 decimal places in Python
     assert round(result149, 4) == 235.5253
     assert round(result501, 3) == 246.511
+
+
+def test_wma_matches_full_recalculation(get_default: list[Quote]):
+    """The running sums should match weighting the whole window every bar."""
+    length = 20
+    wma = ta.wma(length=length)
+    resynced = ta.wma(length=length, resync_every=5)
+    closes = [q.close for q in get_default]
+    divisor = length * (length + 1) / 2
+    # sourcery skip: no-loop-in-tests
+    for i, close in enumerate(closes):
+        result = wma(close)
+        assert isclose(result, resynced(close), rel_tol=1e-12) or isnan(result)
+        if i >= length - 1:
+            window = closes[i - length + 1 : i + 1]
+            expected = sum(v * (j + 1) for j, v in enumerate(window)) / divisor
+            assert isclose(result, expected, rel_tol=1e-12)
+
+
+def test_wma_is_nan_while_window_holds_nan():
+    """A NaN input should only affect the windows that contain it."""
+    wma = ta.wma(length=2)
+    results = [wma(v) for v in [1.0, nan, 3.0, 4.0, 5.0]]
+    assert all(isnan(r) for r in results[:3])
+    assert isclose(results[3], (3.0 + 4.0 * 2) / 3)
+    assert isclose(results[4], (4.0 + 5.0 * 2) / 3)
@@ -7,7 +7,7 @@ from math import isnan
 
 import pytest
 
-from pure_ta import Quote, ta
+from pure_ta import Hlc, Quote, ta
 
 # expected results.
 # https://docs.google.com/spreadsheets/d/10IKwaJybZHl1xNVBM72QHvIhA8ihjy7wUry9riQLHBw/edit?usp=sharing
@@ -47,3 +47,13 @@ def test_wpr_throws_exception_with_too_small_lookback(get_default: list[Quote]):
     with pytest.raises(ValueError):
         wpr = ta.wpr(length=0)
         [wpr(q.hlc) for q in get_default]
+
+
+def test_wpr_skips_nan_in_window():
+    """A NaN high or low should not hide the range around it."""
+    nan = float("nan")
+    wpr = ta.wpr(3)
+    bars = [Hlc(2.0, 1.0, 1.5), Hlc(nan, nan, nan), Hlc(5.0, 4.0, 4.5)]
+    results = [wpr(bar) for bar in bars]
+
+    assert results[2] == -100 * (5.0 - 4.5) / (5.0 - 1.0)